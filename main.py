@@ -1,3 +1,4 @@
+from ml.predict_client import INTERVAL_LABELS, PredictionClient, print_prediction
 from services.BinanceService import BinanceService
 from utils.Indicators import (
     calculate_sma, calculate_ema, calculate_rsi,
@@ -16,8 +17,9 @@ def run_full_analysis(symbol: str, timeframe: str):
     print(f"현재가 (Binance): {float(price_info.price):.2f} USD")
     print("------")
 
-    # 과거 가격 데이터
-    prices = binance.fetch_historical_prices(symbol, 400, timeframe)
+    # 과거 캔들 데이터 (한 번만 요청하고 가격/거래량/캔들 뷰로 나눠 쓴다)
+    series = binance.fetch_candle_series(symbol, 400, timeframe)
+    prices = series.prices()
     print("SMA:")
     for p in [7, 15, 50, 200, 400]:
         sma = calculate_sma(prices, p)
@@ -38,7 +40,7 @@ def run_full_analysis(symbol: str, timeframe: str):
 
     print("------")
     print("VWAP:")
-    price_volume = binance.fetch_historical_price_volume(symbol, 400, timeframe)
+    price_volume = series.price_volume()
     vwap = calculate_vwap(price_volume)
     if vwap != -1:
         position = "매수 우위" if float(price_info.price) > vwap else "매도 우위"
@@ -48,7 +50,7 @@ def run_full_analysis(symbol: str, timeframe: str):
 
     print("------")
     print("ATR & OBV:")
-    candles = binance.fetch_historical_candle_data(symbol, 100, timeframe)
+    candles = series.tail(100).to_candles()
     atr = calculate_atr(candles, 14)
     obv = calculate_obv(candles)
     print(f" - ATR (14): {atr:.2f} (📌 변동성 지표, 수치가 클수록 가격 출렁임 ↑)" if atr != -1 else " - ATR: N/A")
@@ -64,18 +66,42 @@ def run_full_analysis(symbol: str, timeframe: str):
     print("==========================")
 
 
+def run_ml_prediction(symbol: str):
+    # 예측 서버(ml/predict_server.py)에 올라가 있는 모델로 타임프레임별 다음 봉을 예측한다
+    client = PredictionClient()
+    try:
+        if not client.available():
+            print(f"❌ 예측 서버가 실행 중이 아닙니다. 먼저 실행해주세요: python ml/predict_server.py {symbol}")
+            return
+
+        print(f"\n🔮 ML 예측: {symbol}")
+        print("==========================")
+        for interval, label in INTERVAL_LABELS.items():
+            try:
+                print_prediction(client.predict(symbol, interval))
+            except Exception as e:
+                print(f"❌ {label} 예측 실패: {e}")
+        print("==========================")
+    finally:
+        client.close()
+
+
 def main():
     while True:
         print("\n===== 메뉴 =====")
         print("1. 분석 실행")
-        print("2. 종료")
-        choice = input("입력 (1~2): ").strip()
+        print("2. ML 예측 (예측 서버)")
+        print("3. 종료")
+        choice = input("입력 (1~3): ").strip()
 
         if choice == "1":
             symbol = input("📥 심볼 입력 (예: BTC): ").strip().upper()
             timeframe = input("⏱️ 봉 구간 (15m / 1h / 4h / 1d): ").strip()
             run_full_analysis(symbol, timeframe)
-        elif choice == "2" or choice.lower() == "exit":
+        elif choice == "2":
+            symbol = input("📥 심볼 입력 (예: BTC): ").strip().upper()
+            run_ml_prediction(symbol)
+        elif choice == "3" or choice.lower() == "exit":
             print("👋 종료합니다.")
             break
         else:
@@ -0,0 +1,105 @@
+"""
+bench_multi.py
+⏱️ 타임프레임별 모델 4개 vs 멀티 타임프레임 모델 1개 벤치마크 (CPU)
+
+- 입력: 심볼 (예: python ml/bench_multi.py BTC --epochs 5 --runs 100)
+- 처리: 같은 피처로 두 구성을 고정 에폭 학습 (조기 종료 없음)
+        → 학습 시간, 임시 디렉터리에 저장한 모델의 로드 시간, 네 타임프레임 예측 지연 (p50 / p95),
+           타임프레임별 검증 MSE 를 비교
+        4개 구성은 build_multi_model 에 타임프레임 하나만 넘긴 모델 (train_15m/1h/4h/1d.py 와 같은 구조)
+- 출력: 콘솔 표
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from features import FEATURE_COLUMNS, load_features
+from inference import scale_windows
+from multi_timeframe import (
+    INTERVALS, SEQUENCE_LENGTH, build_multi_model, head_name, input_name, make_multi_datasets
+)
+
+def _timed(fn) -> tuple[object, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+def _latency(fn, runs: int, warmup: int = 5) -> tuple[float, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return float(np.percentile(samples, 50)), float(np.percentile(samples, 95))
+
+def _val_mse(model, val_ds, intervals: list[str]) -> dict[str, float]:
+    losses = model.evaluate(val_ds, verbose=0, return_dict=True)
+    if len(intervals) == 1:
+        return {intervals[0]: float(losses["loss"])}
+    return {iv: float(losses[f"{head_name(iv)}_loss"]) for iv in intervals}
+
+def run_benchmark(features: dict[str, np.ndarray], epochs: int, runs: int) -> list[dict]:
+    from tensorflow.keras.models import load_model
+
+    # 예측 입력: 타임프레임별 최근 창 1개 (predict_multi 와 같은 창 단위 정규화)
+    windows = {iv: scale_windows(np.asarray(features[iv][-SEQUENCE_LENGTH:], dtype=np.float64)[np.newaxis])[0]
+               .astype(np.float32) for iv in INTERVALS}
+    tmp_dir = tempfile.mkdtemp()
+
+    # TensorFlow 초기화 비용이 먼저 재는 쪽에만 붙지 않도록 작은 모델로 한 번 데운다
+    warm = build_multi_model(len(FEATURE_COLUMNS), INTERVALS[:1])
+    warm.predict_on_batch({input_name(INTERVALS[0]): windows[INTERVALS[0]]})
+
+    setups = {"4 models": [[iv] for iv in INTERVALS], "multi-timeframe": [INTERVALS]}
+    rows = []
+    for name, groups in setups.items():
+        train_seconds, load_seconds, size, mse, models = 0.0, 0.0, 0, {}, []
+        for group in groups:
+            train_ds, val_ds = make_multi_datasets({iv: features[iv] for iv in group}, seed=0)
+            model = build_multi_model(len(FEATURE_COLUMNS), group)
+            _, seconds = _timed(lambda: model.fit(train_ds, epochs=epochs, validation_data=val_ds, verbose=0))
+            train_seconds += seconds
+            mse.update(_val_mse(model, val_ds, group))
+
+            path = os.path.join(tmp_dir, f"{name.replace(' ', '_')}_{'_'.join(group)}.keras")
+            model.save(path)
+            size += os.path.getsize(path)
+            loaded, seconds = _timed(lambda: load_model(path))
+            load_seconds += seconds
+            models.append((loaded, {input_name(iv): windows[iv] for iv in group}))
+
+        def predict_all():
+            for model, inputs in models:
+                model.predict_on_batch(inputs)
+
+        p50, p95 = _latency(predict_all, runs)
+        rows.append({"setup": name, "train_s": train_seconds, "load_ms": load_seconds * 1000,
+                     "p50_ms": p50, "p95_ms": p95, "size_kb": size / 1024, "val_mse": mse})
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="타임프레임별 모델 4개 vs 멀티 타임프레임 모델 벤치마크")
+    parser.add_argument("symbol")
+    parser.add_argument("--epochs", type=int, default=5, help="구성마다 학습할 고정 에폭 수")
+    parser.add_argument("--runs", type=int, default=100, help="예측 지연 측정 반복 횟수")
+    args = parser.parse_args()
+    symbol = args.symbol.upper()
+
+    features = {iv: load_features(symbol, iv)[1] for iv in INTERVALS}
+    rows = run_benchmark(features, args.epochs, args.runs)
+
+    print(f"\n⏱️ === {symbol} {', '.join(INTERVALS)} / {args.epochs} 에폭 / 예측 {args.runs}회 (네 타임프레임 전부) ===")
+    print(f"{'setup':<18}{'train s':>10}{'load ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'size KB':>10}"
+          + "".join(f"{'mse ' + iv:>12}" for iv in INTERVALS))
+    for row in rows:
+        print(f"{row['setup']:<18}{row['train_s']:>10.1f}{row['load_ms']:>10.0f}{row['p50_ms']:>10.2f}"
+              f"{row['p95_ms']:>10.2f}{row['size_kb']:>10.0f}"
+              + "".join(f"{row['val_mse'][iv]:>12.5f}" for iv in INTERVALS))
+    print("mse: 정규화된 출력 공간의 검증 MSE")
+
+if __name__ == "__main__":
+    main()
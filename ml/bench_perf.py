@@ -0,0 +1,174 @@
+"""
+bench_perf.py
+⏱️ CPU 성능 모드 (perf.py) 설정별 학습 / 예측 벤치마크
+
+- 입력: (선택) 심볼 / 구간 — 없으면 무작위 보행 합성 피처 --rows 행
+- 처리: 설정마다 새 파이썬 프로세스를 띄워 (oneDNN / 스레드 수는 TensorFlow import 전에만 바뀌므로)
+        train 스크립트와 같은 LSTM 을 tf.data 파이프라인으로 --epochs 에폭 학습
+        → 첫 에폭 (트레이싱 / XLA 컴파일 포함) 과 이후 에폭 중앙값
+        → 설정의 예측 백엔드 (keras predict_on_batch / keras_compiled) 로 창 1개 / --batch 개 예측 지연 p50,
+           같은 가중치의 Keras predict_on_batch 대비 최대 오차
+- 출력: 콘솔 표 (--json 경로를 주면 결과를 JSON 으로도 저장)
+- 사용: python ml/bench_perf.py [BTC 1h] [--epochs 3] [--threads 1 2 4] [--json perf.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ML_DIR = os.path.join(ROOT, "ml")
+
+SEQ_LEN = 60
+BATCH_SIZE = 64
+
+CONFIGS = {
+    "baseline": {},
+    "float32": {"ML_FLOAT32": "1"},
+    "xla fit": {"ML_JIT_FIT": "1"},
+    "compiled predict": {"ML_BACKEND": "keras_compiled", "ML_JIT_PREDICT": "0"},
+    "compiled + xla predict": {"ML_BACKEND": "keras_compiled", "ML_JIT_PREDICT": "1"},
+    "onednn off": {"ML_ONEDNN": "0"},
+    "perf mode": {"ML_PERF": "1"},
+}
+# 부모 셸의 설정이 섞이지 않도록 작업자 환경에서 지우는 변수
+_CONFIG_VARIABLES = ("ML_PERF", "ML_JIT_FIT", "ML_JIT_PREDICT", "ML_FLOAT32", "ML_ONEDNN", "ML_INTRA_THREADS",
+                     "ML_INTER_THREADS", "ML_BACKEND", "TF_ENABLE_ONEDNN_OPTS", "TF_NUM_INTRAOP_THREADS",
+                     "TF_NUM_INTEROP_THREADS")
+
+# === 작업자 (설정 하나를 새 프로세스에서 측정) ===
+def _p50_ms(fn, x: np.ndarray, runs: int, warmup: int = 5) -> float:
+    for _ in range(warmup):
+        fn(x)
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn(x)
+        samples.append((time.perf_counter() - started) * 1000)
+    return float(np.percentile(samples, 50))
+
+def run_worker(data_path: str, epochs: int, batch: int, runs: int) -> dict:
+    # perf 를 TensorFlow 보다 먼저 import 해야 ML_ONEDNN / 스레드 설정이 적용된다
+    import perf
+    from perf import CompiledPredictor
+    from tflite_model import DEFAULT_BACKEND
+    from dataset import make_train_val_datasets
+    from inference import scale_windows
+    from windows import make_windows
+    from tensorflow.keras.callbacks import Callback
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import Input, LSTM, Dense, Dropout
+
+    class EpochTimer(Callback):
+        def __init__(self):
+            super().__init__()
+            self.seconds = []
+
+        def on_epoch_begin(self, epoch, logs=None):
+            self._started = time.perf_counter()
+
+        def on_epoch_end(self, epoch, logs=None):
+            self.seconds.append(time.perf_counter() - self._started)
+
+    data = np.load(data_path).astype(perf.FEATURE_DTYPE)
+    train_ds, val_ds = make_train_val_datasets(data, SEQ_LEN, BATCH_SIZE, validation_split=0.2,
+                                               scale=(data.min(axis=0), data.max(axis=0)), seed=0)
+    model = Sequential([
+        Input(shape=(SEQ_LEN, data.shape[1])),
+        LSTM(64, return_sequences=True),
+        Dropout(0.2),
+        LSTM(32),
+        Dense(32, activation='relu'),
+        Dense(4)
+    ])
+    model.compile(optimizer='adam', loss='mse', jit_compile=perf.JIT_FIT)
+    timer = EpochTimer()
+    model.fit(train_ds, epochs=epochs, validation_data=val_ds, callbacks=[timer], verbose=0)
+
+    # 예측 입력: 최근 batch 개 창 (inference.py 와 같은 창 단위 정규화)
+    windows, _ = make_windows(data, SEQ_LEN)
+    scaled = scale_windows(np.asarray(windows[-batch:], dtype=perf.FEATURE_DTYPE))[0].astype(np.float32)
+    predictor = CompiledPredictor(model) if DEFAULT_BACKEND == "keras_compiled" else model
+    drift = np.abs(np.asarray(predictor.predict_on_batch(scaled)) - np.asarray(model.predict_on_batch(scaled)))
+
+    return {
+        "settings": {**perf.settings(), "backend": DEFAULT_BACKEND},
+        "first_epoch_s": timer.seconds[0],
+        "epoch_s": float(np.median(timer.seconds[1:])) if len(timer.seconds) > 1 else timer.seconds[0],
+        "single_ms": _p50_ms(predictor.predict_on_batch, scaled[:1], runs),
+        "batch_ms": _p50_ms(predictor.predict_on_batch, scaled, runs),
+        "max_drift": float(drift.max()),
+    }
+
+# === 부모 ===
+def measure(name: str, overrides: dict, data_path: str, args) -> dict:
+    env = {k: v for k, v in os.environ.items() if k not in _CONFIG_VARIABLES}
+    env.update(overrides, PYTHONPATH=os.pathsep.join([ML_DIR, ROOT]), TF_CPP_MIN_LOG_LEVEL="3")
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", data_path,
+                             "--epochs", str(args.epochs), "--batch", str(args.batch), "--runs", str(args.runs)],
+                            cwd=ML_DIR, env=env, capture_output=True, text=True, check=True)
+    return {"config": name, **json.loads(result.stdout.strip().splitlines()[-1])}
+
+def _features(args) -> np.ndarray:
+    if args.symbol:
+        from features import load_features
+        return np.asarray(load_features(args.symbol.upper(), args.interval)[1])
+    # 합성 피처: 열마다 독립적인 무작위 보행 (값의 규모만 실제 피처와 비슷하면 된다)
+    rng = np.random.default_rng(0)
+    return np.cumsum(rng.normal(size=(args.rows, 10)), axis=0) + 100
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU 성능 모드 설정별 학습 / 예측 벤치마크")
+    parser.add_argument("symbol", nargs="?")
+    parser.add_argument("interval", nargs="?", default="1h")
+    parser.add_argument("--rows", type=int, default=2000, help="심볼이 없을 때 합성 피처 행 수")
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--batch", type=int, default=64, help="배치 예측 창 개수")
+    parser.add_argument("--runs", type=int, default=50, help="예측 지연 측정 반복 횟수")
+    parser.add_argument("--threads", type=int, nargs="*", default=[], help="intra-op 스레드 수 설정을 추가로 비교")
+    parser.add_argument("--configs", nargs="*", choices=list(CONFIGS), help="측정할 설정 (기본 전체)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 경로")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.epochs, args.batch, args.runs)))
+        return
+
+    configs = {name: CONFIGS[name] for name in (args.configs or CONFIGS)}
+    for n in args.threads:
+        configs[f"intra threads={n}"] = {"ML_INTRA_THREADS": str(n), "ML_INTER_THREADS": "1"}
+
+    data = _features(args)
+    data_path = os.path.join(tempfile.mkdtemp(), "features.npy")
+    np.save(data_path, data)
+
+    source = f"{args.symbol.upper()}/{args.interval}" if args.symbol else f"합성 {len(data)}행"
+    print(f"⏱️ {source} / CPU {os.cpu_count()} / {args.epochs} 에폭 / 예측 {args.runs}회 p50 / {platform.platform()}")
+    print(f"{'config':<24}{'1st epoch s':>12}{'epoch s':>10}{'1 win ms':>10}{f'{args.batch} win ms':>11}{'max |Δ|':>10}")
+    results = []
+    for name, overrides in configs.items():
+        try:
+            row = measure(name, overrides, data_path, args)
+        except subprocess.CalledProcessError as e:
+            print(f"{name:<24}  ❌ 실패: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        results.append(row)
+        print(f"{name:<24}{row['first_epoch_s']:>12.2f}{row['epoch_s']:>10.2f}{row['single_ms']:>10.2f}"
+              f"{row['batch_ms']:>11.2f}{row['max_drift']:>10.1e}")
+    print("max |Δ|: 같은 가중치의 Keras predict_on_batch 대비 (정규화된 출력 공간)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"platform": platform.platform(), "cpus": os.cpu_count(), "source": source,
+                       "epochs": args.epochs, "results": results}, f, indent=2)
+        print(f"💾 저장 완료: {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+bench_startup.py
+⏱️ CLI 시작 비용 벤치마크 (import 시간 + 메모리)
+
+- 대상: main.py 와 ml/ 의 실행 스크립트 (첫 입력 프롬프트가 뜨기 전까지 = 모듈 import 비용)
+- 처리: 대상마다 새 파이썬 프로세스를 띄워 import 시간 / 최대 RSS / TensorFlow 로드 여부를 측정
+        → --repeat 회 반복한 중앙값 (OS 파일 캐시가 데워진 상태 기준)
+- 출력: 콘솔 표 (--json 경로를 주면 결과를 JSON 으로도 저장)
+- 사용: python ml/bench_startup.py [--repeat 5] [--json startup.json] [모듈 ...]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ML_DIR = os.path.join(ROOT, "ml")
+
+ENTRY_POINTS = [
+    "main",
+    "predict_client", "predict_summary", "predict_15m", "predict_1h", "predict_4h", "predict_1d",
+    "predict_server", "collect_1m_data",
+    "train_summary", "train_15m", "train_1h", "train_4h", "train_1d", "train_1m",
+]
+
+# 새 프로세스 안에서 실행: 모듈을 import 만 하고 (__main__ 블록은 실행되지 않음) 측정값을 JSON 으로 출력
+_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+if sys.argv[1]:
+    __import__(sys.argv[1])
+elapsed = time.perf_counter() - started
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024  # macOS 는 바이트, Linux 는 KB
+print(json.dumps({"seconds": elapsed, "rss_mb": rss_mb, "tensorflow": "tensorflow" in sys.modules}))
+"""
+
+def probe(module: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ML_DIR, ROOT]), TF_CPP_MIN_LOG_LEVEL="3")
+    result = subprocess.run([sys.executable, "-c", _PROBE, module], cwd=ML_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def measure(module: str, repeat: int) -> dict:
+    runs = [probe(module) for _ in range(repeat)]
+    return {
+        "module": module or "(python)",
+        "import_ms": statistics.median(r["seconds"] for r in runs) * 1000,
+        "rss_mb": statistics.median(r["rss_mb"] for r in runs),
+        "tensorflow": runs[0]["tensorflow"],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI 시작 비용 벤치마크")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    print(f"⏱️ Python {platform.python_version()} / {platform.platform()} / 반복 {args.repeat}회 중앙값")
+    print(f"{'module':<18}{'import ms':>12}{'RSS MB':>10}{'TF':>5}")
+    results = []
+    # 빈 인터프리터 기준선을 먼저 잰다
+    for module in [""] + args.modules:
+        try:
+            row = measure(module, args.repeat)
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<18}  ❌ import 실패: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        results.append(row)
+        print(f"{row['module']:<18}{row['import_ms']:>12.1f}{row['rss_mb']:>10.1f}{'yes' if row['tensorflow'] else '-':>5}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "repeat": args.repeat, "results": results}, f, indent=2)
+        print(f"💾 저장 완료: {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+bench_tflite.py
+⏱️ Keras vs TFLite 추론 벤치마크 (CPU)
+
+- 입력: 심볼 / 구간 (예: python ml/bench_tflite.py ETH 1h --runs 200)
+- 처리: 레지스트리 최신 모델을 float / 동적 범위 양자화 TFLite 로 임시 디렉터리에 변환 (끝나면 삭제,
+        변환기를 쓸 수 없으면 해당 비교만 건너뜀)
+        → 백엔드별 로드 시간, 창 1개 예측 지연 (p50 / p95), Keras 대비 출력 오차 측정
+- 출력: 콘솔 표
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from tensorflow.keras.models import load_model
+from registry import get_registry
+from tflite_model import TFLiteModel, export_tflite
+
+def _latency(fn, x: np.ndarray, runs: int, warmup: int = 5) -> tuple[float, float]:
+    for _ in range(warmup):
+        fn(x)
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn(x)
+        samples.append((time.perf_counter() - started) * 1000)
+    return float(np.percentile(samples, 50)), float(np.percentile(samples, 95))
+
+def _timed_load(loader) -> tuple[object, float]:
+    started = time.perf_counter()
+    model = loader()
+    return model, (time.perf_counter() - started) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Keras vs TFLite 추론 벤치마크")
+    parser.add_argument("symbol")
+    parser.add_argument("interval")
+    parser.add_argument("--runs", type=int, default=200, help="지연 측정 반복 횟수")
+    parser.add_argument("--samples", type=int, default=500, help="출력 오차를 비교할 무작위 창 개수")
+    args = parser.parse_args()
+
+    registry = get_registry()
+    entry = registry.latest(args.symbol, args.interval)
+    if entry is None:
+        print(f"❌ 모델이 없습니다: {args.symbol.upper()}/{args.interval}")
+        return
+    keras_path = registry.path(entry)
+
+    keras_model, keras_load = _timed_load(lambda: load_model(keras_path))
+    _, seq_len, features = keras_model.input_shape
+
+    # 학습/예측 입력과 같은 [0, 1] 정규화 구간의 무작위 창
+    rng = np.random.default_rng(0)
+    windows = rng.random((args.samples, seq_len, features), dtype=np.float32)
+    single = windows[:1]
+    reference = np.asarray(keras_model.predict_on_batch(windows))
+
+    rows = [
+        ("keras model.predict", keras_load, lambda x: keras_model.predict(x, verbose=0), os.path.getsize(keras_path), None),
+        ("keras predict_on_batch", keras_load, keras_model.predict_on_batch, os.path.getsize(keras_path), None),
+    ]
+    # 변환한 모델은 임시 디렉터리에만 두고 측정이 끝나면 지운다
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, quantize in [("tflite", False), ("tflite_quant", True)]:
+            try:
+                path = export_tflite(keras_model, os.path.join(tmp_dir, f"{name}.tflite"), quantize)
+                model, load_ms = _timed_load(lambda: TFLiteModel(path))
+            except Exception as e:
+                # TFLite 변환기 / 인터프리터가 없는 환경에서는 Keras 만 비교한다
+                print(f"⚠️ {name} 비교 건너뜀 (TFLite 변환 실패): {e}")
+                continue
+            rows.append((name, load_ms, model.predict_on_batch, os.path.getsize(path),
+                         model.predict_on_batch(windows) - reference))
+
+        print(f"\n⏱️ === {args.symbol.upper()}/{args.interval} ({entry['file']}) 창 1개 기준, {args.runs}회 ===")
+        print(f"{'backend':<24}{'load ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'size KB':>10}{'max |Δ|':>12}{'mean |Δ|':>12}")
+        for name, load_ms, fn, size, drift in rows:
+            p50, p95 = _latency(fn, single, args.runs)
+            drift_cols = f"{'-':>12}{'-':>12}" if drift is None else f"{np.abs(drift).max():>12.2e}{np.abs(drift).mean():>12.2e}"
+            print(f"{name:<24}{load_ms:>10.1f}{p50:>10.3f}{p95:>10.3f}{size / 1024:>10.0f}{drift_cols}")
+        print("Δ: 정규화된 출력 공간에서 Keras 대비 차이")
+
+if __name__ == "__main__":
+    main()
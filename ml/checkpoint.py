@@ -0,0 +1,126 @@
+"""
+checkpoint.py
+💾 긴 학습 실행의 체크포인트 저장 / 재개 (Keras 콜백)
+
+- 저장 위치: models/checkpoints/{interval}_{SYMBOL}/
+  - epoch_NNNN.keras      : 가중치 + 옵티마이저 상태 (model.save)
+  - epoch_NNNN.best.npz   : EarlyStopping(restore_best_weights) 이 들고 있는 최고 가중치
+  - features.npz          : 학습에 쓴 피처 스냅숏 (재개해도 같은 데이터 / 정규화 / 검증 분할로 이어서 학습)
+  - state.json            : 다음 에폭 번호 + EarlyStopping 상태 + 위 파일 이름 (마지막에 교체 → 중간에 죽어도 이전 체크포인트가 유효)
+- 재개: TrainingCheckpoint(..., resume=True) → restored_model 을 fit(callbacks=checkpoint.callbacks(early_stop),
+        initial_epoch=checkpoint.initial_epoch) 하면 중단된 에폭부터 이어서 학습
+- 학습이 끝나 레지스트리에 등록하면 clear() 로 디렉터리를 지운다
+- TensorFlow 를 import 하므로 학습 함수 안에서만 불러온다
+"""
+
+import json
+import os
+import shutil
+import numpy as np
+from tensorflow.keras.callbacks import Callback
+from tensorflow.keras.models import load_model
+from registry import MODEL_DIR
+
+CHECKPOINT_SUBDIR = "checkpoints"
+CHECKPOINT_EVERY = 1  # 몇 에폭마다 저장할지
+STATE_FILE = "state.json"
+FEATURES_FILE = "features.npz"
+_EARLY_STOPPING_FIELDS = ("wait", "stopped_epoch", "best", "best_epoch")
+
+def checkpoint_dir(symbol: str, interval: str, model_dir: str = MODEL_DIR) -> str:
+    return os.path.join(model_dir, CHECKPOINT_SUBDIR, f"{interval}_{symbol.upper()}")
+
+def _replace_json(path: str, payload: dict):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+class TrainingCheckpoint(Callback):
+    def __init__(self, symbol: str, interval: str, resume: bool = False,
+                 every: int = CHECKPOINT_EVERY, model_dir: str = MODEL_DIR):
+        super().__init__()
+        self.directory = checkpoint_dir(symbol, interval, model_dir)
+        self.early_stopping = None
+        self.every = every
+        self.initial_epoch = 0
+        self.restored_model = None
+        self.timestamps = self.data = None
+        self.resumed = False
+        self._state: dict | None = None
+
+        if resume and os.path.exists(os.path.join(self.directory, STATE_FILE)):
+            self._restore()
+        else:
+            if resume:
+                print("⚠️ 재개할 체크포인트가 없어 처음부터 학습합니다.")
+            self.clear()
+
+    # === 재개 ===
+    def _restore(self):
+        with open(os.path.join(self.directory, STATE_FILE), "r") as f:
+            self._state = json.load(f)
+        self.initial_epoch = self._state["epoch"]
+        self.resumed = True
+        self.restored_model = load_model(os.path.join(self.directory, self._state["model"]))
+        features_path = os.path.join(self.directory, FEATURES_FILE)
+        if os.path.exists(features_path):
+            with np.load(features_path) as saved:
+                self.timestamps, self.data = saved["timestamps"], saved["data"]
+        print(f"▶️ 체크포인트에서 재개: {self.directory} (epoch {self.initial_epoch})")
+
+    def callbacks(self, early_stopping=None) -> list:
+        # fit(callbacks=...) 에 넘길 목록. EarlyStopping 이 on_train_begin 에서 상태를 초기화한 뒤에
+        # 이 콜백이 복원해야 하므로 항상 EarlyStopping 뒤에 둔다.
+        self.early_stopping = early_stopping
+        return [early_stopping, self] if early_stopping is not None else [self]
+
+    def on_train_begin(self, logs=None):
+        es = self.early_stopping
+        if not self.resumed or es is None or self._state["early_stopping"] is None:
+            return
+        for field in _EARLY_STOPPING_FIELDS:
+            setattr(es, field, self._state["early_stopping"][field])
+        if self._state.get("best_weights"):
+            with np.load(os.path.join(self.directory, self._state["best_weights"])) as saved:
+                es.best_weights = [saved[f"arr_{i}"] for i in range(len(saved.files))]
+
+    # === 저장 ===
+    def save_features(self, timestamps: np.ndarray, data: np.ndarray):
+        # 새로 시작할 때 한 번 저장 (1m memmap 처럼 큰 데이터는 저장하지 않고 재개 시 다시 읽는다)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = os.path.join(self.directory, f"{FEATURES_FILE}.tmp.npz")
+        np.savez(tmp_path, timestamps=np.asarray(timestamps), data=np.asarray(data))
+        os.replace(tmp_path, os.path.join(self.directory, FEATURES_FILE))
+
+    def on_epoch_end(self, epoch, logs=None):
+        if (epoch + 1) % self.every == 0:
+            self.save(epoch + 1)
+
+    def save(self, next_epoch: int):
+        os.makedirs(self.directory, exist_ok=True)
+        stem = f"epoch_{next_epoch:04d}"
+        self.model.save(os.path.join(self.directory, f"{stem}.keras"))
+
+        es = self.early_stopping
+        state = {"epoch": next_epoch, "model": f"{stem}.keras", "best_weights": None, "early_stopping": None}
+        if es is not None:
+            state["early_stopping"] = {
+                "wait": int(es.wait), "stopped_epoch": int(es.stopped_epoch), "best_epoch": int(es.best_epoch),
+                "best": None if es.best is None else float(es.best),
+            }
+            if getattr(es, "best_weights", None) is not None:
+                state["best_weights"] = f"{stem}.best.npz"
+                np.savez(os.path.join(self.directory, state["best_weights"]), *es.best_weights)
+
+        _replace_json(os.path.join(self.directory, STATE_FILE), state)
+        self._state = state
+        self._remove_stale(keep={STATE_FILE, FEATURES_FILE, state["model"], state["best_weights"]})
+
+    def _remove_stale(self, keep: set):
+        for name in os.listdir(self.directory):
+            if name not in keep:
+                os.remove(os.path.join(self.directory, name))
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
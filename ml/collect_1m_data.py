@@ -1,68 +1,127 @@
-import os
+"""
+collect_1m_data.py
+🛰️ 여러 심볼의 1분봉을 한 프로세스에서 수집하는 데몬
+
+- 입력: 심볼 목록 (예: python ml/collect_1m_data.py BTC ETH SOL / 실행 후 "BTC,ETH" 입력)
+- 처리: 매 분 마감 직후에 깨어나 모든 심볼의 누락 구간을 동시에 요청 (동시 요청 수/초당 요청 수 제한)
+        → 받은 캔들은 메모리에 모았다가 flush 주기마다 심볼별로 한 번에 저장
+        → 중단되었다가 다시 켜지면 저장소의 마지막 open_time 부터 빠진 구간을 페이지 단위로 복구
+- 출력: data/klines/{SYMBOL}_1m.bin
+"""
+
+import argparse
+import asyncio
 import time
-import csv
-from datetime import datetime
-from services.BinanceService import BinanceService
-
-# CSV 경로 생성
-def get_csv_path(symbol: str) -> str:
-    base_dir = "data"
-    os.makedirs(base_dir, exist_ok=True)
-    return os.path.join(base_dir, f"{symbol.upper()}_1m.csv")
-
-# CSV 수집 함수
-def collect_5m(symbol: str, csv_path: str):
-    binance = BinanceService()
-
-    # 가장 최근 timestamp 확인
-    last_timestamp = 0
-    if os.path.exists(csv_path):
-        with open(csv_path, "r") as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-            if rows:
-                last_timestamp = int(rows[-1][0])
-
-    # Binance에서 1분봉 800개 가져오기
-    candles = binance.fetch_historical_candle_data(symbol, 800, "1m")
-
-    new_rows = []
-    for i, c in enumerate(candles):
-        # timestamp 직접 계산 (가장 오래된 것이 먼저)
-        timestamp = int((time.time() // 60 - (len(candles) - i)) * 60 * 1000)
-        if timestamp > last_timestamp:
-            new_rows.append([
-                timestamp,
-                c.open,
-                c.high,
-                c.low,
-                c.close,
-                c.volume
-            ])
-
-    if not new_rows:
-        print("📭 저장할 새로운 데이터가 없습니다.")
-        return
-
-    # CSV에 누적 저장
-    with open(csv_path, "a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerows(new_rows)
-
-    print(f"✅ {len(new_rows)}개의 1분봉 데이터 저장 완료 ({symbol.upper()})")
+from model.CandleSeries import CandleSeries
+from services.AsyncBinanceService import AsyncBinanceService
+from services.Backfill import backfill_async
+from services.KlineStore import KlineStore, missing_range
+
+INTERVAL = "1m"
+
+# === 설정 ===
+CONCURRENCY = 16           # 동시에 보내는 요청 수
+REQUESTS_PER_SECOND = 20   # 초당 요청 수 상한
+FLUSH_INTERVAL = 60        # 디스크에 모아서 쓰는 주기 (초)
+SETTLE_DELAY = 2.0         # 분 마감 후 거래소에 봉이 확정될 때까지 기다리는 시간 (초)
+
+# === 다중 심볼 수집 데몬 ===
+class CollectorDaemon:
+    def __init__(self, symbols: list[str], store: KlineStore | None = None,
+                 concurrency: int = CONCURRENCY, requests_per_second: float = REQUESTS_PER_SECOND,
+                 flush_interval: float = FLUSH_INTERVAL, settle_delay: float = SETTLE_DELAY,
+                 **service_kwargs):
+        self.symbols = [s.upper() for s in symbols]
+        self.store = store or KlineStore()
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.flush_interval = flush_interval
+        self.settle_delay = settle_delay
+        self.service_kwargs = service_kwargs
+
+        # 아직 디스크에 쓰지 않은 캔들과, 심볼별로 마지막으로 받은 open_time
+        self._pending: dict[str, list[CandleSeries]] = {s: [] for s in self.symbols}
+        self._last_seen = {s: self.store.last_open_time(s, INTERVAL) for s in self.symbols}
+        self._last_flush = time.monotonic()
+
+    async def _collect_symbol(self, service: AsyncBinanceService, symbol: str, now_ms: int) -> int:
+        missing = missing_range(self._last_seen[symbol], INTERVAL, now_ms)
+        if missing is None:
+            return 0
+        first, last_closed = missing
+        # 누락 구간이 1000개를 넘으면 (다운타임 복구) 여러 페이지로 나눠 받는다
+        series = (await backfill_async(service, symbol, INTERVAL, first, last_closed)).between(first, last_closed)
+        if len(series):
+            self._pending[symbol].append(series)
+            self._last_seen[symbol] = int(series.timestamps[-1])
+        return len(series)
+
+    async def tick(self, service: AsyncBinanceService, now_ms: int | None = None) -> dict[str, int]:
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        results = await asyncio.gather(
+            *[self._collect_symbol(service, s, now_ms) for s in self.symbols],
+            return_exceptions=True,
+        )
+        counts = {}
+        for symbol, result in zip(self.symbols, results):
+            if isinstance(result, Exception):
+                # 실패한 심볼은 _last_seen 이 그대로이므로 다음 tick 에서 빠진 구간을 다시 받는다
+                print(f"⚠️ [{symbol}] 수집 실패: {result}")
+                continue
+            counts[symbol] = result
+        return counts
+
+    def flush(self) -> int:
+        written = 0
+        for symbol, batches in self._pending.items():
+            if batches:
+                written += self.store.append(symbol, INTERVAL, CandleSeries.concat(batches))
+                batches.clear()
+        self._last_flush = time.monotonic()
+        return written
+
+    async def run(self):
+        print(f"🛰️ 1분봉 수집 시작: {len(self.symbols)}개 심볼 (동시 {self.concurrency}, 초당 {self.requests_per_second}회)")
+        async with AsyncBinanceService(self.concurrency, requests_per_second=self.requests_per_second,
+                                       **self.service_kwargs) as service:
+            try:
+                while True:
+                    started = time.monotonic()
+                    counts = await self.tick(service)
+                    elapsed = time.monotonic() - started
+                    print(f"⏱️ {sum(counts.values())}개 수집 ({len(counts)}/{len(self.symbols)} 심볼, {elapsed:.2f}초)")
+                    if elapsed > 60:
+                        print("⚠️ 수집이 1분 경계를 넘겼습니다. 동시 요청 수 / 초당 요청 수를 늘려주세요.")
+
+                    if time.monotonic() - self._last_flush >= self.flush_interval:
+                        print(f"💾 {self.flush()}개 저장 완료")
+
+                    # 다음 분 마감 + settle_delay 까지 대기
+                    now = time.time()
+                    next_tick = (now // 60 + 1) * 60 + self.settle_delay
+                    await asyncio.sleep(next_tick - now)
+            finally:
+                print(f"💾 종료 전 {self.flush()}개 저장 완료")
 
 # 실행 진입점
 def main():
-    symbol = input("📥 심볼 입력 (예: BTC): ").strip().upper()
-    csv_path = get_csv_path(symbol)
-
-    # 주기적으로 수집
-    while True:
-        try:
-            collect_5m(symbol, csv_path)
-        except Exception as e:
-            print(f"⚠️ 오류 발생: {e}")
-        time.sleep(60)  # 1분마다 실행
+    parser = argparse.ArgumentParser(description="다중 심볼 1분봉 수집 데몬")
+    parser.add_argument("symbols", nargs="*", help="수집할 심볼 (예: BTC ETH)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--rps", type=float, default=REQUESTS_PER_SECOND)
+    parser.add_argument("--flush-interval", type=float, default=FLUSH_INTERVAL)
+    args = parser.parse_args()
+
+    symbols = args.symbols
+    if not symbols:
+        symbols = [s.strip() for s in input("📥 심볼 입력 (예: BTC,ETH): ").split(",") if s.strip()]
+
+    daemon = CollectorDaemon(symbols, concurrency=args.concurrency,
+                             requests_per_second=args.rps, flush_interval=args.flush_interval)
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        print("👋 수집을 종료합니다.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,80 @@
+"""
+dataset.py
+🚰 tf.data 기반 스트리밍 학습 입력 파이프라인
+
+- 입력: (N, F) 피처 배열 (디스크의 memmap 그대로 사용 가능)
+- 처리: 윈도우 번호만 셔플(버퍼 크기 제한) → 배치 → 배치 단위로만 윈도우를 읽어 정규화
+        → 여러 CPU 코어에서 병렬 map → prefetch 로 학습과 데이터 준비를 겹침
+- 메모리: 전체 (N, seq_len, F) 텐서를 만들지 않음 (셔플 버퍼 + prefetch 된 배치만 메모리에 올라감)
+"""
+
+from typing import TYPE_CHECKING
+import numpy as np
+from windows import make_windows, window_count
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+SHUFFLE_BUFFER = 10_000
+
+def make_window_dataset(data: np.ndarray, seq_len: int, batch_size: int, target_offset: int = 1,
+                        indices: np.ndarray | None = None, shuffle_buffer: int | None = None,
+                        scale: tuple[np.ndarray, np.ndarray] | None = None,
+                        seed: int | None = None) -> "tf.data.Dataset":
+    # scale=(min_vals, max_vals) 이면 배치마다 (x - min) / (max - min + 1e-8) 로 정규화한다
+    # TensorFlow 는 데이터셋을 실제로 만들 때 불러온다 (min_max 등만 쓰는 쪽은 import 비용 없음)
+    import tensorflow as tf
+    X, y = make_windows(data, seq_len, target_offset)
+    n_features = X.shape[2]
+    if indices is None:
+        indices = np.arange(len(X))
+    if scale is not None:
+        # 정규화는 피처 배열과 같은 dtype 으로 계산한다 (ML_FLOAT32 면 float32 그대로, 변환 복사 없음)
+        dtype = np.result_type(X.dtype, np.float32)
+        min_vals = np.asarray(scale[0], dtype=dtype)
+        range_vals = np.asarray(scale[1], dtype=dtype) - min_vals + dtype.type(1e-8)
+
+    def load_batch(batch_indices):
+        # 배치에 속한 윈도우만 memmap 에서 읽어 온다
+        X_batch, y_batch = X[batch_indices], y[batch_indices]
+        if scale is not None:
+            X_batch = (X_batch - min_vals) / range_vals
+            y_batch = (y_batch - min_vals[:4]) / range_vals[:4]
+        return X_batch.astype(np.float32, copy=False), y_batch.astype(np.float32, copy=False)
+
+    def load(batch_indices):
+        X_batch, y_batch = tf.numpy_function(load_batch, [batch_indices], [tf.float32, tf.float32])
+        X_batch.set_shape([None, seq_len, n_features])
+        y_batch.set_shape([None, 4])
+        return X_batch, y_batch
+
+    ds = tf.data.Dataset.from_tensor_slices(np.asarray(indices, dtype=np.int64))
+    if shuffle_buffer:
+        ds = ds.shuffle(shuffle_buffer, seed=seed, reshuffle_each_iteration=True)
+    ds = ds.batch(batch_size)
+    ds = ds.map(load, num_parallel_calls=tf.data.AUTOTUNE, deterministic=not shuffle_buffer)
+    return ds.prefetch(tf.data.AUTOTUNE)
+
+def make_train_val_datasets(data: np.ndarray, seq_len: int, batch_size: int,
+                            validation_split: float = 0.2, target_offset: int = 1,
+                            scale: tuple[np.ndarray, np.ndarray] | None = None,
+                            shuffle_buffer: int = SHUFFLE_BUFFER,
+                            seed: int | None = None) -> tuple["tf.data.Dataset", "tf.data.Dataset"]:
+    # Keras validation_split 과 같이 뒤쪽 validation_split 비율의 윈도우를 검증용으로 쓴다
+    count = window_count(len(data), seq_len, target_offset)
+    split = int((1 - validation_split) * count)
+    train_ds = make_window_dataset(data, seq_len, batch_size, target_offset, np.arange(split),
+                                   shuffle_buffer, scale, seed)
+    val_ds = make_window_dataset(data, seq_len, batch_size, target_offset, np.arange(split, count),
+                                 None, scale)
+    return train_ds, val_ds
+
+def min_max(data: np.ndarray, chunk_rows: int = 1_000_000) -> tuple[np.ndarray, np.ndarray]:
+    # memmap 을 chunk 단위로 훑어 열별 min/max 를 구한다 (전체를 메모리에 올리지 않음)
+    min_vals = np.full(data.shape[1], np.inf)
+    max_vals = np.full(data.shape[1], -np.inf)
+    for start in range(0, len(data), chunk_rows):
+        chunk = np.asarray(data[start:start + chunk_rows], dtype=np.float64)
+        min_vals = np.minimum(min_vals, chunk.min(axis=0))
+        max_vals = np.maximum(max_vals, chunk.max(axis=0))
+    return min_vals, max_vals
@@ -0,0 +1,208 @@
+"""
+features.py
+🧮 train/predict 스크립트 공용 피처 파이프라인
+
+- 피처: [open, high, low, close, sma, ema, rsi, macd, atr, obv]
+- 처리: 로컬 kline 저장소 (또는 1분봉 집계) → 벡터화 지표 계산 → 지표가 모두 유효한 행만 남김
+- 캐시: data/features/{SYMBOL}_{interval}/ 에 마감된 캔들의 피처 행을 누적 저장
+        (마지막 마감 캔들 timestamp 기준, 새로 마감된 캔들의 행만 추가 계산)
+- dtype: 지표는 float64 로 계산하고, 캐시 파일과 반환하는 피처 행렬은 perf.FEATURE_DTYPE
+         (ML_FLOAT32 / ML_PERF 면 float32 → 캐시 파일 · memmap · 학습 / 예측 입력 크기 절반)
+"""
+
+import json
+import os
+import time
+import numpy as np
+from model.CandleSeries import CandleSeries
+from services.BinanceService import BinanceService
+from services.KlineStore import KlineStore
+from utils.Indicators import (
+    calculate_sma_series, calculate_ema_series, calculate_rsi_series,
+    calculate_macd_series, calculate_atr_series, calculate_obv_series
+)
+from utils.Intervals import interval_to_ms
+from utils.Resample import resample
+from perf import FEATURE_DTYPE
+
+FEATURE_COLUMNS = ["open", "high", "low", "close", "sma", "ema", "rsi", "macd", "atr", "obv"]
+OBV_COLUMN = FEATURE_COLUMNS.index("obv")
+
+# 한 행의 지표가 모두 유효해지는 데 필요한 캔들 수 (MACD 장기 EMA 26)
+LOOKBACK = 26
+CACHE_DIR = os.path.join("data", "features")
+
+# === 피처 계산 ===
+def compute_feature_matrix(opens, highs, lows, closes, volumes) -> np.ndarray:
+    # 입력과 같은 길이의 (n, 10) 행렬. 지표가 정의되지 않은 행에는 nan 이 들어간다.
+    return np.column_stack([
+        np.asarray(opens, dtype=np.float64),
+        np.asarray(highs, dtype=np.float64),
+        np.asarray(lows, dtype=np.float64),
+        np.asarray(closes, dtype=np.float64),
+        calculate_sma_series(closes, 20),
+        calculate_ema_series(closes, 20),
+        calculate_rsi_series(closes),
+        calculate_macd_series(closes),
+        calculate_atr_series(highs, lows, closes),
+        calculate_obv_series(closes, volumes),
+    ])
+
+def _candle_columns(candles):
+    # CandleSeries 와 CandleData 목록 모두 받는다
+    series = candles if isinstance(candles, CandleSeries) else CandleSeries.from_candles(candles)
+    return series.timestamps, series.ohlcv()
+
+def _matrix_from_ohlcv(ohlcv: np.ndarray) -> np.ndarray:
+    return compute_feature_matrix(*ohlcv.T)
+
+def build_features(candles) -> tuple[np.ndarray, np.ndarray]:
+    # 캐시 없이 캔들 목록에서 바로 (timestamps, data) 를 만든다
+    timestamps, ohlcv = _candle_columns(candles)
+    matrix = _matrix_from_ohlcv(ohlcv)
+    valid = ~np.isnan(matrix).any(axis=1)
+    return timestamps[valid], matrix[valid].astype(FEATURE_DTYPE)
+
+# === 디스크 캐시 ===
+class FeatureCache:
+    # timestamps.i8 / features.f8 (float32 면 features.f4) 는 행 단위로 이어 붙이는 raw 바이너리 파일이다
+    def __init__(self, symbol: str, interval: str, cache_dir: str = CACHE_DIR, dtype=None):
+        self.dtype = np.dtype(FEATURE_DTYPE if dtype is None else dtype)
+        self.path = os.path.join(cache_dir, f"{symbol.upper()}_{interval}")
+        self.timestamps_path = os.path.join(self.path, "timestamps.i8")
+        self.features_path = os.path.join(self.path, f"features.f{self.dtype.itemsize}")
+        self.meta_path = os.path.join(self.path, "meta.json")
+
+    def read(self) -> tuple[np.ndarray, np.ndarray]:
+        empty = np.empty(0, dtype=np.int64), np.empty((0, len(FEATURE_COLUMNS)), dtype=self.dtype)
+        if not os.path.exists(self.meta_path):
+            return empty
+        with open(self.meta_path, "r") as f:
+            meta = json.load(f)
+        # dtype 이 없는 meta 는 float64 만 쓰던 예전 캐시. dtype 이 바뀌면 처음부터 다시 만든다.
+        if meta.get("columns") != FEATURE_COLUMNS or meta.get("dtype", "float64") != self.dtype.name:
+            return empty
+
+        timestamps = np.fromfile(self.timestamps_path, dtype=np.int64)
+        rows = meta["rows"]
+        if len(timestamps) < rows:
+            return empty
+        features = np.memmap(self.features_path, dtype=self.dtype, mode="r",
+                             shape=(rows, len(FEATURE_COLUMNS))) if rows else empty[1]
+        return timestamps[:rows], features
+
+    def write(self, timestamps: np.ndarray, features: np.ndarray, append: bool = False):
+        os.makedirs(self.path, exist_ok=True)
+        rows = len(timestamps)
+        if append:
+            # 이전 쓰기가 중간에 끊겨 meta 보다 길어진 꼬리는 잘라낸 뒤 이어 쓴다
+            cached = len(self.read()[0])
+            os.truncate(self.features_path, cached * len(FEATURE_COLUMNS) * self.dtype.itemsize)
+            os.truncate(self.timestamps_path, cached * 8)
+            rows += cached
+        mode = "ab" if append else "wb"
+        # 데이터 파일을 먼저 쓰고 meta 의 행 수를 마지막에 갱신한다
+        with open(self.features_path, mode) as f:
+            np.ascontiguousarray(features, dtype=self.dtype).tofile(f)
+        with open(self.timestamps_path, mode) as f:
+            np.ascontiguousarray(timestamps, dtype=np.int64).tofile(f)
+        with open(self.meta_path, "w") as f:
+            last_closed = int(timestamps[-1]) if len(timestamps) else None
+            json.dump({"columns": FEATURE_COLUMNS, "rows": rows, "last_closed": last_closed,
+                       "dtype": self.dtype.name}, f)
+        # 다른 dtype 으로 만들었던 피처 파일은 meta 가 바뀐 뒤로는 읽지 않으므로 지운다
+        stale = os.path.join(self.path, "features.f8" if self.dtype.itemsize == 4 else "features.f4")
+        if os.path.exists(stale):
+            os.remove(stale)
+
+def _rows_after(ohlcv: np.ndarray, start: int, last_obv: float | None) -> np.ndarray:
+    # ohlcv[start:] 행만 계산한다. 앞쪽 LOOKBACK-1 개 캔들을 함께 넣어 지표를 채우고,
+    # 누적 지표인 OBV 는 캐시의 마지막 값에 이어지도록 오프셋을 맞춘다.
+    begin = max(0, start - (LOOKBACK - 1))
+    matrix = _matrix_from_ohlcv(ohlcv[begin:])
+    if last_obv is not None and start > begin:
+        matrix[:, OBV_COLUMN] += last_obv - matrix[start - begin - 1, OBV_COLUMN]
+    return matrix[start - begin:]
+
+def update_feature_cache(symbol: str, interval: str, candles,
+                         now_ms: int | None = None,
+                         cache_dir: str = CACHE_DIR) -> tuple[np.ndarray, np.ndarray]:
+    # candles 중 마감된 캔들까지 캐시를 갱신하고, candles 기간에 해당하는 피처 행을 돌려준다.
+    # 아직 마감되지 않은 마지막 캔들의 행은 캐시에 넣지 않고 결과에만 덧붙인다.
+    timestamps, ohlcv = _candle_columns(candles)
+    if len(timestamps) == 0:
+        return build_features(candles)
+
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    closed = int(np.searchsorted(timestamps + interval_to_ms(interval), now_ms, side="right"))
+
+    cache = FeatureCache(symbol, interval, cache_dir)
+    cached_ts, cached_rows = cache.read()
+    last_closed = int(cached_ts[-1]) if len(cached_ts) else None
+    position = int(np.searchsorted(timestamps, last_closed)) if last_closed is not None else -1
+
+    # 캐시가 받은 캔들보다 늦게 시작하면 (더 짧은 이력으로 먼저 만든 캐시) 앞쪽 행이 빠지므로 다시 만든다.
+    # 첫 LOOKBACK-1 개 캔들은 지표가 정의되지 않으므로 timestamps[LOOKBACK - 1] 이 만들 수 있는 첫 행이다.
+    starts_late = (last_closed is not None and closed >= LOOKBACK
+                   and cached_ts[0] > timestamps[LOOKBACK - 1] and last_closed <= timestamps[closed - 1])
+
+    if not starts_late and (closed == 0 or (last_closed is not None and last_closed >= timestamps[closed - 1])):
+        pass  # 새로 마감된 캔들 없음 → 캐시 그대로 사용
+    elif (not starts_late and last_closed is not None and position >= LOOKBACK - 1
+          and timestamps[position] == last_closed):
+        # 캐시에 이어서 새로 마감된 캔들의 행만 계산
+        new_rows = _rows_after(ohlcv[:closed], position + 1, float(cached_rows[-1, OBV_COLUMN]))
+        cache.write(timestamps[position + 1:closed], new_rows, append=True)
+        cached_ts, cached_rows = cache.read()
+    else:
+        # 캐시가 없거나, 캔들 구간과 이어지지 않거나, 앞쪽이 빠져 있으면 처음부터 다시 만든다
+        matrix = _matrix_from_ohlcv(ohlcv[:closed])
+        valid = ~np.isnan(matrix).any(axis=1)
+        cache.write(timestamps[:closed][valid], matrix[valid])
+        cached_ts, cached_rows = cache.read()
+
+    in_range = cached_ts >= timestamps[0]
+    result_ts, result_rows = cached_ts[in_range], np.array(cached_rows[in_range])
+
+    if closed < len(timestamps) and len(result_ts) and result_ts[-1] == timestamps[closed - 1]:
+        # 진행 중인 캔들
+        pending = _rows_after(ohlcv, closed, float(result_rows[-1, OBV_COLUMN]))
+        if np.isnan(pending).any():
+            return result_ts, result_rows
+        result_ts = np.concatenate([result_ts, timestamps[closed:]])
+        result_rows = np.vstack([result_rows, pending.astype(result_rows.dtype)])
+    return result_ts, result_rows
+
+# === 캔들 로드 ===
+def _resample_from_1m(symbol: str, interval: str, limit: int, store: KlineStore,
+                      now_ms: int | None = None) -> CandleSeries | None:
+    # 수집 데몬이 채우는 1분봉 저장소가 최신이고 limit 개 봉을 만들 만큼 길면 API 호출 없이 집계한다
+    step = interval_to_ms(interval)
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    last_closed = (now_ms // step) * step - step
+    last_1m = store.last_open_time(symbol, "1m")
+    if last_1m is None or last_1m + interval_to_ms("1m") < last_closed + step:
+        return None
+
+    start = last_closed - (limit - 1) * step
+    bars = resample(store.load(symbol, "1m", start, last_closed + step - 1), interval)
+    return bars if len(bars) >= limit else None
+
+def load_candles(symbol: str, interval: str, limit: int = 1000,
+                 binance: BinanceService | None = None,
+                 store: KlineStore | None = None) -> CandleSeries:
+    store = store or KlineStore()
+    if interval != "1m":
+        bars = _resample_from_1m(symbol, interval, limit, store)
+        if bars is not None:
+            return bars
+    # 로컬 저장소를 새로 마감된 캔들만큼 동기화한 뒤 디스크에서 읽는다
+    store.sync(symbol, interval, binance, initial_limit=limit)
+    return store.load(symbol, interval).tail(limit)
+
+# === 외부에서 호출할 함수 ===
+def load_features(symbol: str, interval: str, limit: int = 1000,
+                  binance: BinanceService | None = None,
+                  store: KlineStore | None = None) -> tuple[np.ndarray, np.ndarray]:
+    candles = load_candles(symbol, interval, limit, binance, store)
+    return update_feature_cache(symbol, interval, candles)
@@ -0,0 +1,73 @@
+"""
+incremental.py
+🔄 15m / 1h / 4h / 1d 모델 웜 스타트 증분 재학습 (공용)
+
+- 입력: 심볼 / 구간 + 현재 피처 행렬 (load_features 의 timestamps, data)
+- 처리: 레지스트리 최신 버전의 metadata.last_timestamp (학습 기준 시점) 이후 마감된 캔들이 타깃인 윈도우만 새로 만들고
+        → 그 이전 윈도우에서 최대 REPLAY_SIZE 개를 무작위로 섞어 (새 데이터에만 맞춰지는 것 방지)
+        → 저장된 모델 (옵티마이저 상태 포함) 을 FINE_TUNE_EPOCHS 에폭만 이어서 학습
+- 출력: 새 버전으로 등록 (metadata 에 새 기준 시점, 기반 버전, 새 / 재사용 윈도우 수 기록)
+        기준 시점 이후 새 캔들이 없으면 재학습하지 않고 기존 모델 경로를 돌려준다
+"""
+
+import numpy as np
+from features import FEATURE_COLUMNS
+from dataset import make_window_dataset
+from registry import ModelRegistry, get_registry
+from perf import FEATURE_DTYPE
+from windows import window_count
+
+REPLAY_SIZE = 256
+FINE_TUNE_EPOCHS = 3
+
+def split_windows(timestamps: np.ndarray, cutoff: int, seq_len: int,
+                  target_offset: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    # (이전 윈도우 번호, 새 윈도우 번호). 윈도우 i 의 타깃은 i + seq_len + target_offset 번째 행.
+    count = window_count(len(timestamps), seq_len, target_offset)
+    first_new = np.searchsorted(timestamps, cutoff, side="right") - seq_len - target_offset
+    first_new = int(np.clip(first_new, 0, count))
+    return np.arange(first_new), np.arange(first_new, count)
+
+def fine_tune_latest(symbol: str, interval: str, timestamps: np.ndarray, data: np.ndarray,
+                     seq_len: int, batch_size: int, replay_size: int = REPLAY_SIZE,
+                     epochs: int = FINE_TUNE_EPOCHS, registry: ModelRegistry | None = None,
+                     seed: int | None = None, verbose: int = 1) -> str | None:
+    # 이어서 학습할 모델이 없거나 (기준 시점이 기록되지 않은 예전 모델 포함) 데이터가 부족하면 None → 호출한 쪽이 전체 학습
+    registry = registry or get_registry()
+    latest = registry.latest(symbol, interval)
+    cutoff = (latest or {}).get("metadata", {}).get("last_timestamp")
+    if latest is None or cutoff is None:
+        print("⚠️ 이어서 학습할 모델 (또는 학습 기준 시점) 이 없어 처음부터 학습합니다.")
+        return None
+
+    timestamps = np.asarray(timestamps)
+    data = np.array(data, dtype=FEATURE_DTYPE)
+    old, new = split_windows(timestamps, int(cutoff), seq_len)
+    if len(old) + len(new) == 0:
+        print("❌ 학습에 필요한 데이터가 부족합니다.")
+        return None
+    if len(new) == 0:
+        print(f"✅ {interval} 기준 시점 이후 새로 마감된 캔들이 없습니다: {registry.path(latest)}")
+        return registry.path(latest)
+
+    rng = np.random.default_rng(seed)
+    replay = rng.choice(old, size=min(replay_size, len(old)), replace=False) if len(old) else old
+    indices = np.concatenate([replay, new])
+    print(f"🔄 [{symbol.upper()}] {interval} 증분 학습: 새 윈도우 {len(new)}개 + 재사용 {len(replay)}개, {epochs} 에폭 "
+          f"(기반 버전 {latest['version']})")
+
+    model = registry.load(symbol, interval, backend="keras")
+    train_ds = make_window_dataset(data, seq_len, batch_size, indices=indices,
+                                   shuffle_buffer=len(indices), scale=(data.min(axis=0), data.max(axis=0)),
+                                   seed=seed)
+    model.fit(train_ds, epochs=epochs, verbose=verbose)
+
+    model_path = registry.register(symbol, interval, model, {
+        "rows": len(data),
+        "last_timestamp": int(timestamps[-1]),
+        "columns": FEATURE_COLUMNS,
+        "base_version": latest["version"],
+        "incremental": {"new_windows": len(new), "replay_windows": len(replay), "epochs": epochs},
+    })
+    print(f"✅ 모델 업데이트 완료: {model_path}")
+    return model_path
@@ -0,0 +1,73 @@
+"""
+inference.py
+🔮 predict 스크립트 / 예측 서버 공용 추론 함수
+
+- 입력: 학습된 모델 + 피처 행렬 (load_features 의 data), 또는 여러 심볼의 피처 행렬 목록
+- 처리: 최근 60개 행을 창 단위 min-max 정규화 → 모델 예측 → OHLC 역정규화
+        여러 심볼은 (N, 60, F) 텐서 하나로 묶어 한 번에 forward pass
+- 출력: 다음 봉의 예측 [Open, High, Low, Close]
+"""
+
+import numpy as np
+from features import load_features
+from perf import FEATURE_DTYPE
+from registry import ModelRegistry, get_registry
+
+SEQUENCE_LENGTH = 60
+BATCH_SIZE = 256  # forward pass 한 번에 넣는 최대 창 개수
+
+def scale_windows(windows: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # (N, seq, F) 창을 창마다 자기 min/max 로 정규화한다
+    min_vals, max_vals = windows.min(axis=1), windows.max(axis=1)
+    scaled = (windows - min_vals[:, None]) / (max_vals - min_vals + 1e-8)[:, None]
+    return scaled, min_vals, max_vals
+
+def predict_ohlc_batch(model, datasets: list, seq_len: int = SEQUENCE_LENGTH,
+                       batch_size: int = BATCH_SIZE) -> list[np.ndarray | None]:
+    # 데이터셋마다 마지막 seq_len 행으로 창을 만들어 한꺼번에 예측한다 (데이터 부족이면 None)
+    valid = [i for i, data in enumerate(datasets) if len(data) >= seq_len]
+    results: list[np.ndarray | None] = [None] * len(datasets)
+    if not valid:
+        return results
+
+    windows = np.stack([np.asarray(datasets[i][-seq_len:], dtype=FEATURE_DTYPE) for i in valid])
+    scaled, min_vals, max_vals = scale_windows(windows)
+    scaled = scaled.astype(np.float32, copy=False)
+
+    # predict_on_batch 는 컴파일된 예측 함수를 재사용하면서 model.predict 의 데이터 어댑터 / 콜백 준비를 건너뛴다
+    # (eager 직접 호출은 LSTM 타임스텝 루프를 파이썬에서 돌아 훨씬 느리다)
+    pred_scaled = np.concatenate([
+        np.asarray(model.predict_on_batch(scaled[start:start + batch_size]))
+        for start in range(0, len(scaled), batch_size)
+    ])
+    predicted = pred_scaled[:, :4] * (max_vals[:, :4] - min_vals[:, :4] + 1e-8) + min_vals[:, :4]
+    for row, i in enumerate(valid):
+        results[i] = predicted[row]
+    return results
+
+def predict_ohlc(model, data, seq_len: int = SEQUENCE_LENGTH) -> np.ndarray | None:
+    # 데이터가 seq_len 개보다 적으면 None
+    return predict_ohlc_batch(model, [data], seq_len)[0]
+
+def predict_symbols(symbols: list[str], interval: str, model_symbol: str | None = None,
+                    registry: ModelRegistry | None = None,
+                    backend: str | None = None) -> dict[str, np.ndarray | None]:
+    # 여러 심볼의 다음 봉 OHLC. model_symbol 을 주면 그 심볼의 모델 하나로 전부 예측하고,
+    # 아니면 심볼별 최신 모델로 예측하되 같은 모델 파일을 쓰는 심볼끼리 묶어 forward pass 한 번에 처리한다.
+    # 모델이나 데이터가 없는 심볼은 None.
+    registry = registry or get_registry()
+    symbols = [s.upper() for s in symbols]
+    results: dict[str, np.ndarray | None] = {s: None for s in symbols}
+
+    groups: dict[str, list[str]] = {}
+    for symbol in symbols:
+        entry = registry.latest(model_symbol or symbol, interval)
+        if entry is not None:
+            groups.setdefault(entry["file"], []).append(symbol)
+
+    for members in groups.values():
+        model = registry.load(model_symbol or members[0], interval, backend=backend)
+        datasets = [load_features(symbol, interval)[1] for symbol in members]
+        for symbol, predicted in zip(members, predict_ohlc_batch(model, datasets)):
+            results[symbol] = predicted
+    return results
@@ -0,0 +1,185 @@
+"""
+multi_timeframe.py
+🧩 멀티 타임프레임 모델 (15m / 1h / 4h / 1d 를 그래프 하나로) 학습 + 예측
+
+- 입력: 심볼 (예: python ml/multi_timeframe.py BTC [--predict])
+- 모델: 타임프레임마다 (60, F) 입력 → 배치 축으로 쌓아 공유 LSTM 트렁크를 한 번에 통과 → 타임프레임별 OHLC 헤드
+        → fit 한 번으로 네 타임프레임을 함께 학습하고, predict_on_batch 한 번으로 네 타임프레임을 예측
+- 학습 샘플: 타임프레임마다 가장 최근 윈도우를 같은 개수만큼 잘라 배치 단위로 짝지음
+             (헤드는 자기 타임프레임 인코딩만 보므로 타임프레임 사이의 짝은 임의여도 된다)
+- 출력: models/mtf_{SYMBOL}_{VERSION}.keras 로 저장하고 레지스트리에 "mtf" 구간으로 등록
+        (기존 train_15m/1h/4h/1d.py 의 모델과 별개로 선택해서 쓰는 모델)
+"""
+
+import argparse
+import numpy as np
+from features import FEATURE_COLUMNS, load_features
+from dataset import SHUFFLE_BUFFER, make_window_dataset
+from inference import scale_windows
+from perf import FEATURE_DTYPE, JIT_FIT
+from registry import ModelRegistry, get_registry
+from windows import window_count
+
+INTERVALS = ["15m", "1h", "4h", "1d"]
+MODEL_INTERVAL = "mtf"  # 레지스트리 구간 이름
+
+# === 하이퍼파라미터 설정 ===
+SEQUENCE_LENGTH = 60
+EPOCHS = 150
+BATCH_SIZE = 64
+VALIDATION_SPLIT = 0.2
+EARLY_STOPPING_PATIENCE = 50
+
+def input_name(interval: str) -> str:
+    return f"x_{interval}"
+
+def head_name(interval: str) -> str:
+    return f"ohlc_{interval}"
+
+# === 모델 ===
+def build_multi_model(n_features: int, intervals: list[str] = INTERVALS,
+                      seq_len: int = SEQUENCE_LENGTH):
+    # 네 입력을 배치 축으로 이어 붙여 공유 트렁크를 한 번만 통과시킨 뒤 (LSTM 타임스텝 루프 1회)
+    # 다시 타임프레임별로 나눠 각 헤드에 넣는다. 그래서 모든 입력의 배치 크기가 같아야 한다.
+    # intervals 가 하나면 train_15m/1h/4h/1d.py 의 단일 모델과 같은 구조가 된다 (bench_multi.py 의 비교 기준).
+    from tensorflow.keras import Input, Model, ops
+    from tensorflow.keras.layers import LSTM, Dense, Dropout
+
+    inputs = {input_name(iv): Input(shape=(seq_len, n_features), name=input_name(iv)) for iv in intervals}
+    stacked = ops.concatenate(list(inputs.values()), axis=0) if len(intervals) > 1 else inputs[input_name(intervals[0])]
+    encoded = LSTM(64, return_sequences=True, name="trunk_lstm_1")(stacked)
+    encoded = Dropout(0.2, name="trunk_dropout")(encoded)
+    encoded = LSTM(32, name="trunk_lstm_2")(encoded)
+    parts = ops.split(encoded, len(intervals), axis=0) if len(intervals) > 1 else [encoded]
+
+    outputs = {}
+    for interval, part in zip(intervals, parts):
+        hidden = Dense(32, activation='relu', name=f"hidden_{interval}")(part)
+        outputs[head_name(interval)] = Dense(4, name=head_name(interval))(hidden)  # OHLC
+
+    model = Model(inputs=inputs, outputs=outputs)
+    model.compile(optimizer='adam', loss='mse', jit_compile=JIT_FIT)
+    return model
+
+# === 데이터셋 ===
+def _zip_datasets(datasets: dict):
+    import tensorflow as tf
+    intervals = list(datasets)
+
+    def to_dicts(*pairs):
+        return ({input_name(iv): x for iv, (x, _) in zip(intervals, pairs)},
+                {head_name(iv): y for iv, (_, y) in zip(intervals, pairs)})
+
+    return tf.data.Dataset.zip(tuple(datasets.values())).map(to_dicts)
+
+def make_multi_datasets(features: dict[str, np.ndarray], seq_len: int = SEQUENCE_LENGTH,
+                        batch_size: int = BATCH_SIZE, validation_split: float = VALIDATION_SPLIT,
+                        seed: int | None = None):
+    # 타임프레임마다 같은 개수 (가장 짧은 쪽 기준) 의 최근 윈도우를 쓰고, 뒤쪽 validation_split 비율을 검증용으로 쓴다.
+    # 윈도우 개수가 같으므로 타임프레임별 배치 크기도 항상 같다. 윈도우가 없으면 (None, None).
+    counts = {iv: window_count(len(data), seq_len) for iv, data in features.items()}
+    count = min(counts.values())
+    split = int((1 - validation_split) * count)
+    if split == 0 or split == count:
+        return None, None
+
+    train, val = {}, {}
+    for interval, data in features.items():
+        offset = counts[interval] - count
+        scale = (data.min(axis=0), data.max(axis=0))
+        train[interval] = make_window_dataset(data, seq_len, batch_size,
+                                              indices=np.arange(offset, offset + split),
+                                              shuffle_buffer=SHUFFLE_BUFFER, scale=scale, seed=seed)
+        val[interval] = make_window_dataset(data, seq_len, batch_size,
+                                            indices=np.arange(offset + split, offset + count), scale=scale)
+    return _zip_datasets(train), _zip_datasets(val)
+
+# === 학습 ===
+def train_multi_model(symbol: str, features: dict[str, tuple[np.ndarray, np.ndarray]] | None = None,
+                      verbose: int = 1) -> str | None:
+    # features: {interval: (timestamps, data)}. 없으면 타임프레임마다 load_features 로 불러온다.
+    from tensorflow.keras.callbacks import EarlyStopping
+
+    symbol = symbol.upper()
+    print(f"📚 [{symbol}] 멀티 타임프레임 ({', '.join(INTERVALS)}) 학습 시작...")
+    if features is None:
+        features = {iv: load_features(symbol, iv) for iv in INTERVALS}
+    data = {iv: np.asarray(features[iv][1], dtype=FEATURE_DTYPE) for iv in INTERVALS}
+
+    train_ds, val_ds = make_multi_datasets(data)
+    if train_ds is None:
+        print("❌ 학습에 필요한 데이터가 부족합니다.")
+        return None
+
+    model = build_multi_model(len(FEATURE_COLUMNS))
+    early_stop = EarlyStopping(patience=EARLY_STOPPING_PATIENCE, restore_best_weights=True)
+    model.fit(train_ds, epochs=EPOCHS, validation_data=val_ds, callbacks=[early_stop], verbose=verbose)
+
+    # 입력이 여러 개인 모델은 배치 1 고정 TFLite 변환 대상이 아니므로 Keras 파일만 저장한다
+    model_path = get_registry().register(symbol, MODEL_INTERVAL, model, {
+        "intervals": INTERVALS,
+        "rows": {iv: len(data[iv]) for iv in INTERVALS},
+        "last_timestamp": {iv: int(features[iv][0][-1]) for iv in INTERVALS},
+        "columns": FEATURE_COLUMNS,
+    }, export=())
+    print(f"✅ 모델 저장 완료: {model_path}")
+    return model_path
+
+# === 예측 ===
+def predict_multi(model, features: dict[str, np.ndarray],
+                  seq_len: int = SEQUENCE_LENGTH) -> dict[str, np.ndarray | None]:
+    # 타임프레임별 최근 seq_len 행을 창 단위로 정규화해 forward pass 한 번에 예측한다.
+    # 데이터가 부족한 타임프레임은 0 창을 넣고 결과를 None 으로 돌려준다.
+    n_features = len(FEATURE_COLUMNS)
+    inputs, ranges, results = {}, {}, {}
+    for interval in INTERVALS:
+        data = features.get(interval)
+        if data is None or len(data) < seq_len:
+            inputs[input_name(interval)] = np.zeros((1, seq_len, n_features), dtype=np.float32)
+            continue
+        scaled, min_vals, max_vals = scale_windows(np.asarray(data[-seq_len:], dtype=FEATURE_DTYPE)[np.newaxis])
+        inputs[input_name(interval)] = scaled.astype(np.float32)
+        ranges[interval] = (min_vals[0, :4], max_vals[0, :4])
+
+    outputs = model.predict_on_batch(inputs)
+    for interval in INTERVALS:
+        if interval not in ranges:
+            results[interval] = None
+            continue
+        min_vals, max_vals = ranges[interval]
+        results[interval] = np.asarray(outputs[head_name(interval)])[0] * (max_vals - min_vals + 1e-8) + min_vals
+    return results
+
+def predict_next_all(symbol: str, registry: ModelRegistry | None = None) -> dict[str, np.ndarray | None] | None:
+    # 레지스트리의 최신 멀티 타임프레임 모델로 네 타임프레임의 다음 봉 OHLC (모델이 없으면 None)
+    model = (registry or get_registry()).load(symbol, MODEL_INTERVAL, backend="keras")
+    if model is None:
+        return None
+    return predict_multi(model, {iv: load_features(symbol, iv)[1] for iv in INTERVALS})
+
+# === 실행 ===
+def main():
+    parser = argparse.ArgumentParser(description="멀티 타임프레임 모델 학습 / 예측")
+    parser.add_argument("symbol")
+    parser.add_argument("--predict", action="store_true", help="학습 대신 최신 모델로 예측")
+    args = parser.parse_args()
+    symbol = args.symbol.upper()
+
+    if not args.predict:
+        train_multi_model(symbol)
+        return
+
+    predictions = predict_next_all(symbol)
+    if predictions is None:
+        print(f"❌ 모델이 없습니다: models/{MODEL_INTERVAL}_{symbol}_*.keras")
+        return
+    for interval, predicted in predictions.items():
+        if predicted is None:
+            print(f"❌ [{symbol}] {interval} 예측에 필요한 데이터 부족 (최소 {SEQUENCE_LENGTH}개 필요)")
+            continue
+        pred_open, pred_high, pred_low, pred_close = predicted
+        print(f"🔮 [{symbol}] {interval} 다음 봉 예측: "
+              f"Open {pred_open:.2f} / High {pred_high:.2f} / Low {pred_low:.2f} / Close {pred_close:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+perf.py
+🏎️ CPU 성능 모드 (opt-in, 기본값은 모두 기존 동작)
+
+- ML_PERF=1          : 아래에서 (perf) 표시된 항목을 한꺼번에 켠다 (개별 변수를 주면 그 값이 우선)
+- ML_JIT_FIT=1       : 학습 모델을 compile(jit_compile=True) 로 XLA 컴파일
+                       (CPU 의 LSTM 학습은 XLA 가 오히려 느린 경우가 많아 ML_PERF 에 포함하지 않는다 → bench_perf.py 로 확인)
+- ML_JIT_PREDICT=1   : (perf) keras_compiled 백엔드의 예측 함수를 XLA 로 컴파일
+- ML_FLOAT32=1       : (perf) 피처 캐시 파일 (features.f4) · load_features 가 돌려주는 피처 행렬 · 창 정규화를 float32 로
+                       (지표 계산만 float64. numpy 기본 float64 대비 디스크 · 메모리 · 변환 비용 절반)
+- ML_ONEDNN=0|1      : TF_ENABLE_ONEDNN_OPTS (TensorFlow 를 import 하기 전에만 적용된다)
+- ML_INTRA_THREADS / ML_INTER_THREADS : TensorFlow 스레드 풀 크기 (TF_NUM_INTRAOP_THREADS / TF_NUM_INTEROP_THREADS)
+- 고정 shape 예측: ML_BACKEND=keras_compiled (ML_PERF=1 이면 기본) → CompiledPredictor
+  배치 크기를 PREDICT_BUCKETS 중 하나로 0 패딩해서, 심볼 수가 바뀔 때마다 다시 트레이싱 / XLA 컴파일하지 않는다
+- 이 모듈은 TensorFlow 를 import 하지 않는다. import 되는 시점에 TensorFlow 용 환경 변수를 설정하므로
+  registry / dataset 처럼 TensorFlow 보다 먼저 import 되는 모듈에서 불러온다.
+"""
+
+import os
+import sys
+import numpy as np
+
+def _flag(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    return default if value is None else value.strip().lower() in ("1", "true", "yes", "on")
+
+PERF_MODE = _flag("ML_PERF")
+JIT_FIT = _flag("ML_JIT_FIT")
+JIT_PREDICT = _flag("ML_JIT_PREDICT", PERF_MODE)
+FLOAT32 = _flag("ML_FLOAT32", PERF_MODE)
+FEATURE_DTYPE = np.float32 if FLOAT32 else np.float64
+PREDICT_BUCKETS = (1, 8, 64, 256)
+
+# ML_* → TensorFlow 가 import 될 때 읽는 환경 변수 (직접 TF_* 를 준 경우는 그대로 둔다)
+_TF_ENVIRONMENT = {
+    "ML_ONEDNN": "TF_ENABLE_ONEDNN_OPTS",
+    "ML_INTRA_THREADS": "TF_NUM_INTRAOP_THREADS",
+    "ML_INTER_THREADS": "TF_NUM_INTEROP_THREADS",
+}
+
+def apply_environment():
+    for source, target in _TF_ENVIRONMENT.items():
+        if os.environ.get(source) is None:
+            continue
+        if "tensorflow" in sys.modules:
+            print(f"⚠️ {source} 는 TensorFlow 를 import 하기 전에 설정해야 적용됩니다.")
+        os.environ.setdefault(target, os.environ[source])
+
+apply_environment()
+
+def settings() -> dict:
+    # 벤치마크 / 로그용 현재 설정
+    return {
+        "perf_mode": PERF_MODE, "jit_fit": JIT_FIT, "jit_predict": JIT_PREDICT, "float32": FLOAT32,
+        **{target: os.environ.get(target) for target in _TF_ENVIRONMENT.values()},
+    }
+
+class CompiledPredictor:
+    # Keras 모델을 입력 shape 고정 tf.function 으로 감싼 예측 백엔드 (TFLiteModel 과 같은 predict_on_batch / predict).
+    # 버킷 크기마다 한 번만 트레이싱하고, 버킷보다 큰 입력은 가장 큰 버킷 단위로 나눠 넣는다.
+    def __init__(self, model, jit_compile: bool = JIT_PREDICT, buckets: tuple[int, ...] = PREDICT_BUCKETS):
+        import tensorflow as tf
+        self.model = model
+        self.input_shape = model.input_shape
+        self.buckets = tuple(sorted(buckets))
+        _, seq_len, features = model.input_shape
+        self._functions = {
+            size: tf.function(lambda x: model(x, training=False),
+                              input_signature=[tf.TensorSpec([size, seq_len, features], tf.float32)],
+                              jit_compile=jit_compile)
+            for size in self.buckets
+        }
+
+    def _bucket(self, n: int) -> int:
+        return next((size for size in self.buckets if size >= n), self.buckets[-1])
+
+    def predict_on_batch(self, x) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float32)
+        outputs = []
+        for start in range(0, len(x), self.buckets[-1]):
+            chunk = x[start:start + self.buckets[-1]]
+            n, size = len(chunk), self._bucket(len(chunk))
+            if n < size:
+                chunk = np.concatenate([chunk, np.zeros((size - n, *chunk.shape[1:]), dtype=np.float32)])
+            outputs.append(np.asarray(self._functions[size](chunk))[:n])
+        return np.concatenate(outputs)
+
+    def predict(self, x, verbose=0) -> np.ndarray:
+        return self.predict_on_batch(x)
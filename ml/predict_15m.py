@@ -2,122 +2,62 @@
 predict-15m.py
 🔮 Binance 15분봉 데이터 기반 ML 예측 스크립트
 
-- 입력: 심볼명 (예: BTC, ETH)
+- 입력: 심볼명 (예: BTC, ETH / 여러 개면 BTC,ETH,SOL)
+        --model-symbol BTC: 모든 심볼을 BTC 모델 하나로 예측 → (N, 60, F) 창 하나로 forward pass 한 번
+        (주지 않으면 심볼마다 자기 모델이라 심볼 수만큼 forward pass)
 - 처리: 최신 15분봉 데이터 수집 → 기술적 지표 계산 → 정규화 → LSTM 모델 예측
 - 출력: 다음 15분의 예측 Close 가격 출력
 """
 
-import numpy as np
-import os
-from tensorflow.keras.models import load_model
-from services.BinanceService import BinanceService
+import argparse
+from features import load_features
+from inference import predict_ohlc, predict_symbols
+from registry import load_latest_model
 
-# === 기술적 지표 계산 함수 ===
-def calculate_sma(prices, period):
-    return np.mean(prices[-period:]) if len(prices) >= period else np.nan
-
-def calculate_ema(prices, period):
-    if len(prices) < period:
-        return np.nan
-    k = 2 / (period + 1)
-    ema = prices[-period]
-    for price in prices[-period + 1:]:
-        ema = price * k + ema * (1 - k)
-    return ema
-
-def calculate_rsi(prices, period=14):
-    if len(prices) < period + 1:
-        return np.nan
-    gains, losses = 0, 0
-    for i in range(-period, 0):
-        diff = prices[i] - prices[i - 1]
-        gains += max(0, diff)
-        losses += max(0, -diff)
-    if losses == 0:
-        return 100
-    rs = gains / losses
-    return 100 - (100 / (1 + rs))
-
-def calculate_macd(prices, short=12, long=26):
-    if len(prices) < long:
-        return np.nan
-    return calculate_ema(prices, short) - calculate_ema(prices, long)
-
-def calculate_atr(candles, period=14):
-    if len(candles) < period + 1:
-        return np.nan
-    trs = []
-    for i in range(-period, 0):
-        high, low, prev_close = candles[i].high, candles[i].low, candles[i - 1].close
-        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-        trs.append(tr)
-    return np.mean(trs)
-
-def calculate_obv(candles):
-    obv = 0
-    prev_close = candles[0].close
-    for c in candles[1:]:
-        if c.close > prev_close:
-            obv += c.volume
-        elif c.close < prev_close:
-            obv -= c.volume
-        prev_close = c.close
-    return obv
-
-# === 최신 모델 경로 찾기 ===
-def get_latest_model_path(symbol, model_dir="models"):
-    files = [f for f in os.listdir(model_dir) if f.startswith(f"15m_{symbol}_") and f.endswith(".keras")]
-    if not files:
-        return None
-    latest_model = max(files, key=lambda x: x.split(f"15m_{symbol}_")[-1].replace(".keras", ""))
-    return os.path.join(model_dir, latest_model)
+# === 출력 ===
+def print_prediction(symbol: str, predicted_ohlc):
+    open_p, high_p, low_p, close_p = predicted_ohlc
+    print(f"🔮 [{symbol}] 15분 후 예상 가격")
+    print(f"    Open : {open_p:.2f} USD")
+    print(f"    Close: {close_p:.2f} USD")
+    print(f"    High : {high_p:.2f} USD")
+    print(f"    Low  : {low_p:.2f} USD")
 
 # === 예측 함수 ===
 def predict_next_15m(symbol: str):
-    model_path = get_latest_model_path(symbol)
-    if model_path is None:
+    model = load_latest_model(symbol, "15m")
+    if model is None:
         print(f"❌ 모델이 없습니다: models/15m_{symbol}_*.keras")
         return
 
-    model = load_model(model_path)
-    binance = BinanceService()
-    candles = binance.fetch_historical_candle_data(symbol, 1000, interval="15m")
-    closes = [c.close for c in candles]
-    data = []
-    for i, c in enumerate(candles):
-        sma = calculate_sma(closes[:i+1], 20)
-        ema = calculate_ema(closes[:i+1], 20)
-        rsi = calculate_rsi(closes[:i+1])
-        macd = calculate_macd(closes[:i+1])
-        atr = calculate_atr(candles[:i+1])
-        obv = calculate_obv(candles[:i+1])
-        if any(np.isnan(x) for x in [sma, ema, rsi, macd, atr, obv]):
-            continue
-        row = [c.open, c.high, c.low, c.close, sma, ema, rsi, macd, atr, obv]
-        data.append(row)
+    _, data = load_features(symbol, "15m")
 
-    if len(data) < 60:
+    predicted_ohlc = predict_ohlc(model, data)
+    if predicted_ohlc is None:
         print("❌ 예측에 필요한 데이터 부족 (최소 60개 필요)")
         return
 
-    recent_data = np.array(data[-60:])
-    min_vals, max_vals = recent_data.min(axis=0), recent_data.max(axis=0)
-    scaled = (recent_data - min_vals) / (max_vals - min_vals + 1e-8)
+    print_prediction(symbol, predicted_ohlc)
 
-    X = scaled.reshape((1, 60, scaled.shape[1]))
-    pred_scaled = model.predict(X)[0]
-    predicted_ohlc = [
-        pred_scaled[i] * (max_vals[i] - min_vals[i] + 1e-8) + min_vals[i]
-        for i in range(4)
-    ]
-    open_p, high_p, low_p, close_p = predicted_ohlc
-    print(f"🔮 [{symbol}] 15분 후 예상 가격")
-    print(f"    Open : {open_p:.2f} USD")
-    print(f"    Close: {close_p:.2f} USD")
-    print(f"    High : {high_p:.2f} USD")
-    print(f"    Low  : {low_p:.2f} USD")
+# === 여러 심볼 한 번에 예측 ===
+def predict_many(symbols: list[str], model_symbol: str | None = None):
+    # 같은 모델을 쓰는 심볼끼리 (N, 60, F) 창 하나로 묶어 forward pass 한 번에 예측한다.
+    # 심볼마다 자기 모델이 있으면 묶이지 않으므로, 전부 한 번에 예측하려면 model_symbol 을 준다.
+    for symbol, predicted_ohlc in predict_symbols(symbols, "15m", model_symbol).items():
+        if predicted_ohlc is None:
+            print(f"❌ [{symbol}] 모델 또는 예측에 필요한 데이터가 없습니다")
+            continue
+        print_prediction(symbol, predicted_ohlc)
 
 # === 실행 ===
 if __name__ == "__main__":
-    symbol_input = input("예측할 심볼 입력 (예: BTC): ").strip().upper()
-    predict_next_15m(symbol_input)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="15분봉 모델 예측")
+    parser.add_argument("symbols", nargs="*", help="예측할 심볼 (없으면 입력 받음)")
+    parser.add_argument("--model-symbol", help="모든 심볼을 이 심볼의 모델 하나로 한 번에 예측")
+    args = parser.parse_args()
+    symbols = args.symbols or [input("예측할 심볼 입력 (예: BTC 또는 BTC,ETH,SOL): ")]
+    symbols = [s.strip().upper() for arg in symbols for s in arg.split(",") if s.strip()]
+    if len(symbols) == 1 and not args.model_symbol:
+        predict_next_15m(symbols[0])
+    else:
+        predict_many(symbols, args.model_symbol)
@@ -2,121 +2,64 @@
 predict-1h.py
 🔮 Binance 1시간봉 데이터 기반 ML 예측 스크립트
 
-- 입력: 심볼명 (예: BTC, ETH)
+- 입력: 심볼명 (예: BTC, ETH / 여러 개면 BTC,ETH,SOL)
+        --model-symbol BTC: 모든 심볼을 BTC 모델 하나로 예측 → (N, 60, F) 창 하나로 forward pass 한 번
+        (주지 않으면 심볼마다 자기 모델이라 심볼 수만큼 forward pass)
 - 처리: 최신 1시간봉 데이터 수집 → 기술적 지표 계산 → 정규화 → LSTM 모델 예측
 - 출력: 다음 1시간의 예측 Close 가격 출력
 """
 
-import numpy as np
-import os
-from tensorflow.keras.models import load_model
-from services.BinanceService import BinanceService
+import argparse
+from features import load_features
+from inference import predict_ohlc, predict_symbols
+from registry import load_latest_model
 
-# === 기술적 지표 계산 함수 ===
-def calculate_sma(prices, period):
-    return np.mean(prices[-period:]) if len(prices) >= period else np.nan
-
-def calculate_ema(prices, period):
-    if len(prices) < period:
-        return np.nan
-    k = 2 / (period + 1)
-    ema = prices[-period]
-    for price in prices[-period + 1:]:
-        ema = price * k + ema * (1 - k)
-    return ema
-
-def calculate_rsi(prices, period=14):
-    if len(prices) < period + 1:
-        return np.nan
-    gains, losses = 0, 0
-    for i in range(-period, 0):
-        diff = prices[i] - prices[i - 1]
-        gains += max(0, diff)
-        losses += max(0, -diff)
-    if losses == 0:
-        return 100
-    rs = gains / losses
-    return 100 - (100 / (1 + rs))
-
-def calculate_macd(prices, short=12, long=26):
-    if len(prices) < long:
-        return np.nan
-    return calculate_ema(prices, short) - calculate_ema(prices, long)
-
-def calculate_atr(candles, period=14):
-    if len(candles) < period + 1:
-        return np.nan
-    trs = []
-    for i in range(-period, 0):
-        high = candles[i].high
-        low = candles[i].low
-        prev_close = candles[i - 1].close
-        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-        trs.append(tr)
-    return np.mean(trs)
+# === 출력 ===
+def print_prediction(symbol: str, predicted_prices):
+    pred_open, pred_high, pred_low, pred_close = predicted_prices
 
-def calculate_obv(candles):
-    obv = 0
-    prev_close = candles[0].close
-    for c in candles[1:]:
-        if c.close > prev_close:
-            obv += c.volume
-        elif c.close < prev_close:
-            obv -= c.volume
-        prev_close = c.close
-    return obv
+    # 출력: 다음 1시간의 예측 Open, High, Low, Close 가격 출력
+    print(f"🔮 [{symbol}] 다음 1시간 예측 가격:")
+    print(f"- Open:  {pred_open:.2f}")
+    print(f"- Close: {pred_close:.2f}")
+    print(f"- High:  {pred_high:.2f}")
+    print(f"- Low:   {pred_low:.2f}")
 
 # === 예측 함수 ===
 def predict_next(symbol: str):
-    model_dir = "models"
-    available_models = [f for f in os.listdir(model_dir) if f.startswith(f"1h_{symbol}_") and f.endswith(".keras")]
-    if not available_models:
+    model = load_latest_model(symbol, "1h")
+    if model is None:
         print(f"❌ 모델이 없습니다: models/1h_{symbol}_*.keras")
         return
 
-    latest_model = sorted(available_models)[-1]
-    model_path = os.path.join(model_dir, latest_model)
-    model = load_model(model_path)
-
-    binance = BinanceService()
-    candles = binance.fetch_historical_candle_data(symbol, 1000, interval="1h")
+    _, data = load_features(symbol, "1h")
 
-    closes = [c.close for c in candles]
-    data = []
-    for i, c in enumerate(candles):
-        sma = calculate_sma(closes[:i + 1], 20)
-        ema = calculate_ema(closes[:i + 1], 20)
-        rsi = calculate_rsi(closes[:i + 1])
-        macd = calculate_macd(closes[:i + 1])
-        atr = calculate_atr(candles[:i + 1])
-        obv = calculate_obv(candles[:i + 1])
-        if any(np.isnan(val) for val in [sma, ema, rsi, macd, atr, obv]):
-            continue
-        row = [c.open, c.high, c.low, c.close, sma, ema, rsi, macd, atr, obv]
-        data.append(row)
-
-    if len(data) < 60:
+    predicted_prices = predict_ohlc(model, data)
+    if predicted_prices is None:
         print("❌ 예측에 필요한 데이터 부족 (최소 60개 필요)")
         return
 
-    recent = np.array(data[-60:])
-    min_vals = recent.min(axis=0)
-    max_vals = recent.max(axis=0)
-    scaled = (recent - min_vals) / (max_vals - min_vals + 1e-8)
-
-    X = scaled.reshape((1, 60, scaled.shape[1]))
-    pred_scaled = model.predict(X)[0]  # shape (4,)
-    predicted_prices = pred_scaled[:4] * (max_vals[:4] - min_vals[:4] + 1e-8) + min_vals[:4]
-    pred_open, pred_high, pred_low, pred_close = predicted_prices
+    print_prediction(symbol, predicted_prices)
 
-    # 출력: 다음 1시간의 예측 Open, High, Low, Close 가격 출력
-    print(f"🔮 [{symbol}] 다음 1시간 예측 가격:")
-    print(f"- Open:  {pred_open:.2f}")
-    print(f"- Close: {pred_close:.2f}")
-    print(f"- High:  {pred_high:.2f}")
-    print(f"- Low:   {pred_low:.2f}")
+# === 여러 심볼 한 번에 예측 ===
+def predict_many(symbols: list[str], model_symbol: str | None = None):
+    # 같은 모델을 쓰는 심볼끼리 (N, 60, F) 창 하나로 묶어 forward pass 한 번에 예측한다.
+    # 심볼마다 자기 모델이 있으면 묶이지 않으므로, 전부 한 번에 예측하려면 model_symbol 을 준다.
+    for symbol, predicted_prices in predict_symbols(symbols, "1h", model_symbol).items():
+        if predicted_prices is None:
+            print(f"❌ [{symbol}] 모델 또는 예측에 필요한 데이터가 없습니다")
+            continue
+        print_prediction(symbol, predicted_prices)
 
 # === 실행 ===
 if __name__ == "__main__":
-    symbol_input = input("예측할 심볼 입력 (예: BTC): ").strip().upper()
-    predict_next(symbol_input)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="1시간봉 모델 예측")
+    parser.add_argument("symbols", nargs="*", help="예측할 심볼 (없으면 입력 받음)")
+    parser.add_argument("--model-symbol", help="모든 심볼을 이 심볼의 모델 하나로 한 번에 예측")
+    args = parser.parse_args()
+    symbols = args.symbols or [input("예측할 심볼 입력 (예: BTC 또는 BTC,ETH,SOL): ")]
+    symbols = [s.strip().upper() for arg in symbols for s in arg.split(",") if s.strip()]
+    if len(symbols) == 1 and not args.model_symbol:
+        predict_next(symbols[0])
+    else:
+        predict_many(symbols, args.model_symbol)
@@ -0,0 +1,49 @@
+"""
+predict_client.py
+📡 예측 서버(predict_server.py) 클라이언트
+
+- TensorFlow 를 import 하지 않으므로 main.py / predict_summary.py 에서 가볍게 불러 쓸 수 있다
+- 사용: PredictionClient().predict("BTC", "1h") → {"open", "high", "low", "close", "timestamp", "version", ...}
+"""
+
+import requests
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+INTERVAL_LABELS = {"15m": "15분", "1h": "1시간", "4h": "4시간", "1d": "1일"}
+
+class PredictionClient:
+    def __init__(self, host: str = HOST, port: int = PORT, timeout: float = 5.0):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def available(self) -> bool:
+        # 서버가 떠 있는지 확인 (연결 실패면 False)
+        try:
+            return self.session.get(f"{self.base_url}/health", timeout=self.timeout).ok
+        except requests.RequestException:
+            return False
+
+    def predict(self, symbol: str, interval: str) -> dict:
+        # 모델이 없거나 데이터가 부족하면 서버가 보낸 메시지로 RuntimeError 를 던진다
+        res = self.session.get(f"{self.base_url}/predict",
+                               params={"symbol": symbol.upper(), "interval": interval},
+                               timeout=self.timeout)
+        body = res.json()
+        if not res.ok:
+            raise RuntimeError(body.get("error", f"HTTP {res.status_code}"))
+        return body
+
+    def close(self):
+        self.session.close()
+
+def print_prediction(result: dict):
+    label = INTERVAL_LABELS.get(result["interval"], result["interval"])
+    stale = " (⚠️ 최신 캔들 반영 실패, 이전 예측)" if result.get("stale") else ""
+    print(f"🔮 [{result['symbol']}] 다음 {label} 예측 OHLC{stale}:")
+    print(f"    Open : {result['open']:.2f} USD")
+    print(f"    Close: {result['close']:.2f} USD")
+    print(f"    High : {result['high']:.2f} USD")
+    print(f"    Low  : {result['low']:.2f} USD")
@@ -0,0 +1,239 @@
+"""
+predict_server.py
+🛰️ 모델을 메모리에 올려 두고 예측 요청에 바로 답하는 로컬 예측 서버 (localhost HTTP)
+
+- 입력: 심볼 목록 / 구간 목록 (예: python ml/predict_server.py BTC ETH --intervals 15m 1h 4h 1d --backend tflite)
+- 처리: 시작할 때 레지스트리의 최신 모델과 피처를 모두 로드
+        → 백그라운드 스레드가 새 봉이 마감될 때마다 피처를 증분 갱신하고 예측을 미리 계산
+        → 요청은 메모리에 있는 예측을 바로 돌려준다 (새로 학습된 모델은 레지스트리 인덱스로 감지)
+- API:  GET /predict?symbol=BTC&interval=1h → {"symbol", "interval", "open", "high", "low", "close", "timestamp", "version", "stale"}
+        GET /health → {"status": "ok", "loaded": ["BTC/1h", ...]}
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from features import load_features
+from inference import SEQUENCE_LENGTH, predict_ohlc
+from predict_client import HOST, PORT
+from registry import ModelRegistry, get_registry
+from tflite_model import BACKENDS, DEFAULT_BACKEND
+from services.BinanceService import BinanceService
+from services.KlineStore import KlineStore
+from utils.Intervals import interval_to_ms
+
+INTERVALS = ["15m", "1h", "4h", "1d"]
+
+# === 설정 ===
+FEATURE_CANDLES = 200    # 갱신할 때 읽는 캔들 수 (지표 LOOKBACK + 60개 창이면 충분)
+                         # 저장소 / 피처 캐시를 학습 스크립트와 함께 쓰지만, 나중에 더 긴 이력을 요청하면
+                         # KlineStore.sync 가 앞쪽 캔들을 채우고 피처 캐시도 다시 만든다
+REFRESH_INTERVAL = 5.0   # 백그라운드 갱신 주기 (초)
+RETRY_DELAY = 10.0       # 새 봉이 아직 안 잡혔을 때 다시 동기화하기까지 기다리는 시간 (초)
+
+class _Entry:
+    # (심볼, 구간) 하나의 모델 / 피처 / 마지막 예측
+    def __init__(self, symbol: str, interval: str):
+        self.symbol = symbol
+        self.interval = interval
+        self.step = interval_to_ms(interval)
+        self.lock = threading.Lock()
+        self.data = None
+        self.last_timestamp = None  # 피처 마지막 행(마감된 봉)의 open_time
+        self.synced_at = 0.0
+        self.version = None
+        self.created = None
+        self.result = None
+        self.stale = False
+
+class PredictionService:
+    def __init__(self, registry: ModelRegistry | None = None, store: KlineStore | None = None,
+                 binance: BinanceService | None = None, backend: str | None = None):
+        self.registry = registry or get_registry()
+        self.backend = backend
+        self.store = store or KlineStore()
+        self.binance = binance or BinanceService()
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._entries_lock = threading.Lock()
+
+    def _entry(self, symbol: str, interval: str) -> _Entry:
+        key = (symbol.upper(), interval)
+        with self._entries_lock:
+            if key not in self._entries:
+                interval_to_ms(interval)  # 지원하지 않는 구간이면 ValueError
+                self._entries[key] = _Entry(*key)
+            return self._entries[key]
+
+    @property
+    def loaded(self) -> list[str]:
+        with self._entries_lock:
+            return [f"{e.symbol}/{e.interval}" for e in self._entries.values() if e.result is not None]
+
+    def _needs_sync(self, entry: _Entry, now_ms: int) -> bool:
+        if entry.data is None:
+            return True
+        # 다음 봉이 마감되었고, 방금 동기화에 실패/미반영된 게 아니면 다시 읽는다
+        next_closed = entry.last_timestamp + 2 * entry.step <= now_ms
+        return next_closed and time.monotonic() - entry.synced_at >= RETRY_DELAY
+
+    def refresh(self, symbol: str, interval: str, now_ms: int | None = None) -> _Entry:
+        # 새로 마감된 봉이 있거나 모델이 다시 등록된 경우에만 다시 계산한다
+        entry = self._entry(symbol, interval)
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        with entry.lock:
+            try:
+                self._refresh(entry, now_ms)
+            except Exception:
+                if entry.result is None:
+                    # 한 번도 예측하지 못한 항목은 백그라운드 갱신 대상에서 뺀다
+                    with self._entries_lock:
+                        self._entries.pop((entry.symbol, entry.interval), None)
+                raise
+            return entry
+
+    def _refresh(self, entry: _Entry, now_ms: int):
+        latest = self.registry.latest(entry.symbol, entry.interval)
+        if latest is None:
+            raise LookupError(f"모델이 없습니다: {entry.symbol}/{entry.interval}")
+        changed = (latest["version"], latest.get("created")) != (entry.version, entry.created)
+
+        if self._needs_sync(entry, now_ms):
+            entry.synced_at = time.monotonic()
+            try:
+                timestamps, data = load_features(entry.symbol, entry.interval, FEATURE_CANDLES,
+                                                 self.binance, self.store)
+            except Exception as e:
+                # 네트워크 오류 등: 이전 예측이 있으면 그대로 두고 stale 로 표시
+                if entry.data is None:
+                    raise
+                print(f"⚠️ [{entry.symbol}/{entry.interval}] 피처 갱신 실패: {e}")
+                entry.stale = True
+            else:
+                if len(timestamps) and int(timestamps[-1]) != entry.last_timestamp:
+                    entry.data = data[-SEQUENCE_LENGTH:]
+                    entry.last_timestamp = int(timestamps[-1])
+                    changed = True
+                entry.stale = False
+
+        if changed:
+            model = self.registry.load(entry.symbol, entry.interval, backend=self.backend)
+            predicted = predict_ohlc(model, entry.data) if entry.data is not None else None
+            if predicted is None:
+                raise ValueError(f"예측에 필요한 데이터 부족 (최소 {SEQUENCE_LENGTH}개 필요)")
+            entry.version, entry.created = latest["version"], latest.get("created")
+            entry.result = dict(zip(["open", "high", "low", "close"], map(float, predicted)))
+
+    def predict(self, symbol: str, interval: str) -> dict:
+        entry = self.refresh(symbol, interval)
+        return {
+            "symbol": entry.symbol,
+            "interval": entry.interval,
+            **entry.result,
+            "timestamp": entry.last_timestamp,
+            "version": entry.version,
+            "stale": entry.stale,
+        }
+
+    def warm_up(self, symbols: list[str], intervals: list[str]):
+        for symbol in symbols:
+            for interval in intervals:
+                started = time.perf_counter()
+                try:
+                    self.refresh(symbol, interval)
+                    print(f"✅ [{symbol.upper()}/{interval}] 로드 완료 ({time.perf_counter() - started:.2f}초)")
+                except Exception as e:
+                    print(f"⚠️ [{symbol.upper()}/{interval}] 로드 실패: {e}")
+
+    def refresh_all(self):
+        with self._entries_lock:
+            keys = list(self._entries)
+        for symbol, interval in keys:
+            try:
+                self.refresh(symbol, interval)
+            except Exception as e:
+                print(f"⚠️ [{symbol}/{interval}] 갱신 실패: {e}")
+
+    def run_refresher(self, stop: threading.Event, interval: float = REFRESH_INTERVAL):
+        # 요청이 오기 전에 새 봉 반영 + 예측을 끝내 두는 백그라운드 루프
+        while not stop.wait(interval):
+            self.refresh_all()
+
+# === HTTP 핸들러 ===
+def make_handler(service: PredictionService):
+    class PredictionHandler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: dict):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/health":
+                self._send(200, {"status": "ok", "loaded": service.loaded})
+                return
+            if url.path != "/predict":
+                self._send(404, {"error": f"알 수 없는 경로: {url.path}"})
+                return
+
+            params = parse_qs(url.query)
+            symbol = params.get("symbol", [""])[0].strip().upper()
+            interval = params.get("interval", [""])[0].strip()
+            if not symbol or not interval:
+                self._send(400, {"error": "symbol 과 interval 이 필요합니다"})
+                return
+            try:
+                self._send(200, service.predict(symbol, interval))
+            except LookupError as e:
+                self._send(404, {"error": str(e)})
+            except ValueError as e:
+                self._send(422, {"error": str(e)})
+            except Exception as e:
+                self._send(503, {"error": f"예측 실패: {e}"})
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 콘솔에 찍지 않는다
+
+    return PredictionHandler
+
+def serve(symbols: list[str], intervals: list[str] = INTERVALS, host: str = HOST, port: int = PORT,
+          backend: str | None = None):
+    service = PredictionService(backend=backend)
+    service.warm_up(symbols, intervals)
+
+    stop = threading.Event()
+    refresher = threading.Thread(target=service.run_refresher, args=(stop,), daemon=True)
+    refresher.start()
+
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    print(f"🛰️ 예측 서버 시작: http://{host}:{port} ({len(service.loaded)}개 모델)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("👋 예측 서버를 종료합니다.")
+    finally:
+        stop.set()
+        server.server_close()
+
+# 실행 진입점
+def main():
+    parser = argparse.ArgumentParser(description="로컬 ML 예측 서버")
+    parser.add_argument("symbols", nargs="*", help="미리 로드할 심볼 (예: BTC ETH)")
+    parser.add_argument("--intervals", nargs="+", default=INTERVALS)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--backend", choices=BACKENDS, default=DEFAULT_BACKEND)
+    args = parser.parse_args()
+
+    symbols = args.symbols
+    if not symbols:
+        symbols = [s.strip() for s in input("📥 심볼 입력 (예: BTC,ETH): ").split(",") if s.strip()]
+    serve(symbols, args.intervals, args.host, args.port, args.backend)
+
+if __name__ == "__main__":
+    main()
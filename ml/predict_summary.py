@@ -3,33 +3,48 @@ predict_summary.py
 📊 ML 예측 요약 스크립트 (15m, 1h, 4h, 1d)
 
 - 입력: 심볼 (예: BTC, ETH)
-- 처리: 각 타임프레임의 ML 예측 가격 계산
+- 처리: 예측 서버(predict_server.py)가 떠 있으면 서버에 요청, 없으면 각 타임프레임 예측 스크립트를 직접 실행
 - 출력: 콘솔에 정리된 예측 결과 출력
 """
 
-from predict_15m import predict_next_15m
-from predict_1h import predict_next
-from predict_4h import predict_next
-from predict_1d import predict_next_1d
+from predict_client import INTERVAL_LABELS, PredictionClient, print_prediction
+
+# 서버가 없을 때만 TensorFlow 를 불러오도록 예측 스크립트는 필요할 때 import 한다
+def predict_locally(symbol: str, interval: str):
+    if interval == "15m":
+        from predict_15m import predict_next_15m
+        predict_next_15m(symbol)
+    elif interval == "1h":
+        from predict_1h import predict_next as predict_1h
+        predict_1h(symbol)
+    elif interval == "4h":
+        from predict_4h import predict_next as predict_4h
+        predict_4h(symbol)
+    elif interval == "1d":
+        from predict_1d import predict_next_1d
+        predict_next_1d(symbol)
 
 def main():
     symbol = input("예측할 심볼 입력 (예: BTC): ").strip().upper()
 
+    client = PredictionClient()
+    use_server = client.available()
+
     print("\n📊 === ML 예측 요약 ===")
     print(f"📌 심볼: {symbol}")
+    print(f"🛰️ 예측 서버: {'사용' if use_server else '미실행 (로컬 모델 로드)'}")
     print("----------------------------")
 
-    print("⏱️ 15분 예측:")
-    predict_next_15m(symbol)
-
-    print("\n⏱️ 1시간 예측:")
-    predict_next(symbol)
-
-    print("\n⏱️ 4시간 예측:")
-    predict_next(symbol)
-
-    print("\n⏱️ 1일 예측:")
-    predict_next_1d(symbol)
+    for i, (interval, label) in enumerate(INTERVAL_LABELS.items()):
+        prefix = "\n" if i else ""
+        print(f"{prefix}⏱️ {label} 예측:")
+        if not use_server:
+            predict_locally(symbol, interval)
+            continue
+        try:
+            print_prediction(client.predict(symbol, interval))
+        except Exception as e:
+            print(f"❌ {e}")
 
     print("----------------------------")
     print("✅ 모든 예측 완료!")
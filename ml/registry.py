@@ -0,0 +1,224 @@
+"""
+registry.py
+🗂️ 학습된 모델 레지스트리 + 프로세스 내 모델 캐시
+
+- 인덱스: models/index.json 에 (심볼, 구간) → 버전 목록(파일명, 생성 시각, 메타데이터) 을 저장
+          → 최신 모델 조회는 디렉터리 스캔 없이 dict 조회 한 번
+- 기존 파일명 ({interval}_{SYMBOL}_{ts}.keras, {SYMBOL}_1m_{ts}.keras) 은 인덱스가 없을 때 한 번 스캔해서 등록
+- 캐시: 로드한 Keras 모델을 LRU 로 보관해서 같은 프로세스의 반복 예측은 load_model 을 한 번만 한다
+- 백엔드: keras / keras_compiled (perf.py) / tflite / tflite_quant (tflite_model.py). 등록할 때 .tflite 도 함께 내보낸다
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from perf import CompiledPredictor
+from tflite_model import BACKENDS, DEFAULT_BACKEND, TFLiteModel, export_tflite, tflite_path
+
+MODEL_DIR = "models"
+INDEX_FILE = "index.json"
+CACHE_SIZE = 8
+EXPORT_BACKENDS = ("tflite",)  # 등록할 때 함께 내보낼 경량 백엔드
+
+# 15m_BTC_20250603_1652.keras / mtf_BTC_20250603_1652.keras / BTC_1m_20250603_1652.keras
+_LEGACY_PATTERNS = [
+    re.compile(r"^(?P<interval>\d+[mhdw]|mtf)_(?P<symbol>[A-Z0-9]+)_(?P<version>\d{8}_\d{4,6})\.keras$"),
+    re.compile(r"^(?P<symbol>[A-Z0-9]+)_(?P<interval>\d+[mhdw])_(?P<version>\d{8}_\d{4,6})\.keras$"),
+]
+
+def _key(symbol: str, interval: str) -> str:
+    return f"{symbol.upper()}/{interval}"
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+class ModelRegistry:
+    def __init__(self, model_dir: str = MODEL_DIR, cache_size: int = CACHE_SIZE):
+        self.model_dir = model_dir
+        self.index_path = os.path.join(model_dir, INDEX_FILE)
+        self.cache_size = cache_size
+        self._index: dict[str, list[dict]] | None = None
+        self._index_mtime = None
+        self._models: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.RLock()
+
+    # === 인덱스 ===
+    def _read_index(self) -> dict[str, list[dict]]:
+        # 다른 프로세스(학습 스크립트)가 인덱스를 갱신했으면 다시 읽는다
+        try:
+            mtime = os.stat(self.index_path).st_mtime_ns
+        except FileNotFoundError:
+            if self._index is None:
+                self._index = self._scan()
+                self._write_index()
+            return self._index
+        if self._index is None or mtime != self._index_mtime:
+            with open(self.index_path, "r") as f:
+                self._index = json.load(f)
+            self._index_mtime = mtime
+        return self._index
+
+    def _write_index(self):
+        os.makedirs(self.model_dir, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체해서, 읽는 쪽이 반쯤 쓰인 인덱스를 보지 않게 한다
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+        self._index_mtime = os.stat(self.index_path).st_mtime_ns
+
+    @contextmanager
+    def _file_lock(self):
+        # train_summary 처럼 여러 프로세스가 동시에 등록해도 서로의 항목을 덮어쓰지 않게 한다
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(self.model_dir, exist_ok=True)
+        with open(f"{self.index_path}.lock", "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _scan(self) -> dict[str, list[dict]]:
+        index: dict[str, list[dict]] = {}
+        if not os.path.isdir(self.model_dir):
+            return index
+        for name in os.listdir(self.model_dir):
+            for pattern in _LEGACY_PATTERNS:
+                match = pattern.match(name)
+                if match:
+                    created = os.path.getmtime(os.path.join(self.model_dir, name))
+                    index.setdefault(_key(match["symbol"], match["interval"]), []).append({
+                        "version": match["version"], "file": name, "created": created, "metadata": {},
+                    })
+                    break
+        for versions in index.values():
+            versions.sort(key=lambda v: v["version"])
+        return index
+
+    def rescan(self):
+        # models/ 에 직접 복사해 넣은 모델 파일까지 인덱스를 다시 만든다
+        with self._lock, self._file_lock():
+            self._index = self._scan()
+            self._write_index()
+
+    # === 조회 ===
+    def versions(self, symbol: str, interval: str) -> list[dict]:
+        with self._lock:
+            return list(self._read_index().get(_key(symbol, interval), []))
+
+    def latest(self, symbol: str, interval: str) -> dict | None:
+        with self._lock:
+            versions = self._read_index().get(_key(symbol, interval))
+            return versions[-1] if versions else None
+
+    def path(self, entry: dict) -> str:
+        return os.path.join(self.model_dir, entry["file"])
+
+    # === 등록 ===
+    def register(self, symbol: str, interval: str, model, metadata: dict | None = None,
+                 version: str | None = None, export: tuple[str, ...] = EXPORT_BACKENDS) -> str:
+        # 모델을 {interval}_{SYMBOL}_{version}.keras 로 저장하고 인덱스에 추가한다.
+        # 이미 있는 version 을 넘기면 같은 파일을 덮어쓴다 (created 가 바뀌므로 캐시된 모델은 다시 로드된다).
+        symbol = symbol.upper()
+        with self._lock, self._file_lock():
+            self._index_mtime = None  # 잠금을 잡은 뒤 디스크의 최신 인덱스에 이어서 쓴다
+            index = self._read_index()
+            versions = index.setdefault(_key(symbol, interval), [])
+            existing = next((v for v in versions if v["version"] == version), None) if version else None
+
+            if existing is None:
+                version = version or datetime.now().strftime("%Y%m%d_%H%M%S")
+                entry = {"version": version, "file": f"{interval}_{symbol}_{version}.keras"}
+                versions.append(entry)
+                versions.sort(key=lambda v: v["version"])
+            else:
+                entry = existing
+            entry["created"] = time.time()
+            entry["metadata"] = metadata or {}
+
+            path = self.path(entry)
+            os.makedirs(self.model_dir, exist_ok=True)
+            model.save(path)
+            for backend in export:
+                quantize = backend == "tflite_quant"
+                try:
+                    export_tflite(model, tflite_path(path, quantize), quantize)
+                except Exception as e:
+                    # 변환 실패가 학습 결과 저장을 막지는 않는다 (필요하면 로드할 때 다시 변환)
+                    print(f"⚠️ TFLite 변환 실패 ({backend}): {e}")
+            self._write_index()
+            return path
+
+    # === 로드 (LRU 캐시) ===
+    def load(self, symbol: str, interval: str, version: str | None = None, backend: str | None = None):
+        backend = backend or DEFAULT_BACKEND
+        if backend not in BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
+        with self._lock:
+            if version is None:
+                entry = self.latest(symbol, interval)
+            else:
+                entry = next((v for v in self.versions(symbol, interval) if v["version"] == version), None)
+            if entry is None:
+                return None
+
+            # 다른 프로세스가 같은 version 을 덮어썼으면 created 가 달라지므로 새로 로드된다
+            cache_key = (entry["file"], entry.get("created"), backend)
+            if cache_key in self._models:
+                self._models.move_to_end(cache_key)
+                return self._models[cache_key]
+
+            if backend == "keras":
+                # TensorFlow 는 실제로 Keras 모델을 로드할 때만 불러온다 (import 만으로 수 초 / 수백 MB)
+                from tensorflow.keras.models import load_model
+                model = load_model(self.path(entry))
+            elif backend == "keras_compiled":
+                # 캐시된 Keras 모델을 고정 shape 예측 함수로 감싼다 (학습 / 증분 학습은 keras 백엔드를 그대로 쓴다)
+                model = CompiledPredictor(self.load(symbol, interval, entry["version"], "keras"))
+            else:
+                model = TFLiteModel(self._tflite_file(symbol, interval, entry, backend == "tflite_quant"))
+            self._models[cache_key] = model
+            if len(self._models) > self.cache_size:
+                self._models.popitem(last=False)
+            return model
+
+    def _tflite_file(self, symbol: str, interval: str, entry: dict, quantize: bool) -> str:
+        # 아직 내보내지 않았거나 .keras 보다 오래된 .tflite 면 지금 변환한다
+        keras_path = self.path(entry)
+        path = tflite_path(keras_path, quantize)
+        if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(keras_path):
+            print(f"🪶 TFLite 변환 중: {path}")
+            export_tflite(self.load(symbol, interval, entry["version"], "keras"), path, quantize)
+        return path
+
+    def clear_cache(self):
+        with self._lock:
+            self._models.clear()
+
+# === 외부에서 호출할 함수 ===
+_default_registry: ModelRegistry | None = None
+
+def get_registry() -> ModelRegistry:
+    # 프로세스 전체에서 같은 레지스트리(= 같은 모델 캐시)를 공유한다
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ModelRegistry()
+    return _default_registry
+
+def register_model(symbol: str, interval: str, model, metadata: dict | None = None,
+                   version: str | None = None) -> str:
+    return get_registry().register(symbol, interval, model, metadata, version)
+
+def load_latest_model(symbol: str, interval: str, backend: str | None = None):
+    # backend 를 생략하면 환경 변수 ML_BACKEND (기본 keras, ML_PERF=1 이면 keras_compiled)
+    return get_registry().load(symbol, interval, backend=backend)
@@ -0,0 +1,102 @@
+"""
+tflite_model.py
+🪶 Keras 모델 → TFLite 변환 + TFLite 추론 백엔드
+
+- 내보내기: 학습 후 레지스트리에 등록할 때 models/{...}.keras 옆에 .tflite 를 함께 저장
+            (동적 범위 양자화 버전은 .quant.tflite)
+- 추론: TFLiteModel 은 Keras 모델과 같은 predict_on_batch / predict 를 제공해 inference.py 를 그대로 쓴다
+- 런타임: ai_edge_litert / tflite_runtime 이 설치되어 있으면 그것을, 없으면 tf.lite 인터프리터를 사용
+- 백엔드 선택: 환경 변수 ML_BACKEND=keras | keras_compiled | tflite | tflite_quant
+              (기본 keras, ML_PERF=1 이면 keras_compiled → perf.py 의 고정 shape 예측 함수)
+- 수동 변환: python ml/tflite_model.py BTC 1h [--quantize]
+"""
+
+import argparse
+import os
+import threading
+import numpy as np
+from perf import PERF_MODE
+
+BACKENDS = ("keras", "keras_compiled", "tflite", "tflite_quant")
+DEFAULT_BACKEND = os.environ.get("ML_BACKEND", "keras_compiled" if PERF_MODE else "keras")
+
+def tflite_path(keras_path: str, quantize: bool = False) -> str:
+    stem = os.path.splitext(keras_path)[0]
+    return f"{stem}.quant.tflite" if quantize else f"{stem}.tflite"
+
+def export_tflite(model, path: str, quantize: bool = False) -> str:
+    # LSTM 의 while 루프는 배치 크기가 고정되어야 TFLite 내장 연산으로 변환되므로 (1, seq, F) 로 고정한다
+    import tensorflow as tf
+    _, seq_len, features = model.input_shape
+    forward = tf.function(lambda x: model(x, training=False))
+    concrete = forward.get_concrete_function(tf.TensorSpec([1, seq_len, features], tf.float32))
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([concrete])
+    if quantize:
+        # 가중치만 int8 로 저장하고 활성값은 float 로 계산 (보정 데이터 불필요)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    with open(path, "wb") as f:
+        f.write(converter.convert())
+    return path
+
+def _interpreter_class():
+    # 가벼운 런타임이 있으면 TensorFlow 전체를 불러오지 않는다
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    import tensorflow as tf
+    return tf.lite.Interpreter
+
+class TFLiteModel:
+    def __init__(self, path: str, num_threads: int | None = None):
+        self.path = path
+        self._interpreter = _interpreter_class()(model_path=path, num_threads=num_threads)
+        self._interpreter.allocate_tensors()
+        input_details = self._interpreter.get_input_details()[0]
+        self._input = input_details["index"]
+        self._output = self._interpreter.get_output_details()[0]["index"]
+        self.input_shape = (None, *input_details["shape"][1:])
+        self._lock = threading.Lock()  # 인터프리터는 스레드 안전하지 않다
+
+    def predict_on_batch(self, x) -> np.ndarray:
+        # 배치 1 로 변환된 모델이라 창을 하나씩 넣는다
+        x = np.asarray(x, dtype=np.float32)
+        outputs = []
+        with self._lock:
+            for window in x:
+                self._interpreter.set_tensor(self._input, window[np.newaxis])
+                self._interpreter.invoke()
+                outputs.append(self._interpreter.get_tensor(self._output)[0].copy())
+        return np.stack(outputs)
+
+    def predict(self, x, verbose=0) -> np.ndarray:
+        return self.predict_on_batch(x)
+
+# 실행 진입점: 레지스트리의 최신 모델을 TFLite 로 변환
+def main():
+    from registry import get_registry
+
+    parser = argparse.ArgumentParser(description="레지스트리 최신 모델을 TFLite 로 변환")
+    parser.add_argument("symbol")
+    parser.add_argument("interval")
+    parser.add_argument("--quantize", action="store_true", help="동적 범위 양자화")
+    args = parser.parse_args()
+
+    registry = get_registry()
+    entry = registry.latest(args.symbol, args.interval)
+    if entry is None:
+        print(f"❌ 모델이 없습니다: {args.symbol.upper()}/{args.interval}")
+        return
+    keras_path = registry.path(entry)
+    path = export_tflite(registry.load(args.symbol, args.interval, backend="keras"),
+                         tflite_path(keras_path, args.quantize), args.quantize)
+    print(f"✅ TFLite 변환 완료: {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+if __name__ == "__main__":
+    main()
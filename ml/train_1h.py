@@ -2,18 +2,18 @@
 train_1h.py
 📚 Binance 1시간봉 데이터 기반 딥러닝 모델 학습 함수
 
-- 함수명: train_model(symbol: str)
+- 함수명: train_model(symbol: str, incremental=False), train_on_features / retrain_on_features(symbol, timestamps, data)
 - 처리: Binance에서 1시간봉 캔들데이터 수집 → 기술적 지표 계산 → 정규화 → LSTM 모델 학습
-- 출력: 학습된 모델을 models/1h_{SYMBOL}_{TIMESTAMP}.keras 에 저장
+- 출력: 학습된 모델을 models/1h_{SYMBOL}_{VERSION}.keras 에 저장하고 레지스트리 인덱스에 등록
 """
 
+import argparse
 import numpy as np
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Input, LSTM, Dense, Dropout
-from tensorflow.keras.callbacks import EarlyStopping
-from services.BinanceService import BinanceService
-from datetime import datetime
-import os
+from features import FEATURE_COLUMNS, load_features
+from dataset import make_train_val_datasets
+from registry import register_model
+from perf import FEATURE_DTYPE, JIT_FIT
+from incremental import fine_tune_latest
 
 # === 하이퍼파라미터 설정 ===
 SEQUENCE_LENGTH = 60
@@ -21,124 +21,83 @@ EPOCHS = 150
 BATCH_SIZE = 64
 EARLY_STOPPING_PATIENCE = 80
 
-def calculate_sma(prices, period):
-    return np.mean(prices[-period:]) if len(prices) >= period else np.nan
-
-def calculate_ema(prices, period):
-    if len(prices) < period:
-        return np.nan
-    k = 2 / (period + 1)
-    ema = prices[-period]
-    for price in prices[-period + 1:]:
-        ema = price * k + ema * (1 - k)
-    return ema
-
-def calculate_rsi(prices, period=14):
-    if len(prices) < period + 1:
-        return np.nan
-    gains, losses = 0, 0
-    for i in range(-period, 0):
-        diff = prices[i] - prices[i - 1]
-        gains += max(0, diff)
-        losses += max(0, -diff)
-    if losses == 0:
-        return 100
-    rs = gains / losses
-    return 100 - (100 / (1 + rs))
-
-def calculate_macd(prices, short=12, long=26):
-    if len(prices) < long:
-        return np.nan
-    return calculate_ema(prices, short) - calculate_ema(prices, long)
-
-def calculate_atr(candles, period=14):
-    if len(candles) < period + 1:
-        return np.nan
-    trs = []
-    for i in range(-period, 0):
-        high = candles[i].high
-        low = candles[i].low
-        prev_close = candles[i - 1].close
-        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-        trs.append(tr)
-    return np.mean(trs)
-
-def calculate_obv(candles):
-    obv = 0
-    prev_close = candles[0].close
-    for c in candles[1:]:
-        if c.close > prev_close:
-            obv += c.volume
-        elif c.close < prev_close:
-            obv -= c.volume
-        prev_close = c.close
-    return obv
-
-def create_sequences(data, seq_len):
-    X, y = [], []
-    for i in range(seq_len, len(data) - 1):
-        X.append(data[i - seq_len:i])
-        y.append(data[i + 1][:4])  # Open, High, Low, Close
-    return np.array(X), np.array(y)
-
 # === 외부에서 호출할 학습 함수 ===
-def train_model(symbol: str):
-    print(f"📚 [{symbol}] 1시간봉 학습을 시작합니다...")
-
-    binance = BinanceService()
-    candles = binance.fetch_historical_candle_data(symbol, 1000, interval="1h")
-    closes = [c.close for c in candles]
-
-    data = []
-    for i, c in enumerate(candles):
-        sma = calculate_sma(closes[:i + 1], 20)
-        ema = calculate_ema(closes[:i + 1], 20)
-        rsi = calculate_rsi(closes[:i + 1])
-        macd = calculate_macd(closes[:i + 1])
-        atr = calculate_atr(candles[:i + 1])
-        obv = calculate_obv(candles[:i + 1])
-
-        if any(np.isnan(val) for val in [sma, ema, rsi, macd, atr, obv]):
-            continue
-
-        row = [c.open, c.high, c.low, c.close, sma, ema, rsi, macd, atr, obv]
-        data.append(row)
+def train_on_features(symbol: str, timestamps: np.ndarray, data: np.ndarray,
+                      verbose: int = 1, resume: bool = False) -> str | None:
+    # 이미 계산된 피처 행렬로 학습 → 등록된 모델 경로 (train_summary 작업자는 공유 메모리 배열을 넘긴다)
+    # TensorFlow 는 학습을 시작할 때 불러온다 (train_summary 등에서 import 만 할 때는 비용이 들지 않도록)
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import Input, LSTM, Dense, Dropout
+    from tensorflow.keras.callbacks import EarlyStopping
+    from checkpoint import TrainingCheckpoint
+
+    # resume=True 면 중단된 실행의 체크포인트 (모델 + 옵티마이저 / 에폭 / 조기 종료 상태 / 피처 스냅숏) 에서 이어서 학습
+    checkpoint = TrainingCheckpoint(symbol, "1h", resume=resume)
+    if checkpoint.data is not None:
+        timestamps, data = checkpoint.timestamps, checkpoint.data
 
     if len(data) < SEQUENCE_LENGTH + 10:
         print("❌ 학습에 필요한 데이터가 부족합니다.")
-        return
+        return None
 
-    data = np.array(data)
+    data = np.array(data, dtype=FEATURE_DTYPE)
     min_vals = data.min(axis=0)
     max_vals = data.max(axis=0)
-    scaled_data = (data - min_vals) / (max_vals - min_vals + 1e-8)
 
-    X, y = create_sequences(scaled_data, SEQUENCE_LENGTH)
-    split = int(0.8 * len(X))
-    X_train, y_train = X[:split], y[:split]
-    X_val, y_val = X[split:], y[split:]
-
-    model = Sequential([
-        Input(shape=(SEQUENCE_LENGTH, X.shape[2])),
-        LSTM(64, return_sequences=True),
-        Dropout(0.2),
-        LSTM(32),
-        Dense(32, activation='relu'),
-        Dense(4)
-    ])
-
-    model.compile(optimizer='adam', loss='mse')
+    if not checkpoint.resumed:
+        checkpoint.save_features(timestamps, data)
+
+    train_ds, val_ds = make_train_val_datasets(data, SEQUENCE_LENGTH, BATCH_SIZE,
+                                               validation_split=0.2,
+                                               scale=(min_vals, max_vals))
+
+    model = checkpoint.restored_model
+    if model is None:
+        model = Sequential([
+            Input(shape=(SEQUENCE_LENGTH, data.shape[1])),
+            LSTM(64, return_sequences=True),
+            Dropout(0.2),
+            LSTM(32),
+            Dense(32, activation='relu'),
+            Dense(4)
+        ])
+        model.compile(optimizer='adam', loss='mse', jit_compile=JIT_FIT)
     early_stop = EarlyStopping(patience=EARLY_STOPPING_PATIENCE, restore_best_weights=True)
 
-    model.fit(X_train, y_train,
+    model.fit(train_ds,
               epochs=EPOCHS,
-              batch_size=BATCH_SIZE,
-              validation_data=(X_val, y_val),
-              callbacks=[early_stop],
-              verbose=1)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-    os.makedirs("models", exist_ok=True)
-    model_path = f"models/1h_{symbol}_{timestamp}.keras"
-    model.save(model_path)
-    print(f"✅ 모델 저장 완료: {model_path}")
\ No newline at end of file
+              validation_data=val_ds,
+              callbacks=checkpoint.callbacks(early_stop),
+              initial_epoch=checkpoint.initial_epoch,
+              verbose=verbose)
+
+    model_path = register_model(symbol, "1h", model, {
+        "rows": len(data),
+        "last_timestamp": int(timestamps[-1]),
+        "columns": FEATURE_COLUMNS,
+    })
+    checkpoint.clear()
+    print(f"✅ 모델 저장 완료: {model_path}")
+    return model_path
+
+def retrain_on_features(symbol: str, timestamps: np.ndarray, data: np.ndarray,
+                        verbose: int = 1) -> str | None:
+    # 최신 모델이 있으면 학습 기준 시점 이후 마감된 캔들로만 짧게 이어서 학습, 없으면 처음부터 학습
+    model_path = fine_tune_latest(symbol, "1h", timestamps, data, SEQUENCE_LENGTH, BATCH_SIZE, verbose=verbose)
+    return model_path if model_path is not None else train_on_features(symbol, timestamps, data, verbose)
+
+def train_model(symbol: str, incremental: bool = False, resume: bool = False) -> str | None:
+    print(f"📚 [{symbol}] 1시간봉 학습을 시작합니다...")
+    timestamps, data = load_features(symbol, "1h")
+    if incremental:
+        return retrain_on_features(symbol, timestamps, data)
+    return train_on_features(symbol, timestamps, data, resume=resume)
+
+# === 실행 ===
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="1시간봉 모델 학습")
+    parser.add_argument("--resume", action="store_true", help="중단된 전체 학습을 마지막 체크포인트에서 이어서 학습")
+    args = parser.parse_args()
+    symbol = input("학습할 심볼 입력 (예: BTC): ").strip().upper()
+    mode = input("🧠 모드 선택 (full / incremental): ").strip().lower()
+    train_model(symbol, incremental=mode == "incremental", resume=args.resume)
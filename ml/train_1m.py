@@ -1,102 +1,95 @@
-import os
-import pandas as pd
+import argparse
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras.layers import LSTM, Dense
-from tensorflow.keras.callbacks import EarlyStopping
-from datetime import datetime
+from services.KlineStore import KlineStore
+from windows import window_count
+from dataset import make_window_dataset, make_train_val_datasets, min_max
+from registry import get_registry, register_model
+from perf import JIT_FIT
 
 # ===== 설정 =====
 SEQ_LEN = 60
 EPOCHS = 100
 BATCH_SIZE = 32
-MODEL_DIR = "models"
-os.makedirs(MODEL_DIR, exist_ok=True)
-
-# ===== 시퀀스 생성 함수 =====
-def create_sequences(data, seq_len):
-    X, y = [], []
-    for i in range(len(data) - seq_len):
-        X.append(data[i:i+seq_len])
-        y.append(data[i+seq_len])
-    return np.array(X), np.array(y)
-
-# ===== 가장 최근 모델 불러오기 =====
-def get_latest_model_path(symbol: str):
-    files = [f for f in os.listdir(MODEL_DIR) if f.startswith(f"{symbol.upper()}_1m")]
-    if not files:
-        return None
-    files.sort(reverse=True)
-    return os.path.join(MODEL_DIR, files[0])
 
 # ===== 모델 구성 함수 =====
 def build_model(input_shape):
+    # TensorFlow 는 모델을 만들 때 불러온다
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import LSTM, Dense
     model = Sequential([
         LSTM(64, return_sequences=False, input_shape=input_shape),
         Dense(32, activation="relu"),
         Dense(4)  # open, high, low, close
     ])
-    model.compile(loss="mse", optimizer="adam")
+    model.compile(loss="mse", optimizer="adam", jit_compile=JIT_FIT)
     return model
 
 # ===== 학습 함수 =====
-def train_model(symbol: str, incremental=False):
-    csv_path = f"data/{symbol.upper()}_1m.csv"
-    if not os.path.exists(csv_path):
-        print("❌ CSV 파일이 없습니다. 먼저 데이터를 수집해주세요.")
+def train_model(symbol: str, incremental=False, resume=False):
+    # open, high, low, close, volume (디스크의 memmap 뷰, 메모리에 올리지 않음)
+    store = KlineStore()
+    features = store.ohlcv_view(symbol, "1m")
+    count = window_count(len(features), SEQ_LEN, target_offset=0)
+    if count == 0:
+        print("❌ 저장된 1분봉 데이터가 없습니다. 먼저 데이터를 수집해주세요.")
         return
 
-    df = pd.read_csv(csv_path, header=None)
-    df.columns = ["timestamp", "open", "high", "low", "close", "volume"]
-    df = df.dropna()
-
-    features = ["open", "high", "low", "close", "volume"]
-    scaler = MinMaxScaler()
-    scaled_data = scaler.fit_transform(df[features])
-
-    X, y = create_sequences(scaled_data, SEQ_LEN)
-    y = y[:, :4]  # OHLC만 예측
+    # 배치마다 min-max 정규화 (OHLC만 예측)
+    scale = min_max(features)
+    metadata = {"rows": len(features), "last_timestamp": store.last_open_time(symbol, "1m")}
 
     if incremental:
         # 가장 최근 모델 로드
-        latest_model_path = get_latest_model_path(symbol)
-        if latest_model_path:
-            print(f"📂 기존 모델 로드: {latest_model_path}")
-            model = load_model(latest_model_path)
+        registry = get_registry()
+        latest = registry.latest(symbol, "1m")
+        if latest:
+            print(f"📂 기존 모델 로드: {registry.path(latest)}")
+            model = registry.load(symbol, "1m", backend="keras")
         else:
             print("⚠️ 기존 모델이 없어 새로 생성합니다.")
-            model = build_model((SEQ_LEN, len(features)))
+            model = build_model((SEQ_LEN, features.shape[1]))
 
         # 최근 데이터로만 훈련
-        X_recent = X[-BATCH_SIZE:]
-        y_recent = y[-BATCH_SIZE:]
-        model.fit(X_recent, y_recent, epochs=1, verbose=1)
+        recent_ds = make_window_dataset(features, SEQ_LEN, BATCH_SIZE, target_offset=0,
+                                        indices=np.arange(count - min(count, BATCH_SIZE), count), scale=scale)
+        model.fit(recent_ds, epochs=1, verbose=1)
 
-        # 덮어쓰기
-        model.save(latest_model_path)
-        print(f"🔄 모델 업데이트 완료: {latest_model_path}")
+        # 같은 버전에 덮어쓰기 (기존 모델이 없었으면 새 버전으로 등록)
+        model_path = register_model(symbol, "1m", model, metadata,
+                                    version=latest["version"] if latest else None)
+        print(f"🔄 모델 업데이트 완료: {model_path}")
 
     else:
         # 새 모델 생성 및 전체 학습
-        model = build_model((SEQ_LEN, len(features)))
+        # 긴 백필 학습은 에폭마다 체크포인트를 남기고, resume=True 면 마지막 체크포인트에서 이어서 학습
+        # (1분봉은 저장소 memmap 을 그대로 쓰므로 피처 스냅숏은 남기지 않는다)
+        from tensorflow.keras.callbacks import EarlyStopping
+        from checkpoint import TrainingCheckpoint
+        checkpoint = TrainingCheckpoint(symbol, "1m", resume=resume)
+        model = checkpoint.restored_model
+        if model is None:
+            model = build_model((SEQ_LEN, features.shape[1]))
         early_stop = EarlyStopping(monitor="val_loss", patience=10, restore_best_weights=True)
+        train_ds, val_ds = make_train_val_datasets(features, SEQ_LEN, BATCH_SIZE, validation_split=0.1,
+                                                   target_offset=0, scale=scale)
         model.fit(
-            X, y,
+            train_ds,
             epochs=EPOCHS,
-            batch_size=BATCH_SIZE,
-            validation_split=0.1,
-            callbacks=[early_stop],
+            validation_data=val_ds,
+            callbacks=checkpoint.callbacks(early_stop),
+            initial_epoch=checkpoint.initial_epoch,
             verbose=1
         )
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        model_path = os.path.join(MODEL_DIR, f"{symbol.upper()}_1m_{timestamp}.keras")
-        model.save(model_path)
+        model_path = register_model(symbol, "1m", model, metadata)
+        checkpoint.clear()
         print(f"✅ 모델 저장 완료: {model_path}")
 
 # ===== 실행 =====
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="1분봉 모델 학습")
+    parser.add_argument("--resume", action="store_true", help="중단된 전체 학습을 마지막 체크포인트에서 이어서 학습")
+    args = parser.parse_args()
     symbol = input("📥 심볼 입력 (예: BTC): ").strip().upper()
     mode = input("🧠 모드 선택 (full / incremental): ").strip().lower()
     incremental = mode == "incremental"
-    train_model(symbol, incremental=incremental)
+    train_model(symbol, incremental=incremental, resume=args.resume)
@@ -2,43 +2,203 @@
 train_summary.py
 📚 ML 학습 요약 스크립트 (15m, 1h, 4h, 1d) - 병렬 처리 전용 (전체 학습)
 
-- 입력: 심볼 (예: BTC, ETH)
-- 처리: 각 타임프레임 모델 학습을 병렬 실행
-- 출력: 콘솔에 정리된 학습 결과 출력
+- 입력: 심볼 (예: python ml/train_summary.py BTC --intervals 15m 1h 4h 1d [--sequential] [--incremental] [--resume])
+- 처리: 부모 프로세스가 타임프레임별 캔들/피처를 한 번만 로드해 공유 메모리에 게시
+        → 타임프레임마다 작업자 프로세스가 공유 메모리에 붙어 복사 없이 읽고 학습
+        → 작업자마다 코어 몫만큼만 TensorFlow intra-op / inter-op 스레드를 쓰고 (Linux 는 CPU affinity 도 고정)
+           서로 코어를 빼앗지 않게 한다
+- 출력: 콘솔에 학습 결과 + 작업자별 wall time / CPU 시간 / 코어 활용률
+        (--sequential 은 같은 작업을 코어 전체로 하나씩 실행해 병렬 실행과 비교,
+         --incremental 은 최신 모델을 새로 마감된 캔들 + 재사용 샘플로 짧게 이어서 학습 → incremental.py,
+         --resume 은 작업자가 죽어 중단된 전체 학습을 체크포인트에서 이어서 학습 → checkpoint.py)
 """
 
-from train_15m import train_model as train_15m
-from train_1h import train_model as train_1h
-from train_4h import train_model as train_4h
-from train_1d import train_model as train_1d
-from multiprocessing import Process
+import argparse
+import multiprocessing as mp
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from features import load_features
+from perf import FEATURE_DTYPE
+import train_15m
+import train_1h
+import train_4h
+import train_1d
+from services.BinanceService import BinanceService
+from services.KlineStore import KlineStore
 
-def run_in_process(func, symbol):
-    p = Process(target=func, args=(symbol,))
-    p.start()
-    return p
+TRAINERS = {"15m": train_15m, "1h": train_1h, "4h": train_4h, "1d": train_1d}  # 구간 → 학습 모듈
+INTER_OP_THREADS = 1  # LSTM 한 줄기 모델이라 동시에 돌릴 독립 연산이 거의 없다
 
+# === 공유 메모리 ===
+def publish(timestamps: np.ndarray, data: np.ndarray) -> tuple[shared_memory.SharedMemory, dict]:
+    # timestamps (int64) 뒤에 피처 행렬 (FEATURE_DTYPE, ML_FLOAT32 면 float32) 을 이어 붙인 블록 하나.
+    # spec 만 작업자에게 넘긴다.
+    rows, cols = data.shape
+    itemsize = np.dtype(FEATURE_DTYPE).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(1, rows * (8 + cols * itemsize)))
+    np.ndarray((rows,), dtype=np.int64, buffer=shm.buf)[:] = timestamps
+    np.ndarray((rows, cols), dtype=FEATURE_DTYPE, buffer=shm.buf, offset=rows * 8)[:] = data
+    return shm, {"name": shm.name, "rows": rows, "cols": cols}
+
+def attach(spec: dict) -> tuple[shared_memory.SharedMemory, np.ndarray, np.ndarray]:
+    # 게시된 블록 위의 읽기 전용 뷰 (복사 없음). 뷰를 모두 버린 뒤 shm.close() 해야 한다.
+    shm = shared_memory.SharedMemory(name=spec["name"])
+    rows, cols = spec["rows"], spec["cols"]
+    timestamps = np.ndarray((rows,), dtype=np.int64, buffer=shm.buf)
+    data = np.ndarray((rows, cols), dtype=FEATURE_DTYPE, buffer=shm.buf, offset=rows * 8)
+    timestamps.flags.writeable = False
+    data.flags.writeable = False
+    return shm, timestamps, data
+
+# === 코어 배분 ===
+def available_cores() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def split_cores(cores: list[int], workers: int) -> list[list[int] | None]:
+    # 코어를 작업자 수로 나눈다 (남는 코어는 앞쪽 작업자부터 하나씩). 코어가 작업자보다 적으면 고정하지 않는다.
+    if len(cores) < workers:
+        return [None] * workers
+    return [chunk.tolist() for chunk in np.array_split(cores, workers)]
+
+# === 작업자 ===
+def _train_worker(interval: str, symbol: str, spec: dict, threads: int,
+                  cpus: list[int] | None, incremental: bool, resume: bool, results) -> None:
+    started, cpu_started = time.perf_counter(), os.times()
+    # 스레드 수는 TensorFlow 런타임이 초기화되기 전에만 바꿀 수 있으므로 import 보다 먼저 정한다
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(INTER_OP_THREADS)
+
+    model_path, error = None, None
+    shm, timestamps, data = attach(spec)
+    try:
+        trainer = TRAINERS[interval]
+        if incremental:
+            model_path = trainer.retrain_on_features(symbol, timestamps, data, verbose=2)
+        else:
+            model_path = trainer.train_on_features(symbol, timestamps, data, verbose=2, resume=resume)
+    except Exception as e:
+        error = str(e)
+    finally:
+        del timestamps, data
+        shm.close()
+
+    cpu_finished = os.times()
+    results.put({
+        "interval": interval,
+        "threads": threads,
+        "wall": time.perf_counter() - started,
+        "cpu": (cpu_finished.user - cpu_started.user) + (cpu_finished.system - cpu_started.system),
+        "model_path": model_path,
+        "error": error,
+    })
+
+def _collect(results, processes: list) -> dict[str, dict]:
+    # 작업자가 결과 없이 죽어도 (OOM 등) 멈추지 않도록 살아 있는 동안만 기다린다
+    collected = {}
+    while len(collected) < len(processes):
+        try:
+            row = results.get(timeout=1.0)
+        except queue.Empty:
+            if not any(p.is_alive() for p in processes):
+                break
+            continue
+        collected[row["interval"]] = row
+    for p in processes:
+        p.join()
+    return collected
+
+def run_workers(symbol: str, specs: dict[str, dict], sequential: bool = False,
+                incremental: bool = False, resume: bool = False) -> dict[str, dict]:
+    # spawn: 부모의 스레드 / 소켓 상태를 물려받지 않은 새 프로세스에서 TensorFlow 를 처음 초기화한다
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    cores = available_cores()
+    intervals = list(specs)
+
+    if sequential:
+        collected = {}
+        for interval in intervals:
+            p = ctx.Process(target=_train_worker,
+                            args=(interval, symbol, specs[interval], len(cores), None, incremental, resume, results))
+            p.start()
+            collected.update(_collect(results, [p]))
+        return collected
+
+    processes = []
+    for interval, cpus in zip(intervals, split_cores(cores, len(intervals))):
+        threads = len(cpus) if cpus else 1
+        p = ctx.Process(target=_train_worker,
+                        args=(interval, symbol, specs[interval], threads, cpus, incremental, resume, results))
+        p.start()
+        processes.append(p)
+    return _collect(results, processes)
+
+# === 결과 출력 ===
+def print_report(intervals: list[str], collected: dict[str, dict], elapsed: float, load_seconds: float):
+    print(f"\n{'interval':<10}{'threads':>8}{'wall s':>10}{'cpu s':>10}{'cores':>8}{'util':>8}  결과")
+    for interval in intervals:
+        row = collected.get(interval)
+        if row is None:
+            print(f"{interval:<10}{'-':>8}{'-':>10}{'-':>10}{'-':>8}{'-':>8}  ❌ 작업자가 결과 없이 종료됨")
+            continue
+        busy = row["cpu"] / row["wall"] if row["wall"] else 0.0  # 평균적으로 바빴던 코어 수
+        util = busy / row["threads"]                              # 배정받은 코어 대비 활용률
+        outcome = f"❌ {row['error']}" if row["error"] else (row["model_path"] or "❌ 데이터 부족")
+        print(f"{interval:<10}{row['threads']:>8}{row['wall']:>10.1f}{row['cpu']:>10.1f}"
+              f"{busy:>8.2f}{util:>8.0%}  {outcome}")
+
+    walls = sum(row["wall"] for row in collected.values())
+    print(f"\n⏱️ 데이터 로드 {load_seconds:.1f}s + 학습 {elapsed:.1f}s "
+          f"(작업자 wall time 합계 {walls:.1f}s, 합계 대비 {walls / elapsed if elapsed else 0:.2f}배)")
+
+# === 실행 ===
 def main():
-    symbol = input("📥 학습할 심볼 입력 (예: BTC): ").strip().upper()
+    parser = argparse.ArgumentParser(description="타임프레임별 모델 병렬 학습")
+    parser.add_argument("symbol", nargs="?")
+    parser.add_argument("--intervals", nargs="+", default=list(TRAINERS), choices=list(TRAINERS))
+    parser.add_argument("--sequential", action="store_true", help="코어 전체로 하나씩 학습 (비교용)")
+    parser.add_argument("--incremental", action="store_true", help="최신 모델에 새로 마감된 캔들만 이어서 학습")
+    parser.add_argument("--resume", action="store_true", help="중단된 전체 학습을 타임프레임별 마지막 체크포인트에서 이어서 학습")
+    args = parser.parse_args()
+    symbol = (args.symbol or input("📥 학습할 심볼 입력 (예: BTC): ")).strip().upper()
 
-    print("\n📚 === ML 전체 학습 시작 (병렬 실행) ===")
+    mode = "증분" if args.incremental else "전체"
+    print(f"\n📚 === ML {mode} 학습 시작 ({'순차' if args.sequential else '병렬'} 실행) ===")
     print(f"📌 심볼: {symbol}")
     print("----------------------------")
 
-    # 병렬 실행
-    processes = [
-        run_in_process(train_15m, symbol),
-        run_in_process(train_1h, symbol),
-        run_in_process(train_4h, symbol),
-        run_in_process(train_1d, symbol),
-    ]
+    # 캔들 / 피처는 부모에서 한 번만 로드 (세션 하나로 API 연결 재사용)
+    load_started = time.perf_counter()
+    binance, store = BinanceService(), KlineStore()
+    blocks, specs = [], {}
+    try:
+        for interval in args.intervals:
+            timestamps, data = load_features(symbol, interval, binance=binance, store=store)
+            shm, specs[interval] = publish(timestamps, data)
+            blocks.append(shm)
+            print(f"📦 {interval}: {len(data)}행 × {data.shape[1]}열 공유 메모리 게시 ({shm.size / 1024:.0f} KB)")
+        load_seconds = time.perf_counter() - load_started
 
-    # 학습 완료까지 대기
-    for p in processes:
-        p.join()
+        started = time.perf_counter()
+        collected = run_workers(symbol, specs, args.sequential, args.incremental, args.resume)
+        elapsed = time.perf_counter() - started
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
 
     print("----------------------------")
+    print_report(args.intervals, collected, elapsed, load_seconds)
     print("✅ 모든 학습 완료!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
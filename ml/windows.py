@@ -0,0 +1,46 @@
+"""
+windows.py
+🪟 LSTM 학습용 슬라이딩 윈도우 생성 (공용)
+
+- make_windows: (N, seq_len, F) 윈도우를 복사 없이 strided 읽기 전용 뷰로 만들고, 정렬된 타깃을 함께 반환
+- iter_batches: 전체 텐서를 만들지 않고 배치 단위로만 윈도우를 복사해 흘려보냄
+- 메모리: 원본 (N, F) 배열 하나만 유지 (N·seq_len·F 크기의 사본을 만들지 않음)
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# target_offset: 윈도우 끝(미포함) 다음 몇 번째 행을 타깃으로 쓸지
+#   1 → X = data[i - seq_len:i], y = data[i + 1]   (15m / 1h / 4h / 1d 학습 스크립트)
+#   0 → X = data[i - seq_len:i], y = data[i]       (1m 학습 스크립트)
+def window_count(length: int, seq_len: int, target_offset: int = 1) -> int:
+    return max(0, length - seq_len - target_offset)
+
+def make_windows(data: np.ndarray, seq_len: int, target_offset: int = 1,
+                 target_columns=slice(0, 4)) -> tuple[np.ndarray, np.ndarray]:
+    data = np.asarray(data)
+    count = window_count(len(data), seq_len, target_offset)
+    if count == 0:
+        # 데이터가 짧아도 정상 경로와 같은 rank 를 유지한다 (y 는 (0, 타깃 열 수))
+        n_targets = data[:0, target_columns].shape[1]
+        return (np.empty((0, seq_len, data.shape[1]), dtype=data.dtype),
+                np.empty((0, n_targets), dtype=data.dtype))
+
+    # sliding_window_view 는 윈도우 축을 마지막에 두므로 (N, F, seq_len) → (N, seq_len, F) 로 바꾼다
+    X = sliding_window_view(data, seq_len, axis=0).transpose(0, 2, 1)[:count]
+    start = seq_len + target_offset
+    y = data[start:start + count, target_columns]
+    return X, y
+
+def iter_batches(data: np.ndarray, seq_len: int, batch_size: int, target_offset: int = 1,
+                 target_columns=slice(0, 4), indices: np.ndarray | None = None,
+                 shuffle: bool = False, seed: int | None = None):
+    # indices: 사용할 윈도우 번호 (예: 학습/검증 분할). 기본값은 전체.
+    X, y = make_windows(data, seq_len, target_offset, target_columns)
+    if indices is None:
+        indices = np.arange(len(X))
+    if shuffle:
+        indices = np.random.default_rng(seed).permutation(indices)
+    for start in range(0, len(indices), batch_size):
+        batch = indices[start:start + batch_size]
+        yield np.ascontiguousarray(X[batch]), np.ascontiguousarray(y[batch])
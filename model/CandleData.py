@@ -1,10 +1,17 @@
 # model/CandleData.py
 
 class CandleData:
+    # 캔들 한 개(행). 대량의 캔들은 CandleSeries(컬럼 배열)로 다루고, 이 클래스는 행 단위 접근용이다.
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume")
+
     def __init__(self, timestamp, open_, high, low, close, volume):
         self.timestamp = timestamp  # Unix timestamp in ms
         self.open = open_
         self.high = high
         self.low = low
         self.close = close
-        self.volume = volume
\ No newline at end of file
+        self.volume = volume
+
+    def __repr__(self):
+        return (f"CandleData(timestamp={self.timestamp}, open={self.open}, high={self.high}, "
+                f"low={self.low}, close={self.close}, volume={self.volume})")
@@ -0,0 +1,122 @@
+# model/CandleSeries.py
+import numpy as np
+from model.CandleData import CandleData
+
+# 캔들 한 개를 하나의 레코드로 저장할 때의 구조 (파일 저장 / memmap 용)
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+])
+
+class CandleSeries:
+    # 캔들 묶음을 컬럼(NumPy 배열) 단위로 보관한다.
+    # 슬라이싱/윈도우는 배열 뷰만 만들고 데이터를 복사하지 않는다.
+    __slots__ = ("timestamps", "opens", "highs", "lows", "closes", "volumes")
+
+    def __init__(self, timestamps, opens, highs, lows, closes, volumes):
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)  # open_time (Unix ms)
+        self.opens = np.asarray(opens, dtype=np.float64)
+        self.highs = np.asarray(highs, dtype=np.float64)
+        self.lows = np.asarray(lows, dtype=np.float64)
+        self.closes = np.asarray(closes, dtype=np.float64)
+        self.volumes = np.asarray(volumes, dtype=np.float64)
+
+    @classmethod
+    def empty(cls) -> "CandleSeries":
+        return cls([], [], [], [], [], [])
+
+    @classmethod
+    def from_klines(cls, klines: list) -> "CandleSeries":
+        # Binance /klines 응답: [open_time, open, high, low, close, volume, ...]
+        if not klines:
+            return cls.empty()
+        values = np.array([k[1:6] for k in klines], dtype=np.float64)
+        timestamps = np.array([k[0] for k in klines], dtype=np.int64)
+        return cls(timestamps, *values.T)
+
+    @classmethod
+    def from_candles(cls, candles: list[CandleData]) -> "CandleSeries":
+        if not candles:
+            return cls.empty()
+        timestamps = np.array([c.timestamp for c in candles], dtype=np.int64)
+        values = np.array([[c.open, c.high, c.low, c.close, c.volume] for c in candles], dtype=np.float64)
+        return cls(timestamps, *values.T)
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "CandleSeries":
+        # RECORD_DTYPE 구조 배열(또는 memmap)의 필드 뷰를 그대로 컬럼으로 쓴다 (복사 없음)
+        return cls(records["timestamp"], records["open"], records["high"],
+                   records["low"], records["close"], records["volume"])
+
+    def to_records(self) -> np.ndarray:
+        records = np.empty(len(self), dtype=RECORD_DTYPE)
+        records["timestamp"] = self.timestamps
+        records["open"] = self.opens
+        records["high"] = self.highs
+        records["low"] = self.lows
+        records["close"] = self.closes
+        records["volume"] = self.volumes
+        return records
+
+    @classmethod
+    def concat(cls, series_list: list["CandleSeries"]) -> "CandleSeries":
+        # 여러 묶음을 open_time 순으로 합치고 중복 open_time 은 하나만 남긴다
+        if not series_list:
+            return cls.empty()
+        timestamps = np.concatenate([s.timestamps for s in series_list])
+        _, index = np.unique(timestamps, return_index=True)
+        return cls(timestamps[index],
+                   np.concatenate([s.opens for s in series_list])[index],
+                   np.concatenate([s.highs for s in series_list])[index],
+                   np.concatenate([s.lows for s in series_list])[index],
+                   np.concatenate([s.closes for s in series_list])[index],
+                   np.concatenate([s.volumes for s in series_list])[index])
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        # series[i] → CandleData 한 개, series[a:b] → 뷰로 된 CandleSeries
+        if isinstance(index, slice):
+            return CandleSeries(self.timestamps[index], self.opens[index], self.highs[index],
+                                self.lows[index], self.closes[index], self.volumes[index])
+        return CandleData(int(self.timestamps[index]), float(self.opens[index]), float(self.highs[index]),
+                          float(self.lows[index]), float(self.closes[index]), float(self.volumes[index]))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def tail(self, limit: int) -> "CandleSeries":
+        return self[max(0, len(self) - limit):]
+
+    def window(self, end: int, length: int) -> "CandleSeries":
+        # end 번째 캔들(미포함)까지의 최근 length 개
+        return self[max(0, end - length):end]
+
+    def between(self, start_time: int | None = None, end_time: int | None = None) -> "CandleSeries":
+        # start_time <= open_time <= end_time 인 구간 (timestamps 는 정렬되어 있어야 한다)
+        start = 0 if start_time is None else int(np.searchsorted(self.timestamps, start_time, side="left"))
+        stop = len(self) if end_time is None else int(np.searchsorted(self.timestamps, end_time, side="right"))
+        return self[start:stop]
+
+    def ohlcv(self) -> np.ndarray:
+        # (n, 5) [open, high, low, close, volume] 행렬 (복사본)
+        return np.column_stack([self.opens, self.highs, self.lows, self.closes, self.volumes])
+
+    def prices(self) -> list[float]:
+        return self.closes.tolist()
+
+    def price_volume(self) -> list[list[float]]:
+        return np.column_stack([self.closes, self.volumes]).tolist()
+
+    def to_candles(self) -> list[CandleData]:
+        return [
+            CandleData(t, o, h, l, c, v)
+            for t, o, h, l, c, v in zip(self.timestamps.tolist(), self.opens.tolist(), self.highs.tolist(),
+                                        self.lows.tolist(), self.closes.tolist(), self.volumes.tolist())
+        ]
@@ -0,0 +1,72 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from model.PriceInfo import PriceInfo
+from model.CandleData import CandleData
+from model.CandleSeries import CandleSeries
+from services.BinanceService import BinanceService
+
+class RateLimiter:
+    # 요청 시작 간격을 1 / requests_per_second 초 이상으로 벌린다
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class AsyncBinanceService:
+    # BinanceService 의 요청을 스레드 풀에서 동시에 실행하는 asyncio 래퍼.
+    # 동시에 나가는 요청 수는 concurrency 로 제한되고, 세션 커넥션 풀도 같은 크기로 맞춘다.
+    def __init__(self, concurrency: int = 16, service: BinanceService | None = None,
+                 requests_per_second: float | None = None, **service_kwargs):
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self._rate_limiter = None
+        self.service = service or BinanceService(pool_size=concurrency, **service_kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="binance")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.service.close()
+
+    async def _run(self, func, *args):
+        if self.requests_per_second:
+            # asyncio.Lock 은 이벤트 루프에 묶이므로 처음 쓰일 때 만든다
+            if self._rate_limiter is None:
+                self._rate_limiter = RateLimiter(self.requests_per_second)
+            await self._rate_limiter.wait()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def fetch_price(self, symbol: str) -> PriceInfo:
+        return await self._run(self.service.fetch_price, symbol)
+
+    async def fetch_candle_series(self, symbol: str, limit: int, interval: str) -> CandleSeries:
+        return await self._run(self.service.fetch_candle_series, symbol, limit, interval)
+
+    async def fetch_candle_range(self, symbol: str, interval: str, start_time: int, end_time: int,
+                                 limit: int = 1000) -> CandleSeries:
+        return await self._run(self.service.fetch_candle_range, symbol, interval, start_time, end_time, limit)
+
+    async def fetch_historical_candle_data(self, symbol: str, limit: int, interval: str) -> list[CandleData]:
+        series = await self.fetch_candle_series(symbol, limit, interval)
+        return series.to_candles()
+
+    async def fetch_many(self, requests: list[tuple[str, str, int]],
+                         return_exceptions: bool = False) -> list[CandleSeries]:
+        # [(symbol, interval, limit), ...] → 같은 순서의 CandleSeries 목록
+        tasks = [self.fetch_candle_series(symbol, limit, interval) for symbol, interval, limit in requests]
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
@@ -0,0 +1,52 @@
+# services/Backfill.py
+# /klines 의 1회 최대 1000개 제한을 넘는 과거 데이터를 startTime/endTime 페이지로 나눠 받는다.
+import asyncio
+import time
+from model.CandleSeries import CandleSeries
+from services.AsyncBinanceService import AsyncBinanceService
+from utils.Intervals import interval_to_ms
+
+MAX_PAGE_SIZE = 1000
+
+def plan_kline_pages(start_time: int, end_time: int, interval: str,
+                     page_size: int = MAX_PAGE_SIZE) -> list[tuple[int, int]]:
+    # [start_time, end_time] 구간을 캔들 page_size 개씩 담기는 (startTime, endTime) 페이지로 나눈다
+    if not 0 < page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+    step = interval_to_ms(interval)
+    # 구간 시작을 봉 경계로 올림 (Binance 는 open_time >= startTime 인 봉만 돌려준다)
+    first = -(-start_time // step) * step
+    pages = []
+    page_start = first
+    while page_start <= end_time:
+        page_end = min(page_start + page_size * step - 1, end_time)
+        pages.append((page_start, page_end))
+        page_start += page_size * step
+    return pages
+
+def merge_kline_pages(pages: list[CandleSeries], start_time: int | None = None,
+                      end_time: int | None = None) -> CandleSeries:
+    # 페이지들을 open_time 기준으로 정렬/중복 제거해 하나의 연속 배열로 합친다
+    merged = CandleSeries.concat([p for p in pages if len(p)])
+    return merged.between(start_time, end_time)
+
+async def backfill_async(service: AsyncBinanceService, symbol: str, interval: str,
+                         start_time: int, end_time: int | None = None,
+                         page_size: int = MAX_PAGE_SIZE) -> CandleSeries:
+    end_time = int(time.time() * 1000) if end_time is None else end_time
+    pages = plan_kline_pages(start_time, end_time, interval, page_size)
+    results = await asyncio.gather(*[
+        service.fetch_candle_range(symbol, interval, page_start, page_end, page_size)
+        for page_start, page_end in pages
+    ])
+    return merge_kline_pages(results, start_time, end_time)
+
+def backfill(symbol: str, interval: str, start_time: int, end_time: int | None = None,
+             concurrency: int = 8, requests_per_second: float = 10.0,
+             page_size: int = MAX_PAGE_SIZE, **service_kwargs) -> CandleSeries:
+    # 동기 코드에서 쓰는 진입점. 요청 수는 concurrency / requests_per_second 로 제한한다.
+    async def run():
+        async with AsyncBinanceService(concurrency, requests_per_second=requests_per_second,
+                                       **service_kwargs) as service:
+            return await backfill_async(service, symbol, interval, start_time, end_time, page_size)
+    return asyncio.run(run())
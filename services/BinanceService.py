@@ -1,58 +1,132 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
 import requests
+from requests.adapters import HTTPAdapter
 from model.PriceInfo import PriceInfo
 from model.CandleData import CandleData
+from model.CandleSeries import CandleSeries
+from services.RequestStats import RequestStats
 
 class BinanceService:
     BASE_URL = "https://api.binance.us/api/v3"
+    RETRY_STATUS = {418, 429, 500, 502, 503, 504}
+
+    def __init__(self, cache_ttl: float = 5.0, base_url: str | None = None,
+                 pool_size: int = 10, connect_timeout: float = 3.05, read_timeout: float = 10.0,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 10.0):
+        # 같은 (심볼, 구간) kline 요청은 cache_ttl 초 안에서는 한 번만 보낸다
+        self.cache_ttl = cache_ttl
+        self._kline_cache: dict[tuple[str, str], tuple[float, int, CandleSeries]] = {}
+
+        # 연결을 재사용하는 세션 (TCP+TLS 핸드셰이크는 연결당 한 번)
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = RequestStats()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def latency_stats(self) -> dict[str, dict]:
+        return self.stats.summary()
+
+    @staticmethod
+    def _retry_after(response: requests.Response | None) -> float | None:
+        # Retry-After 헤더 (초 또는 HTTP 날짜) → 기다릴 초. 없거나 해석할 수 없으면 None
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+
+    def _retry_delay(self, attempt: int, response: requests.Response | None) -> float:
+        # Retry-After 가 있으면 그대로 따르고, 없거나 잘못된 값이면 지수 백오프 + full jitter
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _get(self, path: str, params: dict):
+        url = f"{self.base_url}{path}"
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+                if response.status_code not in self.RETRY_STATUS:
+                    response.raise_for_status()
+                    self.stats.record(path, time.perf_counter() - started, retries=attempt)
+                    return response.json()
+                error = requests.HTTPError(f"{response.status_code} for url: {response.url}", response=response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except requests.HTTPError:
+                self.stats.record(path, time.perf_counter() - started, retries=attempt, failed=True)
+                raise
+
+            delay = self._retry_delay(attempt, response)
+            # Retry-After 가 backoff_max 보다 길면 (418 IP 차단 등) 그동안 잠들지 않고 바로 실패한다
+            if attempt >= self.max_retries or delay > self.backoff_max:
+                self.stats.record(path, time.perf_counter() - started, retries=attempt, failed=True)
+                raise error
+            time.sleep(delay)
+            attempt += 1
 
     def fetch_price(self, input_symbol: str) -> PriceInfo:
         symbol = input_symbol.upper()
         if not symbol.endswith("USDT"):
             symbol += "USDT"
-        endpoint = f"{self.BASE_URL}/ticker/price?symbol={symbol}"
-        response = requests.get(endpoint)
-        response.raise_for_status()
-        data = response.json()
+        data = self._get("/ticker/price", {"symbol": symbol})
         price = data["price"]
         base_symbol = symbol.replace("USDT", "")
         return PriceInfo("Binance", base_symbol, "USD", price)
 
-    def fetch_historical_prices(self, symbol: str, limit: int, interval: str) -> list[float]:
+    def fetch_candle_series(self, symbol: str, limit: int, interval: str) -> CandleSeries:
         if not interval:
             raise ValueError("Timeframe (interval) must be explicitly provided.")
+        key = (symbol.upper(), interval)
+        cached = self._kline_cache.get(key)
+        if cached is not None:
+            fetched_at, cached_limit, series = cached
+            # 더 긴 요청을 이미 받아 두었다면 그 꼬리를 그대로 쓴다
+            if time.monotonic() - fetched_at < self.cache_ttl and cached_limit >= limit:
+                return series.tail(limit)
+
         symbol = symbol.upper() + "USDT"
-        endpoint = f"{self.BASE_URL}/klines?symbol={symbol}&interval={interval}&limit={limit}"
-        response = requests.get(endpoint)
-        response.raise_for_status()
-        klines = response.json()
-        return [float(kline[4]) for kline in klines]
+        klines = self._get("/klines", {"symbol": symbol, "interval": interval, "limit": limit})
+        series = CandleSeries.from_klines(klines)
+        self._kline_cache[key] = (time.monotonic(), limit, series)
+        return series
 
-    def fetch_historical_price_volume(self, symbol: str, limit: int, interval: str) -> list[list[float]]:
+    def fetch_candle_range(self, symbol: str, interval: str, start_time: int, end_time: int,
+                           limit: int = 1000) -> CandleSeries:
+        # open_time 이 [start_time, end_time] 인 캔들 (한 번에 최대 limit 개, 캐시 사용 안 함)
         if not interval:
             raise ValueError("Timeframe (interval) must be explicitly provided.")
         symbol = symbol.upper() + "USDT"
-        endpoint = f"{self.BASE_URL}/klines?symbol={symbol}&interval={interval}&limit={limit}"
-        response = requests.get(endpoint)
-        response.raise_for_status()
-        klines = response.json()
-        return [[float(k[4]), float(k[5])] for k in klines]
+        klines = self._get("/klines", {"symbol": symbol, "interval": interval, "limit": limit,
+                                       "startTime": start_time, "endTime": end_time})
+        return CandleSeries.from_klines(klines)
+
+    def fetch_historical_prices(self, symbol: str, limit: int, interval: str) -> list[float]:
+        return self.fetch_candle_series(symbol, limit, interval).prices()
+
+    def fetch_historical_price_volume(self, symbol: str, limit: int, interval: str) -> list[list[float]]:
+        return self.fetch_candle_series(symbol, limit, interval).price_volume()
 
     def fetch_historical_candle_data(self, symbol: str, limit: int, interval: str) -> list[CandleData]:
-        if not interval:
-            raise ValueError("Timeframe (interval) must be explicitly provided.")
-        symbol = symbol.upper() + "USDT"
-        endpoint = f"{self.BASE_URL}/klines?symbol={symbol}&interval={interval}&limit={limit}"
-        response = requests.get(endpoint)
-        response.raise_for_status()
-        klines = response.json()
-
-        candles = []
-        for k in klines:
-            timestamp = int(k[0])  # <--- ✅ open_time (Unix ms)
-            open_ = float(k[1])
-            high = float(k[2])
-            low = float(k[3])
-            close = float(k[4])
-            volume = float(k[5])
-            candles.append(CandleData(timestamp, open_, high, low, close, volume))
-        return candles
+        return self.fetch_candle_series(symbol, limit, interval).to_candles()
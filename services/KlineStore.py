@@ -0,0 +1,154 @@
+# services/KlineStore.py
+# (symbol, interval) 당 파일 하나에 마감된 캔들을 RECORD_DTYPE 고정 길이 레코드로 이어 붙여 저장한다.
+# 레코드는 open_time 오름차순이라 마지막 open_time 은 파일 끝을 seek 해서 바로 읽고,
+# 전체 데이터는 np.memmap 으로 복사 없이 연다.
+import os
+import time
+import numpy as np
+from model.CandleSeries import CandleSeries, RECORD_DTYPE
+from services.Backfill import MAX_PAGE_SIZE, backfill
+from services.BinanceService import BinanceService
+from utils.Intervals import interval_to_ms
+
+def missing_range(last_open_time: int | None, interval: str, now_ms: int,
+                  start_time: int | None = None, initial_limit: int = 1000) -> tuple[int, int] | None:
+    # 저장된 마지막 open_time 이후로 now_ms 까지 마감된 캔들의 (첫 open_time, 마지막 open_time).
+    # 저장된 데이터가 없으면 start_time 부터(없으면 최근 initial_limit 개). 받을 것이 없으면 None.
+    step = interval_to_ms(interval)
+    last_closed = (now_ms // step) * step - step
+    if last_open_time is not None:
+        first = last_open_time + step
+    elif start_time is not None:
+        first = start_time
+    else:
+        first = last_closed - (initial_limit - 1) * step
+    if first > last_closed:
+        return None
+    return first, last_closed
+
+def older_range(first_open_time: int | None, interval: str, now_ms: int,
+                initial_limit: int = 1000) -> tuple[int, int] | None:
+    # 최근 initial_limit 개 구간 중 저장된 첫 open_time 보다 앞쪽 (첫 open_time, 마지막 open_time).
+    # 저장된 데이터가 없거나 이미 그 구간을 덮고 있으면 None.
+    if first_open_time is None:
+        return None
+    step = interval_to_ms(interval)
+    first = (now_ms // step) * step - step - (initial_limit - 1) * step
+    last = first_open_time - step
+    if first > last:
+        return None
+    return first, last
+
+class KlineStore:
+    def __init__(self, root: str = os.path.join("data", "klines")):
+        self.root = root
+
+    def path(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, f"{symbol.upper()}_{interval}.bin")
+
+    def count(self, symbol: str, interval: str) -> int:
+        path = self.path(symbol, interval)
+        if not os.path.exists(path):
+            return 0
+        return os.path.getsize(path) // RECORD_DTYPE.itemsize
+
+    def last_open_time(self, symbol: str, interval: str) -> int | None:
+        count = self.count(symbol, interval)
+        if count == 0:
+            return None
+        with open(self.path(symbol, interval), "rb") as f:
+            f.seek((count - 1) * RECORD_DTYPE.itemsize)
+            record = np.frombuffer(f.read(RECORD_DTYPE.itemsize), dtype=RECORD_DTYPE)
+        return int(record["timestamp"][0])
+
+    def first_open_time(self, symbol: str, interval: str) -> int | None:
+        if self.count(symbol, interval) == 0:
+            return None
+        with open(self.path(symbol, interval), "rb") as f:
+            record = np.frombuffer(f.read(RECORD_DTYPE.itemsize), dtype=RECORD_DTYPE)
+        return int(record["timestamp"][0])
+
+    def append(self, symbol: str, interval: str, series: CandleSeries) -> int:
+        # 마지막으로 저장된 open_time 이후의 캔들만 추가하고, 추가한 개수를 돌려준다
+        last = self.last_open_time(symbol, interval)
+        if last is not None:
+            series = series.between(last + 1, None)
+        if len(series) == 0:
+            return 0
+
+        path = self.path(symbol, interval)
+        os.makedirs(self.root, exist_ok=True)
+        if os.path.exists(path):
+            # 쓰다가 끊겨 남은 불완전한 레코드는 잘라낸다
+            os.truncate(path, self.count(symbol, interval) * RECORD_DTYPE.itemsize)
+        with open(path, "ab") as f:
+            series.to_records().tofile(f)
+        return len(series)
+
+    def prepend(self, symbol: str, interval: str, series: CandleSeries) -> int:
+        # 처음으로 저장된 open_time 이전의 캔들만 앞에 붙이고, 추가한 개수를 돌려준다.
+        # 레코드 파일은 앞에 이어 쓸 수 없으므로 임시 파일에 [새 캔들 + 기존 레코드] 를 쓴 뒤 교체한다
+        # (이미 열린 memmap 은 교체 전 파일을 계속 본다).
+        first = self.first_open_time(symbol, interval)
+        if first is None:
+            return self.append(symbol, interval, series)
+        series = series.between(None, first - 1)
+        if len(series) == 0:
+            return 0
+
+        path = self.path(symbol, interval)
+        count = self.count(symbol, interval)
+        existing = np.fromfile(path, dtype=RECORD_DTYPE, count=count)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            series.to_records().tofile(f)
+            existing.tofile(f)
+        os.replace(tmp_path, path)
+        return len(series)
+
+    def load(self, symbol: str, interval: str, start_time: int | None = None,
+             end_time: int | None = None) -> CandleSeries:
+        count = self.count(symbol, interval)
+        if count == 0:
+            return CandleSeries.empty()
+        records = np.memmap(self.path(symbol, interval), dtype=RECORD_DTYPE, mode="r", shape=(count,))
+        return CandleSeries.from_records(records).between(start_time, end_time)
+
+    def ohlcv_view(self, symbol: str, interval: str) -> np.ndarray:
+        # 레코드 파일을 (N, 5) [open, high, low, close, volume] float 배열로 보는 memmap 뷰 (복사 없음)
+        count = self.count(symbol, interval)
+        if count == 0:
+            return np.empty((0, 5))
+        records = np.memmap(self.path(symbol, interval), dtype=RECORD_DTYPE, mode="r", shape=(count,))
+        return np.ndarray(shape=(count, 5), dtype=np.float64, buffer=records,
+                          offset=RECORD_DTYPE.fields["open"][1], strides=(RECORD_DTYPE.itemsize, 8))
+
+    def sync(self, symbol: str, interval: str, binance: BinanceService | None = None,
+             start_time: int | None = None, initial_limit: int = 1000, now_ms: int | None = None) -> int:
+        # 마지막으로 저장된 캔들 이후에 마감된 캔들만 받아서 붙인다.
+        # 저장된 데이터가 없으면 start_time 부터(없으면 최근 initial_limit 개) 받는다.
+        # start_time 없이 저장된 캔들이 initial_limit 개보다 적으면 (더 짧은 이력으로 먼저 채운 저장소)
+        # 최근 initial_limit 개 구간의 앞쪽도 받아서 앞에 붙인다.
+        binance = binance or BinanceService()
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        added = 0
+        missing = missing_range(self.last_open_time(symbol, interval), interval, now_ms,
+                                start_time, initial_limit)
+        if missing is not None:
+            first, last_closed = missing
+            added += self.append(symbol, interval, self._fetch(binance, symbol, interval, first, last_closed))
+
+        if start_time is None and self.count(symbol, interval) < initial_limit:
+            older = older_range(self.first_open_time(symbol, interval), interval, now_ms, initial_limit)
+            if older is not None:
+                first, last = older
+                added += self.prepend(symbol, interval, self._fetch(binance, symbol, interval, first, last))
+        return added
+
+    @staticmethod
+    def _fetch(binance: BinanceService, symbol: str, interval: str, first: int, last: int) -> CandleSeries:
+        if (last - first) // interval_to_ms(interval) + 1 <= MAX_PAGE_SIZE:
+            series = binance.fetch_candle_range(symbol, interval, first, last, MAX_PAGE_SIZE)
+        else:
+            series = backfill(symbol, interval, first, last, base_url=binance.base_url)
+        return series.between(first, last)
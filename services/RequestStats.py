@@ -0,0 +1,43 @@
+# services/RequestStats.py
+import threading
+from collections import deque
+
+class RequestStats:
+    # 엔드포인트별 요청 지연시간(초) 통계. 최근 window 개 표본으로 백분위를 계산한다.
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, dict] = {}
+
+    def record(self, endpoint: str, seconds: float, retries: int = 0, failed: bool = False):
+        with self._lock:
+            entry = self._endpoints.setdefault(endpoint, {
+                "count": 0, "failures": 0, "retries": 0, "total": 0.0, "max": 0.0,
+                "samples": deque(maxlen=self.window),
+            })
+            entry["count"] += 1
+            entry["retries"] += retries
+            entry["failures"] += int(failed)
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            entry["samples"].append(seconds)
+
+    def summary(self) -> dict[str, dict]:
+        with self._lock:
+            result = {}
+            for endpoint, entry in self._endpoints.items():
+                samples = sorted(entry["samples"])
+                result[endpoint] = {
+                    "count": entry["count"],
+                    "failures": entry["failures"],
+                    "retries": entry["retries"],
+                    "mean": entry["total"] / entry["count"],
+                    "p50": samples[len(samples) // 2],
+                    "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+                    "max": entry["max"],
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
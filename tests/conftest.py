@@ -0,0 +1,16 @@
+# tests/conftest.py
+import os
+import sys
+import pytest
+
+# 스크립트들처럼 저장소 루트 기준으로 import 한다 (from services... / from model...)
+# ml/ 스크립트는 서로 형제 모듈로 import 하므로 (from windows import ...) ml/ 도 경로에 넣는다
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "ml")]
+
+from mock_exchange import serve
+
+@pytest.fixture
+def exchange():
+    with serve() as exchange:
+        yield exchange
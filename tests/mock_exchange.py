@@ -0,0 +1,99 @@
+# tests/mock_exchange.py
+# 로컬 ThreadingHTTPServer 로 띄우는 Binance REST 대역 (/api/v3/klines, /api/v3/ticker/price)
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from utils.Intervals import interval_to_ms
+
+NOW_MS = 1_700_000_040_000  # 대역 거래소의 현재 시각 (1m 경계)
+MAX_LIMIT = 1000
+
+def kline_close(symbol: str, open_time: int) -> float:
+    # 심볼과 open_time 으로 정해지는 종가 (결과가 어느 요청의 것인지 확인할 때 쓴다)
+    return float(sum(map(ord, symbol)) * 10 + open_time // 60_000 % 1000)
+
+class MockExchange:
+    def __init__(self, now_ms: int = NOW_MS):
+        self.now_ms = now_ms
+        self.responses = []          # (status, headers, body) — 있으면 다음 요청부터 순서대로 돌려준다
+        self.delays = {}             # symbol → 응답 지연 (초)
+        self.failing_symbols = set() # 400 Invalid symbol 로 응답
+        self.missing = set()         # 거래소 데이터에 없는 open_time (데이터 공백)
+        self.requests = []           # (path, params, 시작 시각 monotonic)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def handle(self, path: str, params: dict) -> tuple[int, dict, object]:
+        with self._lock:
+            self.requests.append((path, params, time.monotonic()))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            scripted = self.responses.pop(0) if self.responses else None
+        try:
+            time.sleep(self.delays.get(params.get("symbol"), 0.0))
+            if scripted is not None:
+                return scripted
+            if params.get("symbol") in self.failing_symbols:
+                return 400, {}, {"code": -1121, "msg": "Invalid symbol."}
+            if path == "/api/v3/klines":
+                return 200, {}, self.klines(params)
+            if path == "/api/v3/ticker/price":
+                return 200, {}, {"symbol": params["symbol"], "price": "100.00"}
+            return 404, {}, {"code": -1, "msg": "Not found"}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def klines(self, params: dict) -> list:
+        # 실제 /klines 처럼 startTime 이 있으면 open_time >= startTime 인 봉부터, 없으면 최근 limit 개
+        symbol, step = params["symbol"], interval_to_ms(params["interval"])
+        limit = min(int(params.get("limit", 500)), MAX_LIMIT)
+        end = min(int(params.get("endTime", self.now_ms)), self.now_ms)
+        if "startTime" in params:
+            open_time = -(-int(params["startTime"]) // step) * step
+        else:
+            open_time = end // step * step - (limit - 1) * step
+        rows = []
+        while open_time <= end and len(rows) < limit:
+            if open_time not in self.missing:
+                close = kline_close(symbol, open_time)
+                rows.append([open_time, str(close), str(close + 1), str(close - 1), str(close), "1.0",
+                             open_time + step - 1])
+            open_time += step
+        return rows
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        status, headers, body = self.server.exchange.handle(url.path, params)
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+@contextmanager
+def serve(exchange: MockExchange | None = None):
+    # 빈 포트에 서버를 띄우고 exchange.base_url 을 채워 돌려준다
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.exchange = exchange or MockExchange()
+    server.exchange.base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v3"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.exchange
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,100 @@
+# tests/test_async_binance_service.py
+# AsyncBinanceService.fetch_many / RateLimiter (로컬 대역 서버)
+import asyncio
+import time
+import numpy as np
+import pytest
+import requests
+from model.CandleSeries import CandleSeries
+from services.AsyncBinanceService import AsyncBinanceService, RateLimiter
+from mock_exchange import kline_close
+
+SYMBOLS = ["BTC", "ETH", "SOL", "XRP", "ADA", "DOGE", "DOT", "LINK"]
+
+def run(coro, timeout: float = 10.0):
+    # 작업이 멈추면 테스트가 끝나지 않는 대신 TimeoutError 로 실패하게 한다
+    return asyncio.run(asyncio.wait_for(coro, timeout))
+
+def test_fetch_many_returns_results_in_input_order(exchange):
+    # 앞쪽 심볼일수록 늦게 응답하게 해서 완료 순서와 입력 순서를 다르게 만든다
+    exchange.delays = {f"{s}USDT": 0.05 * (len(SYMBOLS) - i) for i, s in enumerate(SYMBOLS)}
+    requests_ = [(symbol, "1m", 10) for symbol in SYMBOLS]
+
+    async def main():
+        async with AsyncBinanceService(concurrency=len(SYMBOLS), base_url=exchange.base_url) as service:
+            return await service.fetch_many(requests_)
+
+    results = run(main())
+
+    assert len(results) == len(SYMBOLS)
+    for symbol, series in zip(SYMBOLS, results):
+        assert isinstance(series, CandleSeries) and len(series) == 10
+        expected = [kline_close(f"{symbol}USDT", int(t)) for t in series.timestamps]
+        np.testing.assert_array_equal(series.closes, expected)
+
+def test_concurrency_stays_within_limit(exchange):
+    exchange.delays = {f"{s}USDT": 0.1 for s in SYMBOLS}
+
+    async def main():
+        async with AsyncBinanceService(concurrency=3, base_url=exchange.base_url) as service:
+            return await service.fetch_many([(symbol, "1m", 5) for symbol in SYMBOLS])
+
+    run(main())
+
+    assert len(exchange.requests) == len(SYMBOLS)
+    assert 2 <= exchange.max_in_flight <= 3
+
+def test_rate_limiter_spaces_request_starts(exchange):
+    rps = 20.0
+
+    async def main():
+        async with AsyncBinanceService(concurrency=8, requests_per_second=rps,
+                                       base_url=exchange.base_url) as service:
+            return await service.fetch_many([(symbol, "1m", 5) for symbol in SYMBOLS])
+
+    run(main())
+
+    # 서버에 도착하는 시각은 스레드 스케줄링만큼 흔들리므로 개별 간격 대신 전체 구간으로 본다
+    starts = sorted(started for _, _, started in exchange.requests)
+    assert starts[-1] - starts[0] >= (len(SYMBOLS) - 1) / rps * 0.9
+
+def test_rate_limiter_slots():
+    limiter = RateLimiter(requests_per_second=50)
+
+    async def main():
+        started = time.monotonic()
+        times = []
+        for _ in range(6):
+            await limiter.wait()
+            times.append(time.monotonic() - started)
+        return times
+
+    times = run(main())
+    assert times[0] < 0.02
+    assert times[-1] >= 5 / 50 * 0.9
+
+def test_failing_symbol_is_reported_without_blocking_others(exchange):
+    exchange.failing_symbols = {"NOPEUSDT"}
+    requests_ = [("BTC", "1m", 5), ("NOPE", "1m", 5), ("ETH", "1m", 5)]
+
+    async def main():
+        async with AsyncBinanceService(concurrency=4, base_url=exchange.base_url) as service:
+            return await service.fetch_many(requests_, return_exceptions=True)
+
+    btc, nope, eth = run(main())
+
+    assert isinstance(nope, requests.HTTPError)
+    assert len(btc) == 5 and len(eth) == 5
+
+def test_failing_symbol_raises_without_hanging(exchange):
+    exchange.failing_symbols = {"NOPEUSDT"}
+    exchange.delays = {"BTCUSDT": 0.2, "ETHUSDT": 0.2}
+
+    async def main():
+        async with AsyncBinanceService(concurrency=4, base_url=exchange.base_url) as service:
+            return await service.fetch_many([("BTC", "1m", 5), ("NOPE", "1m", 5), ("ETH", "1m", 5)])
+
+    started = time.monotonic()
+    with pytest.raises(requests.HTTPError):
+        run(main(), timeout=5.0)
+    assert time.monotonic() - started < 5.0
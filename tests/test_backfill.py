@@ -0,0 +1,110 @@
+# tests/test_backfill.py
+# plan_kline_pages / merge_kline_pages / backfill 페이지 처리
+import asyncio
+import numpy as np
+import pytest
+from model.CandleSeries import CandleSeries
+from services.Backfill import MAX_PAGE_SIZE, backfill, backfill_async, merge_kline_pages, plan_kline_pages
+from mock_exchange import NOW_MS
+
+STEP = 60_000  # 1m
+START = NOW_MS - 5000 * STEP
+
+def candles(open_times) -> CandleSeries:
+    open_times = np.asarray(list(open_times), dtype=np.int64)
+    closes = open_times / STEP
+    return CandleSeries(open_times, closes, closes + 1, closes - 1, closes, np.ones(len(open_times)))
+
+class FakeService:
+    # backfill_async 가 쓰는 fetch_candle_range 만 가진 가짜 거래소. 요청마다 pages 를 하나씩 돌려준다.
+    def __init__(self, pages: list[CandleSeries]):
+        self.pages = list(pages)
+        self.calls = []
+
+    async def fetch_candle_range(self, symbol, interval, start_time, end_time, limit):
+        self.calls.append((start_time, end_time, limit))
+        return self.pages.pop(0)
+
+# === plan_kline_pages ===
+def test_exactly_one_full_page():
+    pages = plan_kline_pages(START, START + MAX_PAGE_SIZE * STEP - 1, "1m")
+    assert pages == [(START, START + MAX_PAGE_SIZE * STEP - 1)]
+
+def test_one_candle_past_the_limit_starts_a_new_page():
+    end = START + MAX_PAGE_SIZE * STEP
+    pages = plan_kline_pages(START, end, "1m")
+    assert pages == [(START, START + MAX_PAGE_SIZE * STEP - 1), (end, end)]
+
+def test_pages_are_contiguous_and_within_limit():
+    end = START + 2500 * STEP - 1
+    pages = plan_kline_pages(START, end, "1m")
+    assert len(pages) == 3
+    assert pages[0][0] == START and pages[-1][1] == end
+    for (_, prev_end), (next_start, _) in zip(pages, pages[1:]):
+        assert next_start == prev_end + 1
+    assert all((page_end - page_start) // STEP + 1 <= MAX_PAGE_SIZE for page_start, page_end in pages)
+
+def test_start_is_rounded_up_to_candle_boundary():
+    assert plan_kline_pages(START + 1, START + 10 * STEP, "1m")[0][0] == START + STEP
+
+def test_invalid_page_size():
+    with pytest.raises(ValueError):
+        plan_kline_pages(START, START + STEP, "1m", page_size=MAX_PAGE_SIZE + 1)
+
+# === merge_kline_pages ===
+def test_overlapping_and_duplicate_pages_are_deduplicated():
+    first = candles(START + STEP * np.arange(0, 10))
+    overlap = candles(START + STEP * np.arange(5, 15))
+    merged = merge_kline_pages([overlap, first, first])
+
+    np.testing.assert_array_equal(merged.timestamps, START + STEP * np.arange(15))
+    np.testing.assert_array_equal(merged.closes, merged.timestamps / STEP)
+
+def test_merge_of_only_empty_pages_is_empty():
+    assert len(merge_kline_pages([CandleSeries.empty(), CandleSeries.empty()])) == 0
+
+def test_merge_clips_to_requested_range():
+    merged = merge_kline_pages([candles(START + STEP * np.arange(20))], START + 5 * STEP, START + 9 * STEP)
+    np.testing.assert_array_equal(merged.timestamps, START + STEP * np.arange(5, 10))
+
+def test_backfill_async_with_fake_exchange_merges_overlapping_pages():
+    # 거래소가 페이지 경계를 넘겨 겹치는 봉을 돌려줘도 결과에는 한 번씩만 남는다
+    end = START + 2 * MAX_PAGE_SIZE * STEP - 1
+    service = FakeService([candles(START + STEP * np.arange(0, 1005)),
+                           candles(START + STEP * np.arange(995, 2000))])
+
+    merged = asyncio.run(backfill_async(service, "BTC", "1m", START, end))
+
+    assert len(service.calls) == 2
+    np.testing.assert_array_equal(merged.timestamps, START + STEP * np.arange(2000))
+
+# === backfill (로컬 대역 서버) ===
+def test_backfill_exact_page_boundary(exchange):
+    end = START + 2 * MAX_PAGE_SIZE * STEP - 1
+    series = backfill("BTC", "1m", START, end, base_url=exchange.base_url)
+
+    assert len(exchange.requests) == 2
+    assert len(series) == 2 * MAX_PAGE_SIZE
+    np.testing.assert_array_equal(np.diff(series.timestamps), STEP)
+
+def test_backfill_with_empty_final_page(exchange):
+    # 마지막 페이지는 거래소의 현재 시각 이후라 봉이 하나도 없다
+    start = NOW_MS - (MAX_PAGE_SIZE - 1) * STEP
+    series = backfill("BTC", "1m", start, NOW_MS + MAX_PAGE_SIZE * STEP, base_url=exchange.base_url)
+
+    assert len(exchange.requests) == 2
+    assert len(series) == MAX_PAGE_SIZE
+    assert series.timestamps[0] == start and series.timestamps[-1] == NOW_MS
+
+def test_backfill_keeps_gaps_in_exchange_data(exchange):
+    # 페이지 경계를 걸친 공백: 빠진 봉은 채우지 않고, 나머지는 순서대로 한 번씩
+    missing = START + STEP * np.arange(MAX_PAGE_SIZE - 3, MAX_PAGE_SIZE + 3)
+    exchange.missing = set(missing.tolist())
+    end = START + 2 * MAX_PAGE_SIZE * STEP - 1
+
+    series = backfill("BTC", "1m", START, end, base_url=exchange.base_url)
+
+    assert len(series) == 2 * MAX_PAGE_SIZE - len(missing)
+    assert not np.isin(series.timestamps, missing).any()
+    assert np.all(np.diff(series.timestamps) > 0)
+    assert series.timestamps[0] == START and series.timestamps[-1] == end - STEP + 1
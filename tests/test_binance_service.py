@@ -0,0 +1,94 @@
+# tests/test_binance_service.py
+# BinanceService 재시도 / Retry-After 처리 (로컬 대역 서버)
+import time
+from email.utils import formatdate
+import pytest
+import requests
+from services.BinanceService import BinanceService
+from mock_exchange import kline_close
+
+def make_service(exchange, **kwargs) -> BinanceService:
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("backoff_max", 1.0)
+    return BinanceService(base_url=exchange.base_url, cache_ttl=0, **kwargs)
+
+class FakeResponse:
+    def __init__(self, retry_after: str):
+        self.headers = {"Retry-After": retry_after}
+
+def test_retries_429_and_503_then_succeeds(exchange):
+    exchange.responses = [(429, {"Retry-After": "0"}, {}), (503, {}, {})]
+    service = make_service(exchange)
+
+    series = service.fetch_candle_series("BTC", 5, "1m")
+
+    assert len(series) == 5
+    assert series.closes[-1] == kline_close("BTCUSDT", int(series.timestamps[-1]))
+    assert len(exchange.requests) == 3
+    stats = service.latency_stats()["/klines"]
+    assert (stats["count"], stats["retries"], stats["failures"]) == (1, 2, 0)
+
+def test_exhausted_retry_budget_raises_and_counts_failure(exchange):
+    exchange.responses = [(503, {}, {})] * 3
+    service = make_service(exchange, max_retries=2)
+
+    with pytest.raises(requests.HTTPError):
+        service.fetch_candle_series("BTC", 5, "1m")
+
+    assert len(exchange.requests) == 3
+    stats = service.latency_stats()["/klines"]
+    assert (stats["count"], stats["retries"], stats["failures"]) == (1, 2, 1)
+
+def test_non_retryable_status_is_not_retried(exchange):
+    exchange.failing_symbols = {"NOPEUSDT"}
+    service = make_service(exchange)
+
+    with pytest.raises(requests.HTTPError):
+        service.fetch_candle_series("NOPE", 5, "1m")
+
+    assert len(exchange.requests) == 1
+    assert service.latency_stats()["/klines"]["failures"] == 1
+
+def test_retry_after_http_date_is_honoured(exchange):
+    exchange.responses = [(429, {"Retry-After": formatdate(time.time() - 5, usegmt=True)}, {})]
+    service = make_service(exchange)
+
+    assert len(service.fetch_candle_series("BTC", 5, "1m")) == 5
+    assert service.latency_stats()["/klines"]["retries"] == 1
+
+def test_invalid_retry_after_falls_back_to_backoff(exchange):
+    exchange.responses = [(429, {"Retry-After": "soon"}, {})]
+    service = make_service(exchange)
+
+    assert len(service.fetch_candle_series("BTC", 5, "1m")) == 5
+    stats = service.latency_stats()["/klines"]
+    assert (stats["retries"], stats["failures"]) == (1, 0)
+
+def test_retry_after_longer_than_backoff_max_fails_fast(exchange):
+    exchange.responses = [(418, {"Retry-After": "7200"}, {})]
+    service = make_service(exchange, backoff_max=1.0)
+
+    started = time.monotonic()
+    with pytest.raises(requests.HTTPError):
+        service.fetch_candle_series("BTC", 5, "1m")
+
+    assert time.monotonic() - started < 1.0
+    assert len(exchange.requests) == 1
+    assert service.latency_stats()["/klines"]["failures"] == 1
+
+@pytest.mark.parametrize("retry_after, low, high", [("3", 3.0, 3.0), ("-1", 0.0, 0.0)])
+def test_retry_delay_seconds(retry_after, low, high):
+    service = BinanceService()
+    assert low <= service._retry_delay(0, FakeResponse(retry_after)) <= high
+
+@pytest.mark.parametrize("offset, low, high", [(30, 28.0, 30.5), (-30, 0.0, 0.0)])
+def test_retry_delay_http_date(offset, low, high):
+    # HTTP 날짜는 초 단위라 현재 시각 기준으로 약간의 오차를 둔다
+    service = BinanceService()
+    retry_after = formatdate(time.time() + offset, usegmt=True)
+    assert low <= service._retry_delay(0, FakeResponse(retry_after)) <= high
+
+@pytest.mark.parametrize("retry_after", ["soon", "Mon, 99 Foo 2024 99:99:99 GMT", "   "])
+def test_retry_delay_ignores_unparseable_values(retry_after):
+    service = BinanceService(backoff_base=0.5, backoff_max=10.0)
+    assert 0.0 <= service._retry_delay(2, FakeResponse(retry_after)) <= 2.0
@@ -0,0 +1,95 @@
+# tests/test_features.py
+# 피처 캐시의 dtype (ML_FLOAT32 → float32 캐시 파일 / 반환 행렬)
+import json
+import os
+import numpy as np
+import pytest
+import features
+from features import FEATURE_COLUMNS, FeatureCache, build_features, update_feature_cache
+from model.CandleSeries import CandleSeries
+
+STEP = 60 * 60_000  # 1h
+START = 1_700_000_000_000 // STEP * STEP
+
+def candles(count: int) -> CandleSeries:
+    rng = np.random.default_rng(0)
+    closes = 30_000 + np.cumsum(rng.normal(size=count)) * 50
+    timestamps = START + STEP * np.arange(count)
+    return CandleSeries(timestamps, closes - 5, closes + 20, closes - 20, closes, rng.uniform(1, 10, count))
+
+@pytest.fixture(params=[np.float32, np.float64])
+def feature_dtype(request, monkeypatch):
+    monkeypatch.setattr(features, "FEATURE_DTYPE", request.param)
+    return np.dtype(request.param)
+
+def test_cache_stores_and_returns_feature_dtype(tmp_path, feature_dtype):
+    series = candles(200)
+    now_ms = int(series.timestamps[-1]) + STEP  # 모든 봉이 마감된 시점
+
+    timestamps, data = update_feature_cache("BTC", "1h", series, now_ms=now_ms, cache_dir=str(tmp_path))
+
+    assert data.dtype == feature_dtype
+    cache = FeatureCache("BTC", "1h", str(tmp_path))
+    assert os.path.getsize(cache.features_path) == len(data) * len(FEATURE_COLUMNS) * feature_dtype.itemsize
+    with open(cache.meta_path) as f:
+        assert json.load(f)["dtype"] == feature_dtype.name
+
+    # 같은 dtype 으로 계산한 캐시 없는 결과와 같다 (지표 계산은 float64)
+    expected_ts, expected = build_features(series)
+    np.testing.assert_array_equal(timestamps, expected_ts)
+    np.testing.assert_array_equal(data, expected)
+
+def test_appended_rows_keep_dtype(tmp_path, feature_dtype):
+    series = candles(300)
+    update_feature_cache("BTC", "1h", series[:200], now_ms=int(series.timestamps[199]) + STEP,
+                         cache_dir=str(tmp_path))
+
+    # 마지막 봉은 아직 마감 전 → 캐시에는 넣지 않고 결과에만 덧붙인다
+    timestamps, data = update_feature_cache("BTC", "1h", series, now_ms=int(series.timestamps[-1]) + 1,
+                                            cache_dir=str(tmp_path))
+
+    assert data.dtype == feature_dtype
+    _, expected = build_features(series)
+    np.testing.assert_allclose(data, expected, rtol=1e-5)
+
+def test_switching_dtype_rebuilds_the_cache(tmp_path, monkeypatch):
+    series = candles(200)
+    now_ms = int(series.timestamps[-1]) + STEP
+    update_feature_cache("BTC", "1h", series, now_ms=now_ms, cache_dir=str(tmp_path))  # float64
+
+    monkeypatch.setattr(features, "FEATURE_DTYPE", np.float32)
+    _, data = update_feature_cache("BTC", "1h", series, now_ms=now_ms, cache_dir=str(tmp_path))
+
+    assert data.dtype == np.float32
+    cache_dir = os.path.join(str(tmp_path), "BTC_1h")
+    assert sorted(name for name in os.listdir(cache_dir) if name.startswith("features")) == ["features.f4"]
+
+def test_legacy_cache_without_dtype_is_read_as_float64(tmp_path):
+    cache = FeatureCache("BTC", "1h", str(tmp_path), dtype=np.float64)
+    cache.write(np.array([START]), np.ones((1, len(FEATURE_COLUMNS))))
+    with open(cache.meta_path) as f:
+        meta = json.load(f)
+    del meta["dtype"]
+    with open(cache.meta_path, "w") as f:
+        json.dump(meta, f)
+
+    assert len(FeatureCache("BTC", "1h", str(tmp_path), dtype=np.float64).read()[0]) == 1
+    assert len(FeatureCache("BTC", "1h", str(tmp_path), dtype=np.float32).read()[0]) == 0
+
+def test_longer_history_after_short_seed_rebuilds_leading_rows(tmp_path):
+    # 예측 서버가 짧은 이력으로 캐시를 먼저 만든 뒤 학습 스크립트가 긴 이력으로 불러오는 경우
+    series = candles(1000)
+    now_ms = int(series.timestamps[-1]) + STEP
+    _, short = update_feature_cache("BTC", "1h", series[-200:], now_ms=now_ms, cache_dir=str(tmp_path))
+
+    timestamps, data = update_feature_cache("BTC", "1h", series, now_ms=now_ms, cache_dir=str(tmp_path))
+
+    expected_ts, expected = build_features(series)
+    assert len(short) == 175 and len(data) == 975
+    np.testing.assert_array_equal(timestamps, expected_ts)
+    np.testing.assert_array_equal(data, expected)
+
+    # 다시 짧은 이력으로 불러도 캐시를 줄이지 않고 그 기간의 행만 돌려준다
+    short_ts, _ = update_feature_cache("BTC", "1h", series[-200:], now_ms=now_ms, cache_dir=str(tmp_path))
+    assert short_ts[0] == series.timestamps[-200]
+    assert len(FeatureCache("BTC", "1h", str(tmp_path)).read()[0]) == 975
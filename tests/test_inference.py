@@ -0,0 +1,48 @@
+# tests/test_inference.py
+# predict_symbols 의 forward pass 묶음 (심볼별 모델 vs model_symbol 공유 모델)
+import numpy as np
+import pytest
+import inference
+from features import FEATURE_COLUMNS
+from inference import SEQUENCE_LENGTH, predict_symbols
+
+class CountingModel:
+    def __init__(self):
+        self.batches = []
+
+    def predict_on_batch(self, x):
+        self.batches.append(len(x))
+        return np.full((len(x), 4), 0.5, dtype=np.float32)
+
+class FakeRegistry:
+    # 심볼마다 자기 모델 파일이 있는 레지스트리
+    def __init__(self, symbols):
+        self.models = {s: CountingModel() for s in symbols}
+
+    def latest(self, symbol, interval):
+        return {"file": f"{interval}_{symbol.upper()}.keras"} if symbol.upper() in self.models else None
+
+    def load(self, symbol, interval, backend=None):
+        return self.models[symbol.upper()]
+
+SYMBOLS = ["BTC", "ETH", "SOL"]
+
+@pytest.fixture
+def registry(monkeypatch):
+    rng = np.random.default_rng(0)
+    monkeypatch.setattr(inference, "load_features", lambda symbol, interval: (
+        None, rng.random((SEQUENCE_LENGTH + 5, len(FEATURE_COLUMNS)))))
+    return FakeRegistry(SYMBOLS)
+
+def test_per_symbol_models_run_one_pass_each(registry):
+    results = predict_symbols(SYMBOLS, "1h", registry=registry)
+
+    assert all(results[s] is not None for s in SYMBOLS)
+    assert [m.batches for m in registry.models.values()] == [[1], [1], [1]]
+
+def test_model_symbol_batches_all_symbols_into_one_pass(registry):
+    results = predict_symbols([s.lower() for s in SYMBOLS], "1h", model_symbol="BTC", registry=registry)
+
+    assert all(results[s] is not None for s in SYMBOLS)
+    assert registry.models["BTC"].batches == [len(SYMBOLS)]
+    assert registry.models["ETH"].batches == registry.models["SOL"].batches == []
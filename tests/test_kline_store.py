@@ -0,0 +1,63 @@
+# tests/test_kline_store.py
+# KlineStore.sync 의 최근 initial_limit 개 구간 채우기 (로컬 대역 서버)
+import numpy as np
+from model.CandleSeries import CandleSeries
+from services.BinanceService import BinanceService
+from services.KlineStore import KlineStore, older_range
+from mock_exchange import NOW_MS
+
+STEP = 60_000  # 1m
+SYNC_NOW = NOW_MS + STEP  # 마지막 마감 봉 = NOW_MS
+
+def test_short_seed_is_backfilled_to_initial_limit(tmp_path, exchange):
+    store = KlineStore(str(tmp_path))
+    binance = BinanceService(base_url=exchange.base_url)
+
+    assert store.sync("BTC", "1m", binance, initial_limit=200, now_ms=SYNC_NOW) == 200
+    assert store.sync("BTC", "1m", binance, initial_limit=1000, now_ms=SYNC_NOW) == 800
+
+    series = store.load("BTC", "1m").tail(1000)
+    assert len(series) == 1000
+    np.testing.assert_array_equal(series.timestamps, NOW_MS - STEP * np.arange(999, -1, -1))
+
+    # 이미 덮고 있으면 더 요청하지 않는다
+    requests = len(exchange.requests)
+    assert store.sync("BTC", "1m", binance, initial_limit=1000, now_ms=SYNC_NOW) == 0
+    assert len(exchange.requests) == requests
+
+def test_backfill_and_new_candles_in_one_sync(tmp_path, exchange):
+    store = KlineStore(str(tmp_path))
+    binance = BinanceService(base_url=exchange.base_url)
+    store.sync("BTC", "1m", binance, initial_limit=200, now_ms=SYNC_NOW - 10 * STEP)
+
+    assert store.sync("BTC", "1m", binance, initial_limit=1500, now_ms=SYNC_NOW) == 1300
+
+    timestamps = store.load("BTC", "1m").timestamps
+    np.testing.assert_array_equal(timestamps, NOW_MS - STEP * np.arange(1499, -1, -1))
+
+def test_young_symbol_without_older_candles(tmp_path, exchange):
+    # 상장된 지 얼마 안 된 심볼: 앞쪽 구간을 요청해도 받을 봉이 없다
+    exchange.missing = set((NOW_MS - STEP * np.arange(300, 1000)).tolist())
+    store = KlineStore(str(tmp_path))
+    binance = BinanceService(base_url=exchange.base_url)
+
+    assert store.sync("BTC", "1m", binance, initial_limit=1000, now_ms=SYNC_NOW) == 300
+    assert store.sync("BTC", "1m", binance, initial_limit=1000, now_ms=SYNC_NOW) == 0
+    assert store.count("BTC", "1m") == 300
+
+def test_prepend_keeps_only_older_candles(tmp_path):
+    store = KlineStore(str(tmp_path))
+    closes = np.arange(10, dtype=np.float64)
+    timestamps = STEP * np.arange(10)
+    store.append("BTC", "1m", CandleSeries(timestamps[5:], *[closes[5:]] * 5))
+
+    assert store.prepend("BTC", "1m", CandleSeries(timestamps[:7], *[closes[:7]] * 5)) == 5
+
+    series = store.load("BTC", "1m")
+    np.testing.assert_array_equal(series.timestamps, timestamps)
+    np.testing.assert_array_equal(series.closes, closes)
+
+def test_older_range():
+    assert older_range(None, "1m", SYNC_NOW, 10) is None
+    assert older_range(NOW_MS - 9 * STEP, "1m", SYNC_NOW, 10) is None
+    assert older_range(NOW_MS - 5 * STEP, "1m", SYNC_NOW, 10) == (NOW_MS - 9 * STEP, NOW_MS - 6 * STEP)
@@ -0,0 +1,22 @@
+# tests/test_predict_server.py
+# 예측 서버가 짧은 이력으로 저장소 / 피처 캐시를 먼저 채워도 학습 스크립트의 긴 이력이 줄지 않는지
+import time
+import numpy as np
+from features import LOOKBACK, load_features
+from predict_server import FEATURE_CANDLES
+from services.BinanceService import BinanceService
+from services.KlineStore import KlineStore
+
+def test_server_seed_does_not_shorten_training_history(tmp_path, monkeypatch, exchange):
+    monkeypatch.chdir(tmp_path)  # data/features 캐시를 임시 디렉터리에 만든다
+    exchange.now_ms = int(time.time() * 1000)
+    binance, store = BinanceService(base_url=exchange.base_url), KlineStore(str(tmp_path / "klines"))
+
+    # 예측 서버의 _refresh 와 같은 호출 → 학습 스크립트의 기본 호출
+    _, seeded = load_features("BTC", "1d", FEATURE_CANDLES, binance, store)
+    timestamps, data = load_features("BTC", "1d", binance=binance, store=store)
+
+    assert len(seeded) == FEATURE_CANDLES - (LOOKBACK - 1)
+    assert store.count("BTC", "1d") == 1000
+    assert len(data) == 1000 - (LOOKBACK - 1)
+    assert np.all(np.diff(timestamps) == 24 * 60 * 60_000)
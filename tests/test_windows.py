@@ -0,0 +1,27 @@
+# tests/test_windows.py
+# make_windows 의 윈도우 / 타깃 shape (짧은 시계열 포함)
+import numpy as np
+import pytest
+from windows import make_windows, window_count
+
+SEQ_LEN = 5
+
+@pytest.mark.parametrize("target_columns, n_targets", [(slice(0, 4), 4), ([0, 3], 2), (slice(None), 6)])
+@pytest.mark.parametrize("rows", [0, SEQ_LEN, SEQ_LEN + 1, SEQ_LEN + 10])
+def test_target_rank_is_the_same_for_short_series(rows, target_columns, n_targets):
+    data = np.arange(rows * 6, dtype=np.float32).reshape(rows, 6)
+
+    X, y = make_windows(data, SEQ_LEN, target_columns=target_columns)
+
+    count = window_count(rows, SEQ_LEN)
+    assert X.shape == (count, SEQ_LEN, 6)
+    assert y.shape == (count, n_targets)
+    assert X.dtype == y.dtype == np.float32
+
+def test_windows_align_with_targets():
+    data = np.arange(20 * 6, dtype=np.float64).reshape(20, 6)
+
+    X, y = make_windows(data, SEQ_LEN)
+
+    np.testing.assert_array_equal(X[3], data[3:3 + SEQ_LEN])
+    np.testing.assert_array_equal(y[3], data[3 + SEQ_LEN + 1, :4])
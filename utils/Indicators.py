@@ -1,4 +1,5 @@
 # utils/indicators.py
+import numpy as np
 
 def calculate_sma(prices: list[float], period: int) -> float:
     if len(prices) < period:
@@ -71,13 +72,100 @@ def calculate_macd(prices: list[float], short: int = 12, long: int = 26) -> floa
 def calculate_maci(prices: list[float], short: int = 12, long: int = 26, signal: int = 9) -> float:
     if len(prices) < long + signal:
         return -1
+    _, _, histogram = calculate_macd_lines(prices, short, long, signal)
+    return float(histogram[-1])  # MACI = MACD - Signal
 
-    macd_line = []
-    for i in range(long, len(prices)):
-        short_ema = calculate_ema(prices[:i+1], short)
-        long_ema = calculate_ema(prices[:i+1], long)
-        macd = short_ema - long_ema
-        macd_line.append(macd)
+# === 전체 시계열(Series) 지표 계산 ===
+# 위의 함수들은 마지막 봉 하나의 값만 돌려주기 때문에, 모든 봉에 대해 호출하면 O(n²)이 된다.
+# 아래 함수들은 OHLCV 배열을 받아 입력과 같은 길이로 정렬된 지표 컬럼을 한 번에 계산한다.
+# 값이 정의되지 않는 앞부분(기간 부족)은 np.nan 으로 채운다.
+# i 번째 값은 위의 calculate_* 함수에 prices[:i + 1] 을 넣은 결과와 같다.
 
-    signal_ema = calculate_ema(macd_line, signal)
-    return macd_line[-1] - signal_ema  # MACI = MACD - Signal
\ No newline at end of file
+def _as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+def _pad_front(values: np.ndarray, length: int) -> np.ndarray:
+    out = np.full(length, np.nan)
+    if len(values):
+        out[length - len(values):] = values
+    return out
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    if len(values) < window:
+        return np.empty(0)
+    return np.convolve(values, np.ones(window), mode="valid")
+
+def calculate_sma_series(prices, period: int) -> np.ndarray:
+    prices = _as_array(prices)
+    return _pad_front(_rolling_sum(prices, period) / period, len(prices))
+
+def calculate_ema_series(prices, period: int) -> np.ndarray:
+    # calculate_ema 는 최근 period 개 구간에서만 EMA 를 돌리므로, 고정 가중치 커널과의 합성곱과 같다.
+    prices = _as_array(prices)
+    if len(prices) < period:
+        return np.full(len(prices), np.nan)
+    k = 2 / (period + 1)
+    kernel = k * (1 - k) ** np.arange(period)
+    kernel[-1] = (1 - k) ** (period - 1)
+    return _pad_front(np.convolve(prices, kernel, mode="valid"), len(prices))
+
+def calculate_rsi_series(prices, period: int = 14) -> np.ndarray:
+    prices = _as_array(prices)
+    diffs = np.diff(prices)
+    gains = _rolling_sum(np.where(diffs > 0, diffs, 0.0), period)
+    losses = _rolling_sum(np.where(diffs < 0, -diffs, 0.0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(losses == 0, 100.0, 100 - (100 / (1 + gains / losses)))
+    return _pad_front(rsi, len(prices))
+
+def calculate_macd_series(prices, short: int = 12, long: int = 26) -> np.ndarray:
+    return calculate_ema_series(prices, short) - calculate_ema_series(prices, long)
+
+def calculate_atr_series(highs, lows, closes, period: int = 14) -> np.ndarray:
+    highs, lows, closes = _as_array(highs), _as_array(lows), _as_array(closes)
+    prev_closes = closes[:-1]
+    trs = np.maximum.reduce([
+        highs[1:] - lows[1:],
+        np.abs(highs[1:] - prev_closes),
+        np.abs(lows[1:] - prev_closes),
+    ])
+    return _pad_front(_rolling_sum(trs, period) / period, len(closes))
+
+def calculate_obv_series(closes, volumes) -> np.ndarray:
+    closes, volumes = _as_array(closes), _as_array(volumes)
+    if len(closes) == 0:
+        return np.empty(0)
+    signed = np.sign(np.diff(closes)) * volumes[1:]
+    return np.concatenate(([0.0], np.cumsum(signed)))
+
+def calculate_vwap_series(prices, volumes) -> np.ndarray:
+    prices, volumes = _as_array(prices), _as_array(volumes)
+    total_pv = np.cumsum(prices * volumes)
+    total_volume = np.cumsum(volumes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total_volume != 0, total_pv / total_volume, np.nan)
+
+# === MACD / Signal / Histogram (재귀 EMA) ===
+# 첫 period 개의 단순평균으로 시작해 EMA 를 한 번의 재귀로 끝까지 계산한다.
+# MACD 선은 단기/장기 EMA 의 차이, Signal 은 MACD 선의 EMA, Histogram(MACI)은 그 차이다.
+
+def calculate_ema_recursive_series(prices, period: int) -> np.ndarray:
+    prices = _as_array(prices)
+    out = np.full(len(prices), np.nan)
+    valid = np.flatnonzero(~np.isnan(prices))
+    if len(valid) < period:
+        return out
+    start = valid[0]
+    k = 2 / (period + 1)
+    ema = prices[start:start + period].mean()
+    out[start + period - 1] = ema
+    for i, price in enumerate(prices[start + period:].tolist(), start + period):
+        ema = price * k + ema * (1 - k)
+        out[i] = ema
+    return out
+
+def calculate_macd_lines(prices, short: int = 12, long: int = 26,
+                         signal: int = 9) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    macd_line = calculate_ema_recursive_series(prices, short) - calculate_ema_recursive_series(prices, long)
+    signal_line = calculate_ema_recursive_series(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
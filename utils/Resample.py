@@ -0,0 +1,102 @@
+# utils/Resample.py
+# 1분봉 CandleSeries 를 상위 구간(15m / 1h / 4h / 1d / 2h / 12h ...)으로 벡터화 집계한다.
+# 구간 집계: 첫 open, 최대 high, 최소 low, 마지막 close, volume 합계
+import numpy as np
+from model.CandleSeries import CandleSeries
+from utils.Intervals import interval_to_ms
+
+# Binance 주봉은 월요일 00:00 UTC 에 시작한다 (1970-01-01 은 목요일)
+_BUCKET_OFFSET_MS = {"1w": 4 * 24 * 60 * 60_000}
+
+def bucket_starts(timestamps: np.ndarray, interval: str) -> np.ndarray:
+    step = interval_to_ms(interval)
+    offset = _BUCKET_OFFSET_MS.get(interval, 0)
+    return (np.asarray(timestamps, dtype=np.int64) - offset) // step * step + offset
+
+def read_candle_csv(path: str) -> CandleSeries:
+    # timestamp, open, high, low, close, volume (헤더 없음) 형식의 CSV
+    values = np.loadtxt(path, delimiter=",", ndmin=2)
+    if values.size == 0:
+        return CandleSeries.empty()
+    return CandleSeries(values[:, 0].astype(np.int64), *values[:, 1:6].T)
+
+def _aggregate(series: CandleSeries, interval: str) -> CandleSeries:
+    # 버킷별 집계 (부분 버킷 포함). series 는 open_time 오름차순이어야 한다.
+    if len(series) == 0:
+        return CandleSeries.empty()
+    buckets = bucket_starts(series.timestamps, interval)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    ends = np.concatenate((starts[1:], [len(series)])) - 1
+    return CandleSeries(
+        buckets[starts],
+        series.opens[starts],
+        np.maximum.reduceat(series.highs, starts),
+        np.minimum.reduceat(series.lows, starts),
+        series.closes[ends],
+        np.add.reduceat(series.volumes, starts),
+    )
+
+def resample(series: CandleSeries, interval: str, source_interval: str = "1m",
+             include_partial: bool = False) -> CandleSeries:
+    # include_partial=False 면 데이터가 버킷 중간에서 시작하거나 끝나는 앞/뒤 버킷은 버린다
+    bars = _aggregate(series, interval)
+    if include_partial or len(bars) == 0:
+        return bars
+
+    step = interval_to_ms(interval)
+    first = 1 if series.timestamps[0] > bars.timestamps[0] else 0
+    last_complete = series.timestamps[-1] + interval_to_ms(source_interval) >= bars.timestamps[-1] + step
+    stop = len(bars) if last_complete else len(bars) - 1
+    return bars[first:max(first, stop)]
+
+class Resampler:
+    # 1분봉이 들어올 때마다 새로 완성된 상위 구간 봉만 돌려주는 증분 집계기
+    def __init__(self, interval: str, source_interval: str = "1m"):
+        self.interval = interval
+        self.source_interval = source_interval
+        self._step = interval_to_ms(interval)
+        self._source_step = interval_to_ms(source_interval)
+        self._partial: CandleSeries | None = None  # 아직 끝나지 않은 마지막 버킷 (길이 1)
+        self._started = False
+
+    @property
+    def partial(self) -> CandleSeries | None:
+        return self._partial
+
+    def update(self, series: CandleSeries) -> CandleSeries:
+        if len(series) == 0:
+            return CandleSeries.empty()
+        bars = _aggregate(series, self.interval)
+        completed = []
+
+        if not self._started:
+            self._started = True
+            if series.timestamps[0] > bars.timestamps[0]:
+                # 버킷 중간에서 시작한 첫 봉은 open 을 알 수 없으므로 버린다
+                bars = bars[1:]
+                if len(bars) == 0:
+                    return CandleSeries.empty()
+        elif self._partial is not None:
+            if bars.timestamps[0] == self._partial.timestamps[0]:
+                # 이전 부분 봉에 이어 붙인다
+                merged = CandleSeries(
+                    bars.timestamps[:1],
+                    self._partial.opens,
+                    np.maximum(self._partial.highs, bars.highs[:1]),
+                    np.minimum(self._partial.lows, bars.lows[:1]),
+                    bars.closes[:1],
+                    self._partial.volumes + bars.volumes[:1],
+                )
+                bars = CandleSeries.concat([merged, bars[1:]])
+            else:
+                # 데이터 공백으로 버킷이 바뀌었으면 이전 부분 봉은 그대로 완성 처리한다
+                completed.append(self._partial)
+
+        last_complete = series.timestamps[-1] + self._source_step >= bars.timestamps[-1] + self._step
+        if last_complete:
+            completed.append(bars)
+            self._partial = None
+        else:
+            completed.append(bars[:-1])
+            self._partial = bars[-1:]
+        return CandleSeries.concat(completed)
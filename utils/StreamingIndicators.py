@@ -0,0 +1,250 @@
+# utils/StreamingIndicators.py
+# utils/Indicators.py 의 calculate_* 함수들에 대응하는 상태 기반(streaming) 지표.
+# 새로 마감된 캔들마다 update(candle) 을 호출하면 봉 하나당 상수 시간만 든다.
+# value 는 지금까지 받은 캔들 전체로 calculate_* 를 호출한 결과와 같다 (데이터 부족 시 -1).
+# snapshot() 은 JSON 으로 저장 가능한 dict 를 돌려주고, restore() 로 그대로 되돌릴 수 있다.
+from collections import deque
+
+
+def _close_of(candle) -> float:
+    # CandleData 뿐 아니라 가격(float) 자체도 받을 수 있게 한다
+    return float(getattr(candle, "close", candle))
+
+
+class _RollingSum:
+    # 고정 길이 구간의 합계. 부동소수 누적 오차를 막기 위해 window 번마다 합계를 다시 계산한다.
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+        self.nonzero = 0
+        self._pushes = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.window
+
+    def push(self, value: float):
+        if self.full:
+            oldest = self.values[0]
+            self.total -= oldest
+            if oldest != 0:
+                self.nonzero -= 1
+        self.values.append(value)
+        self.total += value
+        if value != 0:
+            self.nonzero += 1
+        self._pushes += 1
+        if self._pushes % self.window == 0:
+            self.total = sum(self.values)
+
+    def snapshot(self) -> list[float]:
+        return list(self.values)
+
+    def restore(self, values: list[float]):
+        self.values = deque(values, maxlen=self.window)
+        self.total = sum(self.values)
+        self.nonzero = sum(1 for v in self.values if v != 0)
+        self._pushes = 0
+
+
+class StreamingSMA:
+    def __init__(self, period: int):
+        self.period = period
+        self._window = _RollingSum(period)
+
+    def update(self, candle):
+        self._window.push(_close_of(candle))
+
+    @property
+    def value(self) -> float:
+        if not self._window.full:
+            return -1
+        return self._window.total / self.period
+
+    def snapshot(self) -> dict:
+        return {"period": self.period, "window": self._window.snapshot()}
+
+    def restore(self, state: dict):
+        self.period = state["period"]
+        self._window = _RollingSum(self.period)
+        self._window.restore(state["window"])
+
+
+class StreamingEMA:
+    # calculate_ema 는 최근 period 개 가격에 대해서만 EMA 를 돌린다.
+    # 구간이 한 칸 밀릴 때의 변화량은 k·x_i + (1-k)·E_(i-1) + (1-k)^p·(x_(i-p+1) - x_(i-p)) 로 닫힌 형태다.
+    def __init__(self, period: int):
+        self.period = period
+        self._k = 2 / (period + 1)
+        self._prices = deque(maxlen=period + 1)
+        self._ema = None
+
+    def update(self, candle):
+        price = _close_of(candle)
+        self._prices.append(price)
+        if len(self._prices) < self.period:
+            return
+        if self._ema is None:
+            ema = self._prices[-self.period]
+            for p in list(self._prices)[-self.period + 1:]:
+                ema = p * self._k + ema * (1 - self._k)
+            self._ema = ema
+            return
+        decay = (1 - self._k) ** self.period
+        self._ema = (price * self._k + self._ema * (1 - self._k)
+                     + decay * (self._prices[1] - self._prices[0]))
+
+    @property
+    def value(self) -> float:
+        return -1 if self._ema is None else self._ema
+
+    def snapshot(self) -> dict:
+        return {"period": self.period, "prices": list(self._prices), "ema": self._ema}
+
+    def restore(self, state: dict):
+        self.__init__(state["period"])
+        self._prices.extend(state["prices"])
+        self._ema = state["ema"]
+
+
+class StreamingRSI:
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gains = _RollingSum(period)
+        self._losses = _RollingSum(period)
+        self._prev_close = None
+
+    def update(self, candle):
+        close = _close_of(candle)
+        if self._prev_close is not None:
+            diff = close - self._prev_close
+            self._gains.push(diff if diff > 0 else 0.0)
+            self._losses.push(-diff if diff < 0 else 0.0)
+        self._prev_close = close
+
+    @property
+    def value(self) -> float:
+        if not self._losses.full:
+            return -1
+        if self._losses.nonzero == 0:
+            return 100.0
+        rs = self._gains.total / self._losses.total
+        return 100 - (100 / (1 + rs))
+
+    def snapshot(self) -> dict:
+        return {
+            "period": self.period,
+            "gains": self._gains.snapshot(),
+            "losses": self._losses.snapshot(),
+            "prev_close": self._prev_close,
+        }
+
+    def restore(self, state: dict):
+        self.__init__(state["period"])
+        self._gains.restore(state["gains"])
+        self._losses.restore(state["losses"])
+        self._prev_close = state["prev_close"]
+
+
+class StreamingATR:
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._trs = _RollingSum(period)
+        self._prev_close = None
+
+    def update(self, candle):
+        if self._prev_close is not None:
+            high, low, prev_close = candle.high, candle.low, self._prev_close
+            self._trs.push(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+        self._prev_close = candle.close
+
+    @property
+    def value(self) -> float:
+        if not self._trs.full:
+            return -1
+        return self._trs.total / self.period
+
+    def snapshot(self) -> dict:
+        return {"period": self.period, "trs": self._trs.snapshot(), "prev_close": self._prev_close}
+
+    def restore(self, state: dict):
+        self.__init__(state["period"])
+        self._trs.restore(state["trs"])
+        self._prev_close = state["prev_close"]
+
+
+class StreamingOBV:
+    def __init__(self):
+        self._obv = 0.0
+        self._prev_close = None
+
+    def update(self, candle):
+        if self._prev_close is not None:
+            if candle.close > self._prev_close:
+                self._obv += candle.volume
+            elif candle.close < self._prev_close:
+                self._obv -= candle.volume
+        self._prev_close = candle.close
+
+    @property
+    def value(self) -> float:
+        return -1 if self._prev_close is None else self._obv
+
+    def snapshot(self) -> dict:
+        return {"obv": self._obv, "prev_close": self._prev_close}
+
+    def restore(self, state: dict):
+        self._obv = state["obv"]
+        self._prev_close = state["prev_close"]
+
+
+class StreamingMACD:
+    def __init__(self, short: int = 12, long: int = 26):
+        self.short = short
+        self.long = long
+        self._short_ema = StreamingEMA(short)
+        self._long_ema = StreamingEMA(long)
+
+    def update(self, candle):
+        self._short_ema.update(candle)
+        self._long_ema.update(candle)
+
+    @property
+    def value(self) -> float:
+        if self._long_ema.value == -1:
+            return -1
+        return self._short_ema.value - self._long_ema.value
+
+    def snapshot(self) -> dict:
+        return {
+            "short": self._short_ema.snapshot(),
+            "long": self._long_ema.snapshot(),
+        }
+
+    def restore(self, state: dict):
+        self._short_ema.restore(state["short"])
+        self._long_ema.restore(state["long"])
+        self.short = self._short_ema.period
+        self.long = self._long_ema.period
+
+
+class StreamingVWAP:
+    def __init__(self):
+        self._total_pv = 0.0
+        self._total_volume = 0.0
+
+    def update(self, candle):
+        self._total_pv += candle.close * candle.volume
+        self._total_volume += candle.volume
+
+    @property
+    def value(self) -> float:
+        return self._total_pv / self._total_volume if self._total_volume != 0 else -1
+
+    def snapshot(self) -> dict:
+        return {"total_pv": self._total_pv, "total_volume": self._total_volume}
+
+    def restore(self, state: dict):
+        self._total_pv = state["total_pv"]
+        self._total_volume = state["total_volume"]